@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import List, Dict
+from config import ANALYSIS_STATE_DIR
+
+
+class AnalysisStateStore:
+    """
+    증분 분석을 위한 회사별 이전 실행 상태 저장소
+
+    회사별로 이미 처리한 뉴스의 중대성 점수와 요약, 직전 상위 뉴스 목록,
+    종합 요약을 JSON 파일로 보관합니다.
+    """
+
+    def __init__(self, state_dir: str = ANALYSIS_STATE_DIR):
+        self.state_dir = state_dir
+        self._lock = threading.Lock()
+
+    def _path(self, company: str) -> str:
+        """회사명에 해당하는 상태 파일 경로"""
+        digest = hashlib.sha256(company.strip().lower().encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.state_dir, f"{digest}.json")
+
+    def load(self, company: str) -> Dict:
+        """
+        회사의 이전 실행 상태를 불러옵니다.
+
+        Args:
+            company (str): 회사명
+
+        Returns:
+            Dict: 이전 상태 (없으면 빈 상태)
+        """
+        empty = {'articles': {}, 'top_urls': [], 'overall_summary': ""}
+
+        try:
+            with open(self._path(company), encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return empty
+        except Exception as e:
+            print(f"분석 상태 로드 중 오류: {e}")
+            return empty
+
+        for key, value in empty.items():
+            state.setdefault(key, value)
+        return state
+
+    def save(self, company: str, news_list: List[Dict], top_urls: List[str], overall_summary: str):
+        """
+        이번 실행 결과를 다음 증분 분석을 위해 저장합니다.
+
+        검색 기간을 벗어나 더 이상 검색되지 않는 뉴스는 상태에서 제외됩니다.
+
+        Args:
+            company (str): 회사명
+            news_list (List[Dict]): 이번 실행에서 처리한 뉴스 리스트
+            top_urls (List[str]): 종합 요약에 사용된 상위 뉴스 URL 목록
+            overall_summary (str): 종합 요약
+        """
+        articles = {}
+        for news in news_list:
+            if not news.get('url'):
+                continue
+            # 폴백으로 채운 점수와 요약은 저장하지 않아 다음 실행에서 LLM으로 다시 평가
+            degraded = news.get('degraded') or ()
+            articles[news['url']] = {
+                'impact_score': None if 'impact' in degraded else news.get('impact_score'),
+                'summary': None if 'summary' in degraded else news.get('summary'),
+                'seen_at': time.time()
+            }
+
+        state = {
+            'company': company,
+            'articles': articles,
+            'top_urls': top_urls,
+            'overall_summary': overall_summary
+        }
+
+        path = self._path(company)
+        tmp_path = f"{path}.tmp"
+        try:
+            with self._lock:
+                # 저장할 때 처음으로 디렉터리를 만들어 증분 분석을 쓰지 않으면 디렉터리가 생기지 않음
+                os.makedirs(self.state_dir, exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"분석 상태 저장 중 오류: {e}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+오프라인 파이프라인 벤치마크
+
+로컬 스텁 서버(NewsAPI, RSS, 기사 HTML, OpenAI 호환 API)를 띄우고
+search_and_summarize 전체 파이프라인을 코퍼스 크기별로 반복 실행하여
+처리량, p50/p99 지연, LLM 호출 수를 측정합니다.
+
+결과는 benchmarks/results/ 아래에 JSON으로 저장되며, 직전 결과(또는 --baseline)와
+비교하여 p50 지연이 허용 범위를 넘게 늘어난 크기를 회귀로 표시합니다.
+
+사용법:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --sizes 10,100 --repeat 3 --llm-latency-ms 50
+    python benchmarks/bench_pipeline.py --llm-failure-rate 0.2 --fail-on-regression
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from corpus import build_corpus
+from stub_servers import StubState, start_stub_server
+
+
+def percentile(values, pct: float) -> float:
+    """최근접 순위 방식의 백분위수"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def git_revision() -> str:
+    """현재 커밋 해시 (git이 없으면 빈 문자열)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def run_size(size: int, args, state: StubState, base_url: str) -> dict:
+    """코퍼스 크기 하나에 대해 파이프라인을 반복 실행합니다."""
+    from stock_news_chatbot import StockNewsChatbot
+    from metrics import METRICS
+
+    state.corpus = build_corpus(size, args.company, base_url, feed_count=args.feeds)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        chatbot = StockNewsChatbot()
+
+    searcher = chatbot.news_searcher
+    searcher.news_api_key = 'benchmark'
+    searcher.news_api_url = f"{base_url}/v2/everything"
+    searcher.rss_feeds = [f"{base_url}/rss/{i}.xml" for i in range(args.feeds)]
+    # 반복마다 피드를 새로 받아 수집 비용까지 측정
+    searcher.feed_cache_ttl = 0
+
+    METRICS.reset()
+    state.reset_counters()
+
+    latencies = []
+    result = None
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = chatbot.search_and_summarize(args.company, use_cache=False, streaming=args.streaming,
+                                                  deadline=args.deadline)
+        latencies.append(time.perf_counter() - started)
+
+    client_llm_calls = sum(
+        c['value'] for c in METRICS.snapshot()['counters'] if c['name'] == 'llm_calls_total'
+    )
+    mean_latency = statistics.mean(latencies)
+
+    return {
+        'size': size,
+        'repeat': args.repeat,
+        'processed_news': result['total_news'],
+        'p50_seconds': round(percentile(latencies, 50), 4),
+        'p99_seconds': round(percentile(latencies, 99), 4),
+        'mean_seconds': round(mean_latency, 4),
+        'runs_per_second': round(1.0 / mean_latency, 3) if mean_latency else None,
+        'candidates_per_second': round(size / mean_latency, 1) if mean_latency else None,
+        'llm_requests_per_run': round(state.llm_calls / args.repeat, 1),
+        'llm_failures_per_run': round(state.llm_failures / args.repeat, 1),
+        'llm_successful_calls_per_run': round(client_llm_calls / args.repeat, 1),
+        'degraded': result.get('degraded', {}),
+        'llm_routing': result.get('llm_routing', {}),
+        'stages': result.get('timings', {}).get('stages', {})
+    }
+
+
+def load_previous(results_dir: str, baseline: str = None):
+    """비교 대상 결과 파일을 불러옵니다."""
+    if baseline:
+        path = baseline
+    else:
+        candidates = sorted(glob.glob(os.path.join(results_dir, 'bench_*.json')))
+        if not candidates:
+            return None, None
+        path = candidates[-1]
+
+    with open(path, encoding='utf-8') as f:
+        return path, json.load(f)
+
+
+def compare(current: list, previous: dict, tolerance: float) -> list:
+    """크기별 p50 지연을 이전 결과와 비교합니다."""
+    previous_by_size = {r['size']: r for r in previous.get('results', [])}
+    regressions = []
+
+    for row in current:
+        before = previous_by_size.get(row['size'])
+        if not before or not before['p50_seconds']:
+            continue
+        change = (row['p50_seconds'] - before['p50_seconds']) / before['p50_seconds']
+        flag = ""
+        if change > tolerance:
+            flag = "  <-- 회귀"
+            regressions.append(row['size'])
+        print(f"  {row['size']:>6}개: p50 {before['p50_seconds']:.3f}s -> {row['p50_seconds']:.3f}s ({change:+.1%}){flag}")
+
+    return regressions
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="오프라인 파이프라인 벤치마크")
+    parser.add_argument('--sizes', default='10,100,1000,10000', help="코퍼스 크기 (쉼표 구분)")
+    parser.add_argument('--repeat', type=int, default=5, help="크기별 반복 횟수")
+    parser.add_argument('--company', default='Nvidia', help="분석할 회사명")
+    parser.add_argument('--feeds', type=int, default=8, help="RSS 피드 개수")
+    parser.add_argument('--llm-latency-ms', type=float, default=20.0, help="스텁 LLM 응답 지연 (밀리초)")
+    parser.add_argument('--llm-model-latency', default='',
+                        help="모델별 스텁 LLM 지연 (예: gpt-5=400,gpt-5-nano=30, 밀리초)")
+    parser.add_argument('--llm-failure-rate', type=float, default=0.0, help="스텁 LLM 실패 확률 (0-1)")
+    parser.add_argument('--streaming', action='store_true', help="스트리밍 상위 k개 모드로 실행")
+    parser.add_argument('--deadline', type=float, help="실행별 전체 시간 예산 (초)")
+    parser.add_argument('--results-dir', default=os.path.join(BENCH_DIR, 'results'), help="결과 저장 경로")
+    parser.add_argument('--baseline', help="비교할 결과 파일 (생략 시 직전 결과)")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="p50 회귀 허용 비율")
+    parser.add_argument('--fail-on-regression', action='store_true', help="회귀 발견 시 종료 코드 1")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+
+    model_latency = {}
+    for item in args.llm_model_latency.split(','):
+        if '=' in item:
+            model, latency = item.split('=', 1)
+            model_latency[model.strip()] = float(latency)
+
+    state = StubState(llm_latency_ms=args.llm_latency_ms, llm_failure_rate=args.llm_failure_rate,
+                      model_latency_ms=model_latency)
+    server, base_url = start_stub_server(state)
+
+    # 프로젝트 모듈을 import하기 전에 스텁 서버와 지연 설정을 환경 변수로 지정
+    os.environ['OPENAI_BASE_URL'] = f"{base_url}/v1"
+    os.environ['LLM_REQUEST_DELAY'] = '0'
+
+    print("오프라인 파이프라인 벤치마크")
+    print("-" * 30)
+    print(f"스텁 서버: {base_url} (LLM 지연 {args.llm_latency_ms:.0f}ms, 실패율 {args.llm_failure_rate:.0%})")
+
+    results = []
+    try:
+        for size in sizes:
+            row = run_size(size, args, state, base_url)
+            results.append(row)
+            print(f"  {size:>6}개: p50 {row['p50_seconds']:.3f}s, p99 {row['p99_seconds']:.3f}s, "
+                  f"{row['candidates_per_second']:.0f} 기사/초, LLM 요청 {row['llm_requests_per_run']:.0f}회/실행, "
+                  f"처리 {row['processed_news']}개")
+    finally:
+        server.shutdown()
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'settings': {
+            'repeat': args.repeat,
+            'company': args.company,
+            'feeds': args.feeds,
+            'llm_latency_ms': args.llm_latency_ms,
+            'llm_failure_rate': args.llm_failure_rate,
+            'llm_model_latency_ms': model_latency,
+            'streaming': args.streaming,
+            'deadline': args.deadline
+        },
+        'results': results
+    }
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    previous_path, previous = load_previous(args.results_dir, args.baseline)
+
+    output_path = os.path.join(args.results_dir, f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output_path}")
+
+    regressions = []
+    if previous is not None:
+        print(f"\n이전 결과와 비교: {previous_path}")
+        regressions = compare(results, previous, args.tolerance)
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+CLI 시작 시간 벤치마크
+
+새 프로세스에서 stock_news_chatbot을 import하고 StockNewsChatbot을 생성하는 데
+걸리는 시간을 측정합니다. 무거운 의존성(scikit-learn, numpy, BeautifulSoup,
+feedparser, openai, requests)이 시작 시점에 로드되거나 중앙값이 한도를 넘으면
+종료 코드 1을 반환하므로 회귀 검사용으로 사용할 수 있습니다.
+
+사용법:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --max-ms 150
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시점에 로드되면 안 되는 무거운 모듈
+HEAVY_MODULES = ['sklearn', 'numpy', 'bs4', 'feedparser', 'lxml', 'openai', 'requests']
+
+# 자식 프로세스에서 실행할 측정 코드
+PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import stock_news_chatbot
+import_done = time.perf_counter()
+stock_news_chatbot.StockNewsChatbot()
+init_done = time.perf_counter()
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{
+    'import_ms': (import_done - started) * 1000,
+    'init_ms': (init_done - import_done) * 1000,
+    'heavy_modules': loaded
+}}))
+"""
+
+
+def measure_once() -> dict:
+    """새 파이썬 프로세스에서 한 번 측정합니다."""
+    completed = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    # 챗봇 초기화 메시지 뒤의 마지막 줄이 측정 결과
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="CLI 시작 시간 벤치마크")
+    parser.add_argument('--runs', type=int, default=10, help="측정 횟수")
+    parser.add_argument('--max-ms', type=float, default=150.0, help="import + 초기화 중앙값 허용 한도 (밀리초)")
+    args = parser.parse_args()
+
+    samples = [measure_once() for _ in range(args.runs)]
+
+    import_ms = statistics.median(s['import_ms'] for s in samples)
+    init_ms = statistics.median(s['init_ms'] for s in samples)
+    total_ms = import_ms + init_ms
+    heavy_modules = sorted({name for s in samples for name in s['heavy_modules']})
+
+    print("CLI 시작 시간 벤치마크")
+    print("-" * 30)
+    print(f"측정 횟수: {args.runs}")
+    print(f"import 중앙값: {import_ms:.1f}ms")
+    print(f"초기화 중앙값: {init_ms:.1f}ms")
+    print(f"합계: {total_ms:.1f}ms (한도: {args.max_ms:.0f}ms)")
+
+    failed = False
+    if heavy_modules:
+        print(f"시작 시점에 로드된 무거운 모듈: {', '.join(heavy_modules)}")
+        failed = True
+    if total_ms > args.max_ms:
+        print("시작 시간이 한도를 초과했습니다.")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print("통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+벤치마크용 뉴스 코퍼스 생성기
+
+fixtures/ 아래의 기록된 NewsAPI 응답, RSS 피드, 기사 HTML을 템플릿으로 삼아
+원하는 크기의 결정적(seed 고정) 코퍼스를 만들고, 스텁 서버가 제공할
+NewsAPI JSON / RSS XML / 기사 HTML 응답 본문을 미리 렌더링합니다.
+"""
+
+import json
+import os
+import random
+import xml.etree.ElementTree as ET
+from email.utils import formatdate
+from typing import List, Dict
+from xml.sax.saxutils import escape
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# RSS 피드 채널 제목 (실제 피드의 출처명과 같은 분포)
+FEED_TITLES = [
+    'Reuters Business News', 'Bloomberg Markets', 'Yahoo Finance', 'BBC Business',
+    'CNN Business', 'MarketWatch Top Stories', '중앙일보', '동아일보'
+]
+
+# 제목 변형에 사용할 사건 유형 (중요도 키워드가 골고루 섞이도록)
+EVENT_PHRASES = [
+    'quarterly results beat estimates', 'announces acquisition', 'new product launch',
+    'CEO comments at conference', 'supply contract with customer', 'expands manufacturing facility',
+    'faces regulation review', 'market outlook from analysts', 'hiring plans for workforce',
+    'partnership announcement', 'patent dispute update', 'investment in R&D'
+]
+
+
+def load_fixture_articles() -> List[Dict]:
+    """기록된 NewsAPI/RSS 픽스처에서 템플릿 기사를 읽어옵니다."""
+    templates = []
+
+    with open(os.path.join(FIXTURE_DIR, 'newsapi_everything.json'), encoding='utf-8') as f:
+        for article in json.load(f)['articles']:
+            templates.append({
+                'title': article['title'],
+                'description': article.get('description') or '',
+                'content': article.get('content') or '',
+                'source': article['source']['name']
+            })
+
+    tree = ET.parse(os.path.join(FIXTURE_DIR, 'rss_business.xml'))
+    channel_title = tree.findtext('channel/title')
+    for item in tree.iter('item'):
+        templates.append({
+            'title': item.findtext('title'),
+            'description': item.findtext('description') or '',
+            'content': '',
+            'source': channel_title
+        })
+
+    return templates
+
+
+def load_article_html() -> str:
+    """기록된 기사 HTML 템플릿을 읽어옵니다."""
+    with open(os.path.join(FIXTURE_DIR, 'article.html'), encoding='utf-8') as f:
+        return f.read()
+
+
+def build_corpus(size: int, company: str, base_url: str, feed_count: int = 8,
+                 newsapi_share: float = 0.2, seed: int = 42) -> Dict:
+    """
+    지정된 크기의 코퍼스를 생성하고 응답 본문을 렌더링합니다.
+
+    Args:
+        size (int): 전체 기사 수
+        company (str): 모든 기사 제목에 포함될 회사명
+        base_url (str): 스텁 서버 주소 (기사 URL 생성용)
+        feed_count (int): RSS 피드 개수
+        newsapi_share (float): NewsAPI로 제공할 기사 비율 (최대 200개, 언어별 최대 100개)
+        seed (int): 난수 시드
+
+    Returns:
+        Dict: {'articles', 'newsapi': {언어 또는 'all': bytes}, 'feeds': [bytes], 'html': str}
+    """
+    rng = random.Random(seed)
+    templates = load_fixture_articles()
+    articles = []
+
+    for i in range(size):
+        template = templates[i % len(templates)]
+        event = EVENT_PHRASES[rng.randrange(len(EVENT_PHRASES))]
+        articles.append({
+            'id': i,
+            'title': f"{company} {event}: {template['title']} #{i}",
+            'description': template['description'],
+            'content': template['content'],
+            'source': template['source'],
+            'url': f"{base_url}/articles/{i}.html",
+            'published_at': formatdate(1716400000 + i * 37, usegmt=True)
+        })
+
+    newsapi_count = min(int(size * newsapi_share), 200)
+    newsapi_articles = articles[:newsapi_count]
+    feed_articles = articles[newsapi_count:]
+
+    newsapi = {}
+    # 언어별 응답과, 언어 파라미터 없이(별칭 OR 검색어 하나로) 요청했을 때의 전체 응답
+    subsets = {language: newsapi_articles[index::2][:100] for index, language in enumerate(['ko', 'en'])}
+    subsets['all'] = newsapi_articles
+    for language, subset in subsets.items():
+        newsapi[language] = json.dumps({
+            'status': 'ok',
+            'totalResults': len(subset),
+            'articles': [{
+                'source': {'id': None, 'name': a['source']},
+                'title': a['title'],
+                'description': a['description'],
+                'url': a['url'],
+                'publishedAt': a['published_at'],
+                'content': a['content']
+            } for a in subset]
+        }, ensure_ascii=False).encode('utf-8')
+
+    feeds = []
+    for index in range(feed_count):
+        title = FEED_TITLES[index % len(FEED_TITLES)]
+        feeds.append(render_rss(title, feed_articles[index::feed_count]))
+
+    return {
+        'articles': articles,
+        'newsapi': newsapi,
+        'feeds': feeds,
+        'html': load_article_html()
+    }
+
+
+def render_rss(channel_title: str, articles: List[Dict]) -> bytes:
+    """기사 목록을 RSS 2.0 문서로 렌더링합니다."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0"><channel>',
+        f'<title>{escape(channel_title)}</title>',
+        '<link>http://127.0.0.1/</link>',
+        '<description>benchmark feed</description>'
+    ]
+    for article in articles:
+        parts.append(
+            '<item>'
+            f"<title>{escape(article['title'])}</title>"
+            f"<link>{escape(article['url'])}</link>"
+            f"<description>{escape(article['description'])}</description>"
+            f"<pubDate>{article['published_at']}</pubDate>"
+            '</item>'
+        )
+    parts.append('</channel></rss>')
+    return "\n".join(parts).encode('utf-8')
@@ -0,0 +1,165 @@
+"""
+벤치마크용 로컬 스텁 서버
+
+하나의 HTTP 서버로 다음 엔드포인트를 제공합니다.
+
+- GET  /v2/everything[?language=ko|en] : NewsAPI 호환 응답 (언어가 없으면 전체)
+- GET  /rss/<번호>.xml                : RSS 피드
+- GET  /articles/<번호>.html          : 기사 HTML
+- POST /v1/chat/completions           : OpenAI 호환 채팅 완성 (지연/실패율 설정 가능)
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+
+class StubState:
+    """스텁 서버가 제공할 코퍼스와 LLM 동작 설정, 호출 통계"""
+
+    def __init__(self, llm_latency_ms: float = 20.0, llm_failure_rate: float = 0.0, seed: int = 7,
+                 model_latency_ms: Optional[Dict[str, float]] = None):
+        self.corpus = None
+        self.llm_latency_ms = llm_latency_ms
+        # 모델별 응답 지연 (없는 모델은 llm_latency_ms 사용)
+        self.model_latency_ms = dict(model_latency_ms or {})
+        self.llm_failure_rate = llm_failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_counters()
+
+    def reset_counters(self):
+        with getattr(self, '_lock', threading.Lock()):
+            self.llm_calls = 0
+            self.llm_failures = 0
+            self.http_requests = 0
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._rng.random() < self.llm_failure_rate
+
+
+# 클라이언트가 응답 전에 연결을 끊었을 때 발생하는 오류
+_CLIENT_GONE = (BrokenPipeError, ConnectionResetError)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        """요청을 읽는 중 클라이언트가 끊은 경우는 traceback을 출력하지 않습니다."""
+        if isinstance(sys.exc_info()[1], _CLIENT_GONE):
+            return
+        super().handle_error(request, client_address)
+
+
+def _make_handler(state: StubState):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _send(self, status: int, body: bytes, content_type: str):
+            try:
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except _CLIENT_GONE:
+                # 클라이언트가 타임아웃으로 먼저 연결을 끊은 경우 (시간 예산 벤치마크에서 정상)
+                self.close_connection = True
+
+        def do_GET(self):
+            with state._lock:
+                state.http_requests += 1
+            parsed = urlparse(self.path)
+            corpus = state.corpus or {'newsapi': {}, 'feeds': [], 'html': ''}
+
+            if parsed.path.endswith('/v2/everything'):
+                language = parse_qs(parsed.query).get('language', ['all'])[0]
+                body = corpus['newsapi'].get(language, b'{"status": "ok", "articles": []}')
+                self._send(200, body, 'application/json; charset=utf-8')
+            elif parsed.path.startswith('/rss/'):
+                index = int(parsed.path.rsplit('/', 1)[-1].split('.')[0])
+                if index >= len(corpus['feeds']):
+                    self._send(404, b'not found', 'text/plain')
+                else:
+                    self._send(200, corpus['feeds'][index], 'application/rss+xml; charset=utf-8')
+            elif parsed.path.startswith('/articles/'):
+                self._send(200, corpus['html'].encode('utf-8'), 'text/html; charset=utf-8')
+            else:
+                self._send(404, b'not found', 'text/plain')
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+
+            if not self.path.endswith('/chat/completions'):
+                self._send(404, b'not found', 'text/plain')
+                return
+
+            latency_ms = state.model_latency_ms.get(payload.get('model'), state.llm_latency_ms)
+            time.sleep(latency_ms / 1000.0)
+
+            with state._lock:
+                state.llm_calls += 1
+            if state.should_fail():
+                with state._lock:
+                    state.llm_failures += 1
+                body = json.dumps({'error': {'message': 'stub failure', 'type': 'server_error'}}).encode('utf-8')
+                self._send(500, body, 'application/json')
+                return
+
+            self._send(200, json.dumps(_completion(payload)).encode('utf-8'), 'application/json')
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def _completion(payload: Dict) -> Dict:
+    """요청 형태에 맞는 결정적인 채팅 완성 응답을 만듭니다."""
+    prompt = " ".join(str(m.get('content', '')) for m in payload.get('messages', []))
+    max_tokens = payload.get('max_completion_tokens') or payload.get('max_tokens') or 100
+
+    if max_tokens <= 10:
+        # 중대성 점수 요청: 프롬프트 길이로 결정되는 0-1 점수
+        content = f"{(len(prompt) % 97) / 100:.2f}"
+    else:
+        content = "스텁 요약입니다. 실적과 사업 영향, 투자 포인트를 간단히 정리했습니다."
+
+    prompt_tokens = max(1, len(prompt) // 4)
+    completion_tokens = max(1, len(content) // 2)
+    return {
+        'id': 'chatcmpl-stub',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': payload.get('model', 'stub'),
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': content},
+            'finish_reason': 'stop'
+        }],
+        'usage': {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens
+        }
+    }
+
+
+def start_stub_server(state: StubState, host: str = '127.0.0.1', port: int = 0):
+    """
+    스텁 서버를 백그라운드 스레드에서 시작합니다.
+
+    Returns:
+        Tuple[ThreadingHTTPServer, str]: (서버, 기본 URL)
+    """
+    server = _StubHTTPServer((host, port), _make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
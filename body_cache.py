@@ -0,0 +1,188 @@
+"""
+기사 본문 디스크 캐시
+
+get_news_content로 추출한 본문을 정규화한 URL을 키로 저장합니다.
+본문은 내용 해시(SHA-256)별로 zlib 압축 파일 하나에만 저장하므로, 같은 통신사 기사가
+여러 URL로 배포되어도 디스크에는 한 번만 남습니다. URL과 내용 해시의 대응 및 최근 사용 시각은
+SQLite 색인에 두고, 전체 압축 용량이 한도를 넘으면 가장 오래 사용되지 않은 본문부터 삭제합니다.
+본문 파일은 메모리 매핑하여 청크 단위로 압축을 풉니다.
+"""
+
+import hashlib
+import os
+import threading
+import time
+import zlib
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from config import BODY_CACHE_DIR, BODY_CACHE_MAX_BYTES
+from metrics import METRICS, record_cache
+
+# 캐시 키에서 제외하는 추적용 쿼리 파라미터
+_TRACKING_PARAMS = ('fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'cmpid', 'ocid')
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_READ_CHUNK = 64 * 1024
+
+
+def canonical_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL이 같은 키가 되도록 정규화합니다.
+
+    스킴과 호스트를 소문자로 바꾸고 기본 포트, 프래그먼트, 추적용 쿼리(utm_* 등)를 제거하며,
+    나머지 쿼리는 정렬하고 경로 끝의 '/'를 없앱니다.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class BodyCache:
+    """내용 해시로 중복 제거하는 압축 본문 캐시 (용량 기준 LRU 제거)"""
+
+    def __init__(self, cache_dir: str = BODY_CACHE_DIR, max_bytes: int = BODY_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(cache_dir, 'blobs'), exist_ok=True)
+
+        import sqlite3
+
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite3'), check_same_thread=False)
+        # 조회마다 사용 시각을 기록하므로 WAL 모드로 커밋 비용을 줄임
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, digest TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, size INTEGER NOT NULL, raw_size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS urls_digest ON urls (digest)")
+        self._conn.commit()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'blobs', digest[:2], f"{digest}.z")
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        캐시된 본문을 반환합니다.
+
+        Args:
+            url (str): 기사 URL
+
+        Returns:
+            Optional[str]: 본문 (없으면 None)
+        """
+        key = canonical_url(url)
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM urls WHERE url = ?", (key,)).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE blobs SET accessed_at = ? WHERE digest = ?", (time.time(), row[0])
+                )
+                self._conn.commit()
+
+        if row is None:
+            record_cache('body', 'miss')
+            return None
+
+        try:
+            text = self._read_blob(row[0])
+        except (OSError, ValueError, zlib.error) as e:
+            # 파일이 지워졌거나 손상된 경우 색인에서 제거
+            print(f"본문 캐시 읽기 중 오류: {e}")
+            with self._lock:
+                self._remove_blobs([row[0]])
+                self._conn.commit()
+            record_cache('body', 'miss')
+            return None
+
+        record_cache('body', 'hit')
+        return text
+
+    def put(self, url: str, text: str):
+        """
+        본문을 저장합니다. 같은 내용이 이미 있으면 URL만 연결합니다.
+
+        Args:
+            url (str): 기사 URL
+            text (str): 추출한 본문
+        """
+        key = canonical_url(url)
+        raw = text.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if exists:
+                METRICS.inc('body_cache_dedup_total')
+            else:
+                compressed = zlib.compress(raw, 6)
+                path = self._blob_path(digest)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, path)
+                self._conn.execute(
+                    "INSERT INTO blobs (digest, size, raw_size, accessed_at) VALUES (?, ?, ?, ?)",
+                    (digest, len(compressed), len(raw), time.time())
+                )
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO urls (url, digest) VALUES (?, ?)", (key, digest)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _read_blob(self, digest: str) -> str:
+        """압축 파일을 메모리 매핑하여 청크 단위로 압축을 풉니다."""
+        import mmap
+
+        decompressor = zlib.decompressobj()
+        chunks = []
+        with open(self._blob_path(digest), 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, len(mapped), _READ_CHUNK):
+                chunks.append(decompressor.decompress(mapped[start:start + _READ_CHUNK]))
+        chunks.append(decompressor.flush())
+        if not decompressor.eof:
+            raise ValueError(f"압축 데이터가 완전하지 않습니다: {digest}")
+        return b''.join(chunks).decode('utf-8')
+
+    def _evict(self):
+        """압축 용량 합계가 한도를 넘으면 가장 오래 사용되지 않은 본문부터 삭제합니다."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for digest, size in self._conn.execute("SELECT digest, size FROM blobs ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append(digest)
+            total -= size
+
+        self._remove_blobs(evicted)
+        METRICS.inc('body_cache_evictions_total', len(evicted))
+
+    def _remove_blobs(self, digests):
+        """본문 파일과 이를 가리키는 URL 색인을 삭제합니다 (잠금을 잡은 상태에서 호출)."""
+        for digest in digests:
+            self._conn.execute("DELETE FROM urls WHERE digest = ?", (digest,))
+            self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,195 @@
+"""
+기업 별칭 색인
+
+COMPANY_ALIASES로 회사마다 언어별 이름, 티커, 흔한 표기를 묶어 두고, 그 중 어떤 이름으로
+검색해도 같은 별칭 묶음을 사용합니다. RSS 필터는 묶음 전체를 하나의 정규식으로 미리 컴파일한
+매처로 제목과 요약을 한 번만 훑고, NewsAPI는 묶음을 OR 검색어 하나로 만들어 언어별로
+나누어 요청하지 않습니다.
+
+영문/숫자 별칭은 단어 경계에서만 일치로 보며(예: AMD가 Amdahl에 일치하지 않음),
+한글 별칭은 앞에 한글이 붙지 않고 뒤에 한글이 없거나 조사만 붙은 경우에만 일치로 봅니다
+(예: '엔비디아가'는 일치, '애플리케이션', '인텔리전스', '메타버스'는 불일치).
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, List
+from config import COMPANY_ALIASES, NEWSAPI_QUERY_MAX_LENGTH
+
+# 한글 별칭 뒤에 붙어도 같은 단어로 보는 조사 (조사 조합 포함)
+_PARTICLES = frozenset({
+    '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도', '만', '로', '으로',
+    '에서', '에게', '까지', '부터', '보다', '처럼', '마저', '조차', '이나', '나', '랑', '이랑',
+    '에는', '에도', '에서는', '에서도', '에서의', '와의', '과의', '와는', '과는', '로는', '으로는',
+    '로의', '으로의', '만의', '까지의', '부터의', '도의', '이라는', '라는', '이란', '란'
+})
+
+
+def normalize_name(name: str) -> str:
+    """비교용 이름 (유니코드 NFKC 정규화, 소문자, 공백 정리)"""
+    return ' '.join(unicodedata.normalize('NFKC', name).lower().split())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _is_hangul(ch: str) -> bool:
+    return '\uac00' <= ch <= '\ud7a3'
+
+
+def _edge_kind(ch: str) -> str:
+    """별칭 끝 글자에 따른 경계 확인 방식 ('word', 'hangul', 빈 문자열은 확인 없음)"""
+    if _is_word_char(ch):
+        return 'word'
+    if _is_hangul(ch):
+        return 'hangul'
+    return ''
+
+
+class AliasMatcher:
+    """한 회사의 별칭 중 하나라도 텍스트에 등장하는지 확인하는 매처 (프로세스 풀로 전달 가능)"""
+
+    def __init__(self, names: List[str]):
+        # 긴 별칭을 먼저 시도하여 'nvidia corp'가 'nvidia'보다 우선
+        self.names = sorted({normalize_name(name) for name in names if name.strip()}, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(re.escape(name) for name in self.names)) if self.names else None
+        # 앞, 뒤 경계 확인 방식
+        self._bounds = {name: (_edge_kind(name[0]), _edge_kind(name[-1])) for name in self.names}
+
+    def _bounded(self, text: str, name: str, start: int) -> bool:
+        """start 위치의 name이 단어 경계에 놓여 있는지 확인합니다."""
+        left, right = self._bounds[name]
+        end = start + len(name)
+
+        if start > 0:
+            before = text[start - 1]
+            if (left == 'word' and _is_word_char(before)) or (left == 'hangul' and _is_hangul(before)):
+                return False
+
+        if right == 'word':
+            return end >= len(text) or not _is_word_char(text[end])
+        if right == 'hangul':
+            # 뒤에 이어지는 한글이 없거나 조사일 때만 일치
+            suffix_end = end
+            while suffix_end < len(text) and _is_hangul(text[suffix_end]):
+                suffix_end += 1
+            return suffix_end == end or text[end:suffix_end] in _PARTICLES
+        return True
+
+    def matches(self, *texts: str) -> bool:
+        """
+        텍스트들 중 하나에 별칭이 등장하는지 확인합니다.
+
+        Args:
+            *texts (str): 확인할 텍스트 (제목, 요약 등)
+
+        Returns:
+            bool: 별칭이 하나라도 등장하면 True (별칭이 없는 매처는 항상 True)
+        """
+        if self._pattern is None:
+            return True
+
+        text = '\n'.join(texts).lower()
+        position = 0
+        while True:
+            found = self._pattern.search(text, position)
+            if found is None:
+                return False
+            start = found.start()
+            if self._bounded(text, found.group(), start):
+                return True
+            # 가장 긴 별칭이 경계에 걸리면 같은 위치에서 시작하는 짧은 별칭을 확인
+            for name in self.names:
+                if text.startswith(name, start) and self._bounded(text, name, start):
+                    return True
+            position = start + 1
+
+
+class CompanyAliasIndex:
+    """회사명(또는 별칭) → 별칭 묶음 색인과 회사별 매처 캐시"""
+
+    def __init__(self, aliases: Dict[str, List[str]] = COMPANY_ALIASES):
+        self._groups = {}
+        for canonical, names in aliases.items():
+            group = _unique_names([canonical, *names])
+            for name in group:
+                self._groups.setdefault(normalize_name(name), group)
+        self._matchers = {}
+        self._lock = threading.Lock()
+
+    def names(self, company: str) -> List[str]:
+        """
+        회사의 모든 이름을 반환합니다.
+
+        Args:
+            company (str): 회사명 또는 별칭
+
+        Returns:
+            List[str]: 입력한 이름을 맨 앞에 둔 별칭 목록 (색인에 없으면 입력한 이름만)
+        """
+        company = company.strip()
+        group = self._groups.get(normalize_name(company), [])
+        return _unique_names([company, *group])
+
+    def matcher(self, company: str) -> AliasMatcher:
+        """회사의 별칭 매처 (회사별로 한 번만 컴파일)"""
+        key = normalize_name(company)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            with self._lock:
+                matcher = self._matchers.get(key)
+                if matcher is None:
+                    matcher = self._matchers[key] = AliasMatcher(self.names(company))
+        return matcher
+
+    def newsapi_query(self, company: str, max_length: int = NEWSAPI_QUERY_MAX_LENGTH) -> str:
+        """
+        별칭을 OR로 묶은 NewsAPI 검색어를 만듭니다.
+
+        Args:
+            company (str): 회사명 또는 별칭
+            max_length (int): 검색어 최대 길이 (넘는 별칭은 뒤에서부터 제외)
+
+        Returns:
+            str: 검색어 (예: "Nvidia" OR "엔비디아" OR "NVDA")
+        """
+        terms = []
+        for name in self.names(company):
+            term = '"{}"'.format(name.replace('"', ''))
+            if terms and len(' OR '.join(terms + [term])) > max_length:
+                break
+            terms.append(term)
+        return ' OR '.join(terms)
+
+
+def _unique_names(names: List[str]) -> List[str]:
+    """비교용 이름이 같은 항목을 제거합니다 (처음 나온 표기 유지)."""
+    seen = set()
+    unique = []
+    for name in names:
+        key = normalize_name(name)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(name.strip())
+    return unique
+
+
+# 프로세스 전체에서 공유하는 별칭 색인 (피드 파싱 작업 프로세스에서는 각자 생성)
+ALIAS_INDEX = CompanyAliasIndex()
+
+
+def company_names(company: str) -> List[str]:
+    """회사의 모든 이름 (입력한 이름 우선)"""
+    return ALIAS_INDEX.names(company)
+
+
+def alias_matcher(company: str) -> AliasMatcher:
+    """회사의 별칭 매처"""
+    return ALIAS_INDEX.matcher(company)
+
+
+def newsapi_query(company: str) -> str:
+    """회사의 NewsAPI OR 검색어"""
+    return ALIAS_INDEX.newsapi_query(company)
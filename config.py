@@ -6,22 +6,122 @@ load_dotenv()
 
 # OpenAI API 설정
 OPENAI_API_KEY = "OPENAI_API_KEY"
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')  # OpenAI 호환 서버 주소 (None이면 기본 API)
 
 # 뉴스 API 설정 (NewsAPI 사용 예시)
 NEWS_API_KEY = os.getenv('NEWS_API_KEY', 'your_news_api_key')
+NEWS_API_URL = os.getenv('NEWS_API_URL', 'https://newsapi.org/v2/everything')
+
+# 주요 경제 뉴스 RSS 피드 (한국 + 해외)
+RSS_FEEDS = [
+    # 해외 뉴스
+    'https://feeds.reuters.com/reuters/businessNews',
+    'https://feeds.bloomberg.com/markets/news.rss',
+    'https://feeds.finance.yahoo.com/rss/2.0/headline',
+    'https://feeds.bbci.co.uk/news/business/rss.xml',
+    'https://rss.cnn.com/rss/money_latest.rss',
+    'https://feeds.marketwatch.com/marketwatch/topstories/',
+    # 한국 뉴스 (RSS 피드가 있는 경우)
+    'https://rss.joins.com/joins_news_list.xml',
+    'https://rss.donga.com/total.xml'
+]
 
 # 모델 설정
 MODEL_NAME = "gpt-5"
 TEMPERATURE = 0.3
 
+# 작업별 모델 라우팅 (앞쪽 모델 우선, 목표 지연을 넘거나 오류가 잦으면 다음 후보로 전환)
+MODEL_ROUTES = {
+    'impact': ["gpt-5-nano", "gpt-5-mini"],  # 10토큰 점수 응답은 작고 빠른 모델로 충분
+    'summary': [MODEL_NAME, "gpt-5-mini"],
+    'overall': [MODEL_NAME, "gpt-5-mini"]
+}
+MODEL_LATENCY_TARGETS = {'impact': 3.0, 'summary': 15.0, 'overall': 30.0}  # 작업별 목표 응답 지연 (초)
+MODEL_ROUTER_EWMA_ALPHA = 0.3  # 지연/오류율 이동 평균에서 최근 호출의 비중
+MODEL_ROUTER_MAX_ERROR_RATE = 0.5  # 이 오류율을 넘은 모델은 잠시 제외
+MODEL_ROUTER_COOLDOWN = 120  # 제외한 모델을 다시 시도하기까지의 시간 (초)
+
+# LLM 호출 설정
+LLM_MAX_CONCURRENCY = 4  # 프로세스 전체 LLM 동시 호출 한도
+LLM_REQUEST_DELAY = float(os.getenv('LLM_REQUEST_DELAY', '1.0'))  # Rate limit 방지를 위한 호출 전 지연 (초)
+LLM_MAX_RETRIES = 2  # 일시적인 오류 시 재시도 횟수
+LLM_RETRY_BACKOFF = 0.5  # 재시도 간 기본 대기 시간 (초, 재시도마다 2배)
+LLM_BREAKER_FAILURE_THRESHOLD = 3  # 연속 실패가 이 횟수에 이르면 서킷을 열고 LLM 호출 없이 폴백 사용
+LLM_BREAKER_RESET_TIMEOUT = 30  # 서킷이 열린 뒤 복구 확인(half-open) 호출을 허용하기까지의 시간 (초)
+LLM_BREAKER_HALF_OPEN_CALLS = 1  # half-open 상태에서 동시에 허용하는 확인 호출 수
+
 # 뉴스 검색 설정
 SEARCH_LANGUAGE = "ko"  # 한국어 뉴스
 SEARCH_DAYS = 1  # 최근 1일
 MAX_NEWS_COUNT = 50  # 최대 뉴스 개수
+STREAM_TOP_K = MAX_NEWS_COUNT  # 스트리밍 모드에서 정밀 평가할 후보 수 (메모리는 이 값에 비례)
+NEWSAPI_MAX_PAGES = 5  # 스트리밍 모드에서 NewsAPI 최대 페이지 수
+FEED_CACHE_TTL = 300  # 다운로드한 RSS 피드를 재사용하는 시간 (초)
+FETCH_TIMEOUT = 10  # 뉴스 소스 요청 타임아웃 (초, 마감 시간이 있으면 남은 시간으로 줄어듦)
+FEED_PARSER = os.getenv('FEED_PARSER', 'lxml')  # 'lxml' (스트리밍 파서) 또는 'feedparser'
+FEED_PARSER_WORKERS = min(4, os.cpu_count() or 1)  # 피드 파싱 프로세스 풀 작업자 수 (1이면 프로세스 풀 미사용)
+FEED_PARSER_POOL_MIN_FEEDS = 16  # 이 개수 이상의 피드는 프로세스 풀에서 파싱
+FEED_PARSER_POOL_MIN_BYTES = 4 * 1024 * 1024  # 피드 전체 용량이 이 이상이면 프로세스 풀에서 파싱
+
+# 스토리 클러스터링 설정 (같은 사건의 기사는 대표 기사 하나만 LLM으로 평가/요약)
+ENABLE_STORY_CLUSTERING = True
+STORY_SIMILARITY_THRESHOLD = 0.4  # 같은 스토리로 묶는 제목+설명 단어 Jaccard 유사도
+STORY_MINHASH_PERMUTATIONS = 32  # MinHash 서명 길이
+STORY_LSH_BANDS = 16  # LSH 밴드 수 (서명 길이의 약수, 많을수록 후보를 넓게 찾음)
+
+# 마감 시간 설정
+ANALYSIS_DEADLINE = None  # 회사별 전체 분석 시간 예산 (초, None이면 제한 없음)
+# 단계별로 받는 남은 예산의 비율 (종합 요약은 나머지 전부 사용)
+DEADLINE_STAGE_SHARES = {
+    'search': 0.3,
+    'importance': 0.6,
+    'summarize': 0.8
+}
+
+# 증분 분석 설정
+ANALYSIS_STATE_DIR = os.getenv('ANALYSIS_STATE_DIR', '.cache/state')  # 회사별 이전 실행 상태 저장 경로
+
+# 관심 종목 일괄 분석 설정
+BATCH_MAX_WORKERS = 8  # 동시에 분석할 회사 수
+
+# 기사 본문 캐시 설정
+BODY_CACHE_ENABLED = True
+BODY_CACHE_DIR = os.getenv('BODY_CACHE_DIR', '.cache/bodies')  # 압축 본문과 색인 저장 경로
+BODY_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 압축된 본문의 최대 총 용량 (넘으면 오래 사용되지 않은 본문부터 삭제)
+
+# 결과 캐시 설정
+RESULT_CACHE_ENABLED = True
+RESULT_CACHE_BACKEND = os.getenv('RESULT_CACHE_BACKEND', 'memory')  # 'memory' (LRU) 또는 'sqlite' (영구 저장)
+RESULT_CACHE_PATH = os.getenv('RESULT_CACHE_PATH', '.cache/results.sqlite3')
+RESULT_CACHE_TTL = 600  # 결과를 신선하다고 보는 시간 (초)
+RESULT_CACHE_STALE_TTL = 3600  # TTL 이후 오래된 결과를 즉시 반환하면서 백그라운드 갱신하는 시간 (초)
+RESULT_CACHE_MAX_ENTRIES = 256  # 최대 캐시 항목 수
 
 # 분석할 기업명 설정
 TARGET_COMPANY = "Nvidia"  # 분석할 기업명 (변경 가능)
 
+# 기업 별칭 (언어별 이름, 티커, 흔한 표기). 같은 목록의 이름은 모두 같은 회사로 보고
+# RSS 필터와 NewsAPI 검색어에 함께 사용합니다. 목록에 없는 회사는 입력한 이름만 사용합니다.
+COMPANY_ALIASES = {
+    'Nvidia': ['엔비디아', 'NVDA', 'NVIDIA Corp', '앤비디아'],
+    'Samsung Electronics': ['삼성전자', 'Samsung Elec', '005930'],
+    'SK hynix': ['SK하이닉스', 'SK Hynix Inc', 'Hynix', '하이닉스', '000660'],
+    'Apple': ['애플', 'AAPL', 'Apple Inc'],
+    'Tesla': ['테슬라', 'TSLA', 'Tesla Inc'],
+    'Microsoft': ['마이크로소프트', 'MSFT', 'Microsoft Corp'],
+    'Alphabet': ['Google', '구글', '알파벳', 'GOOGL', 'GOOG'],
+    'Amazon': ['아마존', 'AMZN', 'Amazon.com'],
+    'Meta Platforms': ['Meta', '메타', 'META', 'Facebook', '페이스북'],
+    'TSMC': ['Taiwan Semiconductor', 'TSM'],
+    'Intel': ['인텔', 'INTC'],
+    'AMD': ['Advanced Micro Devices', '에이엠디'],
+    'Hyundai Motor': ['현대차', '현대자동차', 'Hyundai Motor Co', '005380'],
+    'LG Energy Solution': ['LG에너지솔루션', 'LG엔솔', '373220'],
+    'Naver': ['네이버', 'NAVER Corp', '035420'],
+    'Kakao': ['카카오', 'Kakao Corp', '035720']
+}
+NEWSAPI_QUERY_MAX_LENGTH = 500  # NewsAPI 검색어(q) 최대 길이
+
 # 중요도 평가 가중치
 WEIGHTS = {
     'reliability': 0.4,  # 신뢰성
@@ -0,0 +1,104 @@
+"""
+분석 요청 전체의 시간 예산
+
+search_and_summarize에 시간 제한을 주면 Deadline이 각 단계로 전달되고,
+단계마다 남은 예산의 일정 비율을 하위 Deadline으로 나누어 받습니다.
+수집 요청과 LLM 호출은 남은 시간을 타임아웃으로 쓰며, 시간이 다 된 단계는
+키워드 점수와 기본 요약 같은 로컬 폴백으로 대신하고 그 사실을 기록합니다.
+"""
+
+import math
+import time
+from typing import Dict, Optional, Set
+
+
+class DeadlineExceeded(TimeoutError):
+    """시간 예산이 남지 않아 작업을 시작하지 않았음을 알리는 예외"""
+
+
+class Deadline:
+    """단조 시계 기준의 마감 시각과, 시간 부족으로 생략된 단계 기록"""
+
+    def __init__(self, budget: Optional[float] = None, _expires_at: Optional[float] = None,
+                 _exceeded: Optional[Set[str]] = None):
+        self.started = time.monotonic()
+        self.budget = budget
+        if _expires_at is not None:
+            self.expires_at = _expires_at
+        else:
+            self.expires_at = self.started + budget if budget is not None else None
+        # 하위 Deadline과 공유하여 요청 전체에서 생략된 단계를 모음
+        self.exceeded_stages = _exceeded if _exceeded is not None else set()
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 제한이 없으면 무한대)"""
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def mark(self, stage: str):
+        """시간 부족으로 폴백을 사용한 단계를 기록합니다."""
+        self.exceeded_stages.add(stage)
+
+    def check(self, stage: str) -> bool:
+        """
+        시간이 남았는지 확인하고, 남지 않았으면 해당 단계를 생략 목록에 기록합니다.
+
+        Args:
+            stage (str): 확인하는 단계 이름 (예: search, impact, summary)
+
+        Returns:
+            bool: 작업을 진행해도 되면 True
+        """
+        if self.expired():
+            self.mark(stage)
+            return False
+        return True
+
+    def timeout(self, default: float) -> float:
+        """기본 타임아웃과 남은 시간 중 작은 값"""
+        return min(default, self.remaining())
+
+    def child(self, share: float) -> 'Deadline':
+        """
+        남은 시간의 일정 비율만 쓰는 하위 Deadline을 만듭니다.
+
+        Args:
+            share (float): 남은 시간 중 하위 단계에 줄 비율 (0-1)
+
+        Returns:
+            Deadline: 하위 Deadline (생략 기록은 상위와 공유)
+        """
+        if self.expires_at is None:
+            return Deadline(_exceeded=self.exceeded_stages)
+        expires_at = time.monotonic() + self.remaining() * share
+        return Deadline(_expires_at=expires_at, _exceeded=self.exceeded_stages)
+
+    def to_dict(self) -> Dict:
+        """결과 딕셔너리에 첨부할 요약"""
+        return {
+            'budget': self.budget,
+            'elapsed': round(time.monotonic() - self.started, 3),
+            'exceeded': bool(self.exceeded_stages),
+            'exceeded_stages': sorted(self.exceeded_stages)
+        }
+
+
+
+def call_timeout(deadline: Optional[Deadline], pending: int = 1) -> Optional[float]:
+    """
+    LLM 호출 등에 넘길 타임아웃을 계산합니다.
+
+    Args:
+        deadline (Optional[Deadline]): 단계의 시간 예산
+        pending (int): 이 호출을 포함해 단계에 남은 호출 수 (남은 시간을 똑같이 나누어 받음)
+
+    Returns:
+        Optional[float]: 타임아웃 (초, 마감 시간이 없거나 제한이 없으면 None)
+    """
+    if deadline is None or deadline.expires_at is None:
+        return None
+    return deadline.remaining() / max(1, pending)
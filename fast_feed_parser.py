@@ -0,0 +1,184 @@
+"""
+lxml iterparse 기반 스트리밍 RSS/Atom 파서
+
+feedparser는 피드 전체를 순수 파이썬으로 해석하므로 느리고 GIL을 오래 잡습니다.
+이 모듈은 항목(item/entry)이 끝날 때마다 회사 별칭 필터를 바로 적용하여 일치하지 않는 항목은
+딕셔너리를 만들지 않고 버리며, 처리한 요소는 즉시 해제하여 큰 아카이브도 일정한 메모리로 읽습니다.
+피드가 많거나 용량이 크면 프로세스 풀에서 병렬로 파싱합니다.
+
+반환하는 항목 딕셔너리는 news_search의 feedparser 경로와 같은 필드
+(title, description, content, url, published_at)를 가집니다.
+"""
+
+import atexit
+import io
+import threading
+from typing import Dict, List, Optional, Tuple
+from company_aliases import AliasMatcher, alias_matcher
+from config import FEED_PARSER_WORKERS, FEED_PARSER_POOL_MIN_FEEDS, FEED_PARSER_POOL_MIN_BYTES
+
+# 항목 요소 이름 (RSS 2.0/1.0의 item, Atom의 entry)
+_ITEM_TAGS = ('item', 'entry')
+# 피드 제목을 담는 부모 요소 이름
+_FEED_TAGS = ('channel', 'feed')
+# 게시 시각 요소 우선순위 (feedparser 경로의 published, updated 순서와 같음)
+_DATE_TAGS = ('pubDate', 'published', 'date', 'updated')
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _local_name(tag) -> str:
+    """네임스페이스를 뺀 요소 이름 (주석/처리 명령은 빈 문자열)"""
+    if not isinstance(tag, str):
+        return ''
+    return tag.rpartition('}')[2]
+
+
+def _text(element) -> str:
+    """요소의 텍스트 (XHTML 내용처럼 하위 요소가 있으면 모든 텍스트를 이어 붙임)"""
+    if len(element):
+        return ''.join(element.itertext()).strip()
+    return (element.text or '').strip()
+
+
+def _entry_from_element(element, matcher: AliasMatcher) -> Optional[Dict]:
+    """항목 요소를 딕셔너리로 변환합니다. 회사 별칭이 없으면 None을 반환합니다."""
+    fields = {}
+    link = ''
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 'link':
+            # Atom은 href 속성(rel이 없거나 alternate), RSS는 텍스트
+            href = child.get('href')
+            if href is None:
+                link = link or _text(child)
+            elif child.get('rel', 'alternate') == 'alternate' and not link:
+                link = href
+        elif name not in fields:
+            fields[name] = child
+
+    title = _text(fields['title']) if 'title' in fields else ''
+    summary_element = fields.get('description', fields.get('summary'))
+    description = _text(summary_element) if summary_element is not None else ''
+
+    # 회사 별칭이 제목이나 요약에 포함된 경우만 나머지 필드를 읽음
+    if not matcher.matches(title, description):
+        return None
+
+    content_element = fields.get('encoded', fields.get('content'))
+    published = next((_text(fields[tag]) for tag in _DATE_TAGS if tag in fields), '')
+
+    return {
+        'title': title,
+        'description': description,
+        'content': _text(content_element) if content_element is not None else '',
+        'url': link,
+        'published_at': published
+    }
+
+
+def parse_feed(data: bytes, company: str) -> Dict:
+    """
+    피드 원문 하나를 스트리밍 방식으로 파싱합니다.
+
+    Args:
+        data (bytes): RSS/Atom 피드 원문
+        company (str): 회사명 (이 회사의 별칭 중 하나가 제목이나 요약에 포함된 항목만 반환)
+
+    Returns:
+        Dict: {'title': 피드 제목, 'entries': 회사 별칭이 포함된 항목 딕셔너리 리스트}
+    """
+    from lxml import etree
+
+    matcher = alias_matcher(company)
+    feed_title = None
+    entries = []
+
+    for _, element in etree.iterparse(io.BytesIO(data), events=('end',), recover=True,
+                                      resolve_entities=False, no_network=True):
+        name = _local_name(element.tag)
+
+        if name in _ITEM_TAGS:
+            entry = _entry_from_element(element, matcher)
+            if entry is not None:
+                entries.append(entry)
+            # 처리한 항목과 앞선 형제 요소를 해제하여 메모리를 일정하게 유지
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+        elif name == 'title' and feed_title is None:
+            parent = element.getparent()
+            if parent is not None and _local_name(parent.tag) in _FEED_TAGS:
+                feed_title = _text(element)
+
+    return {'title': feed_title or 'RSS Feed', 'entries': entries}
+
+
+def _parse_feed_safe(data: bytes, company: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """프로세스 풀 작업 함수: 예외 대신 (결과, 오류 메시지)를 반환합니다."""
+    try:
+        return parse_feed(data, company), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _get_pool(max_workers: int):
+    """피드 파싱용 프로세스 풀을 반환합니다 (처음 필요할 때 생성하여 재사용)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # 스레드(HTTP 세션, 캐시 갱신 등)가 도는 프로세스를 fork하면 잠금이 잡힌 채 복제될 수 있으므로
+                # 가벼운 서버 프로세스에서 작업자를 만드는 forkserver(지원하지 않는 플랫폼은 spawn)를 사용
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+                atexit.register(_pool.shutdown, wait=False)
+    return _pool
+
+
+def should_use_pool(payloads: List, max_workers: int = FEED_PARSER_WORKERS, check_size: bool = True) -> bool:
+    """
+    피드 수나 전체 용량이 프로세스 풀 시작 비용을 감수할 만큼 큰지 판단합니다.
+
+    Args:
+        payloads (List): 피드 원문 리스트 (check_size가 False면 피드 URL 리스트도 가능)
+        max_workers (int): 프로세스 풀 작업자 수
+        check_size (bool): 전체 용량 기준도 적용할지 여부 (다운로드 전에는 피드 수만으로 판단)
+
+    Returns:
+        bool: 프로세스 풀을 사용할지 여부
+    """
+    if max_workers <= 1 or len(payloads) <= 1:
+        return False
+    if len(payloads) >= FEED_PARSER_POOL_MIN_FEEDS:
+        return True
+    return check_size and sum(len(data) for data in payloads) >= FEED_PARSER_POOL_MIN_BYTES
+
+
+def parse_feeds(payloads: List[bytes], company: str,
+                max_workers: int = FEED_PARSER_WORKERS) -> List[Tuple[Optional[Dict], Optional[str]]]:
+    """
+    여러 피드를 파싱합니다. 피드가 많거나 크면 프로세스 풀에서 병렬로 처리합니다.
+
+    Args:
+        payloads (List[bytes]): 피드 원문 리스트
+        company (str): 회사명
+        max_workers (int): 프로세스 풀 작업자 수
+
+    Returns:
+        List[Tuple[Optional[Dict], Optional[str]]]: 입력 순서대로 (파싱 결과, 오류 메시지)
+    """
+    if should_use_pool(payloads, max_workers):
+        try:
+            pool = _get_pool(max_workers)
+            return list(pool.map(_parse_feed_safe, payloads, [company] * len(payloads)))
+        except Exception as e:
+            # 프로세스를 만들 수 없는 환경 등에서는 현재 프로세스에서 파싱
+            print(f"피드 파싱 프로세스 풀 사용 중 오류: {e}")
+
+    return [_parse_feed_safe(data, company) for data in payloads]
@@ -1,27 +1,31 @@
 import re
-import time
-from typing import List, Dict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-import openai
-from config import TRUSTED_SOURCES, WEIGHTS, OPENAI_API_KEY, MODEL_NAME, TEMPERATURE, IMPORTANCE_KEYWORDS
+from typing import List, Dict, Optional
+from llm_client import LLMClient
+from deadline import Deadline, DeadlineExceeded, call_timeout
+from news_article import mark_degraded, is_degraded
+from metrics import stage
+from scoring_engine import BatchScorer
+from config import TRUSTED_SOURCES, WEIGHTS, TEMPERATURE, IMPORTANCE_KEYWORDS
 
 class ImportanceEvaluator:
     def __init__(self):
         self.weights = WEIGHTS
         self.trusted_sources = TRUSTED_SOURCES
         self.importance_keywords = IMPORTANCE_KEYWORDS
-        self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
-        self.model = MODEL_NAME
+        self.llm = LLMClient()
+        self.scorer = BatchScorer(self.weights)
+        self.model = None  # None이면 MODEL_ROUTES에 따라 작업별 모델 사용
         self.temperature = TEMPERATURE
         
-    def evaluate_news_importance(self, news_list: List[Dict]) -> List[Dict]:
+    def evaluate_news_importance(self, news_list: List[Dict], reuse_scores: bool = False,
+                                 deadline: Optional[Deadline] = None) -> List[Dict]:
         """
         뉴스의 중요도를 평가합니다.
         
         Args:
             news_list (List[Dict]): 뉴스 리스트
+            reuse_scores (bool): 이미 중대성 점수가 있는 뉴스는 LLM 평가를 생략
+            deadline (Optional[Deadline]): 평가 단계의 시간 예산 (넘으면 키워드 기반 점수 사용)
             
         Returns:
             List[Dict]: 중요도 점수가 추가된 뉴스 리스트
@@ -29,26 +33,106 @@ class ImportanceEvaluator:
         if not news_list:
             return []
         
-        # 각 뉴스에 중요도 점수 계산
-        for news in news_list:
-            reliability_score = self._calculate_reliability_score(news)
-            impact_score = self._calculate_llm_impact_score(news)
-            frequency_score = self._calculate_frequency_score(news, news_list)
-            
-            # 가중 평균으로 최종 점수 계산
-            final_score = (
-                reliability_score * self.weights['reliability'] +
-                impact_score * self.weights['impact'] +
-                frequency_score * self.weights['frequency']
-            )
+        # 신뢰성: 출처 문자열별로 한 번만 계산
+        with stage('reliability'):
+            source_scores = {}
+            reliability_scores = []
+            for news in news_list:
+                source = news.get('source', '')
+                if source not in source_scores:
+                    source_scores[source] = self._calculate_reliability_score(news)
+                reliability_scores.append(source_scores[source])
+        
+        # 스토리 클러스터가 있으면 클러스터마다 신뢰성이 가장 높은 기사를 대표로 지정
+        clustered = all(news.get('cluster_id') is not None for news in news_list)
+        representatives = {}
+        if clustered:
+            for i, news in enumerate(news_list):
+                best = representatives.get(news['cluster_id'])
+                if best is None or reliability_scores[i] > reliability_scores[best]:
+                    representatives[news['cluster_id']] = i
+            for i, news in enumerate(news_list):
+                news['story_representative'] = representatives[news['cluster_id']] == i
+        
+        # 중대성: LLM 평가 (이미 점수가 있으면 재사용, 클러스터는 대표 기사 하나만 평가)
+        impact_scores = [None] * len(news_list)
+        story_impacts = {}
+        if reuse_scores:
+            for i, news in enumerate(news_list):
+                if news.get('impact_score') is not None:
+                    impact_scores[i] = news['impact_score']
+                    if clustered:
+                        story_impacts.setdefault(news['cluster_id'], impact_scores[i])
+        
+        # 남은 LLM 호출 수 (단계 시간 예산을 남은 호출끼리 나누어 씀)
+        if clustered:
+            pending = len({news['cluster_id'] for i, news in enumerate(news_list)
+                           if impact_scores[i] is None} - set(story_impacts))
+        else:
+            pending = impact_scores.count(None)
+        
+        for i, news in enumerate(news_list):
+            if impact_scores[i] is not None:
+                continue
+            if clustered and news['cluster_id'] in story_impacts:
+                impact_scores[i] = story_impacts[news['cluster_id']]
+                if is_degraded(news_list[representatives[news['cluster_id']]], 'impact'):
+                    mark_degraded(news, 'impact')
+                continue
             
-            news['reliability_score'] = reliability_score
-            news['impact_score'] = impact_score
-            news['frequency_score'] = frequency_score
-            news['final_score'] = final_score
+            target = news_list[representatives[news['cluster_id']]] if clustered else news
+            if deadline is not None and not deadline.check('impact'):
+                # 시간 예산을 모두 쓰면 남은 뉴스는 키워드 기반 점수로 대체
+                impact_scores[i] = self._fallback_impact_score(target)
+                mark_degraded(target, 'impact')
+            else:
+                with stage('impact_llm'):
+                    impact_scores[i] = self._calculate_llm_impact_score(target, deadline, pending)
+            pending -= 1
+            if target is not news and is_degraded(target, 'impact'):
+                mark_degraded(news, 'impact')
+            if clustered:
+                story_impacts[news['cluster_id']] = impact_scores[i]
+        
+        # 빈도: 클러스터가 있으면 스토리 크기로, 없으면 TF-IDF를 한 번만 학습하여 전체 유사도 계산
+        if clustered:
+            with stage('frequency_clusters'):
+                frequency_scores = self.scorer.cluster_frequency_scores(
+                    [news['cluster_size'] for news in news_list]
+                )
+        else:
+            with stage('frequency_tfidf'):
+                texts = [f"{n.get('title', '')} {n.get('description', '')}" for n in news_list]
+                frequency_scores = self.scorer.frequency_scores(texts)
+        
+        # 가중 평균으로 최종 점수 계산 (벡터 연산)
+        final_scores = self.scorer.combine(reliability_scores, impact_scores, frequency_scores)
+        
+        for i, news in enumerate(news_list):
+            news['reliability_score'] = reliability_scores[i]
+            news['impact_score'] = impact_scores[i]
+            news['frequency_score'] = float(frequency_scores[i])
+            news['final_score'] = float(final_scores[i])
         
         return news_list
     
+    def cheap_score(self, news: Dict) -> float:
+        """
+        LLM 없이 계산하는 저비용 사전 점수 (스트리밍 후보 선별용)
+        
+        신뢰성과 키워드 기반 중대성을 가중치대로 합산합니다.
+        
+        Args:
+            news (Dict): 뉴스 정보
+            
+        Returns:
+            float: 사전 점수
+        """
+        return (
+            self._calculate_reliability_score(news) * self.weights['reliability'] +
+            self._fallback_impact_score(news) * self.weights['impact']
+        )
+    
     def _calculate_reliability_score(self, news: Dict) -> float:
         """
         뉴스의 신뢰성을 평가합니다.
@@ -82,12 +166,15 @@ class ImportanceEvaluator:
         # 기본 점수
         return 0.5
     
-    def _calculate_llm_impact_score(self, news: Dict) -> float:
+    def _calculate_llm_impact_score(self, news: Dict, deadline: Optional[Deadline] = None,
+                                    pending: int = 1) -> float:
         """
         LLM을 사용하여 뉴스의 중대성(주가 영향도)을 평가합니다.
         
         Args:
             news (Dict): 뉴스 정보
+            deadline (Optional[Deadline]): 남은 시간 예산 (LLM 호출 타임아웃으로 사용)
+            pending (int): 이 호출을 포함해 단계에 남은 LLM 호출 수 (남은 시간을 나누어 받음)
             
         Returns:
             float: 중대성 점수 (0-1)
@@ -125,20 +212,17 @@ class ImportanceEvaluator:
 """
         
         try:
-            # Rate limit 방지를 위한 지연
-            time.sleep(1)
-            
-            response = self.client.chat.completions.create(
+            score_text = self.llm.complete(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 주식 투자 분석 전문가입니다. 뉴스의 주가 영향도를 정확하게 평가합니다."},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=10
+                max_completion_tokens=10,
+                task='impact',
+                timeout=call_timeout(deadline, pending)
             )
             
-            score_text = response.choices[0].message.content.strip()
-            
             # 점수 추출 및 검증
             try:
                 score = float(score_text)
@@ -149,9 +233,15 @@ class ImportanceEvaluator:
                 # 숫자 변환 실패 시 기본 점수 반환
                 return 0.5
                 
+        except DeadlineExceeded:
+            if deadline is not None:
+                deadline.mark('impact')
+            mark_degraded(news, 'impact')
+            return self._fallback_impact_score(news)
         except Exception as e:
             print(f"LLM 중요도 평가 중 오류: {e}")
             # 오류 시 키워드 기반 평가로 폴백
+            mark_degraded(news, 'impact')
             return self._fallback_impact_score(news)
     
     def _fallback_impact_score(self, news: Dict) -> float:
@@ -175,45 +265,3 @@ class ImportanceEvaluator:
         normalized_score = min(total_score / max_possible_score, 1.0) if max_possible_score > 0 else 0.5
         
         return normalized_score
-    
-    def _calculate_frequency_score(self, news: Dict, all_news: List[Dict]) -> float:
-        """
-        유사한 뉴스의 빈도를 계산합니다.
-        
-        Args:
-            news (Dict): 현재 뉴스
-            all_news (List[Dict]): 전체 뉴스 리스트
-            
-        Returns:
-            float: 빈도 점수 (0-1)
-        """
-        if len(all_news) <= 1:
-            return 0.5
-        
-        # 텍스트 벡터화
-        texts = [f"{n.get('title', '')} {n.get('description', '')}" for n in all_news]
-        current_text = f"{news.get('title', '')} {news.get('description', '')}"
-        
-        try:
-            vectorizer = TfidfVectorizer(max_features=100, stop_words=None)
-            tfidf_matrix = vectorizer.fit_transform(texts)
-            
-            # 현재 뉴스와 다른 뉴스들의 유사도 계산
-            current_vector = vectorizer.transform([current_text])
-            similarities = cosine_similarity(current_vector, tfidf_matrix)[0]
-            
-            # 자기 자신 제외하고 유사도 계산
-            similarities = np.delete(similarities, np.argmax(similarities))
-            
-            # 유사도가 높은 뉴스 개수 계산 (임계값: 0.3)
-            similar_count = np.sum(similarities > 0.3)
-            
-            # 빈도 점수 계산 (유사한 뉴스가 많을수록 높은 점수)
-            max_similar = len(all_news) - 1
-            frequency_score = similar_count / max_similar if max_similar > 0 else 0
-            
-            return min(frequency_score, 1.0)
-            
-        except Exception as e:
-            print(f"빈도 점수 계산 중 오류: {e}")
-            return 0.5
@@ -0,0 +1,298 @@
+import threading
+import time
+from typing import List, Dict, Optional
+from config import (OPENAI_API_KEY, OPENAI_BASE_URL, LLM_MAX_CONCURRENCY, LLM_REQUEST_DELAY, LLM_MAX_RETRIES,
+                    LLM_RETRY_BACKOFF, LLM_BREAKER_FAILURE_THRESHOLD, LLM_BREAKER_RESET_TIMEOUT,
+                    LLM_BREAKER_HALF_OPEN_CALLS)
+from metrics import METRICS, log_event
+from deadline import DeadlineExceeded
+from model_router import MODEL_ROUTER
+
+# 프로세스 전체에서 공유하는 LLM 동시 호출 한도
+_llm_semaphore = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+
+class LLMCircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 LLM을 호출하지 않았음을 알리는 예외 (호출자는 로컬 폴백 사용)"""
+
+
+class CircuitBreaker:
+    """
+    LLM 백엔드 장애 시 호출을 즉시 차단하는 서킷 브레이커
+
+    - closed: 정상 호출. 연속 실패가 failure_threshold에 이르면 open으로 전환
+    - open: 모든 호출을 바로 거부. reset_timeout이 지나면 half_open으로 전환
+    - half_open: half_open_calls개의 확인 호출만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = LLM_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = LLM_BREAKER_RESET_TIMEOUT,
+                 half_open_calls: int = LLM_BREAKER_HALF_OPEN_CALLS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._trips = 0
+        self._rejected = 0
+
+    def allow(self) -> bool:
+        """호출을 진행해도 되는지 확인합니다 (half-open에서는 확인 호출 자리를 예약)."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._transition(self.HALF_OPEN)
+                self._probes = 0
+
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        """호출 성공을 기록합니다."""
+        with self._lock:
+            self._failures = 0
+            if self._state == self.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                self._transition(self.CLOSED)
+
+    def release(self):
+        """결과 없이 끝난 호출(마감 시간 초과 등)의 half-open 확인 호출 자리를 반납합니다."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def record_failure(self):
+        """호출 실패(재시도 소진 후)를 기록합니다."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                self._open()
+            elif self._state == self.CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self._opened_at = time.monotonic()
+        self._trips += 1
+        self._transition(self.OPEN)
+
+    def _transition(self, state: str):
+        if state != self._state:
+            self._state = state
+            METRICS.inc('llm_circuit_transitions_total', state=state)
+            log_event('llm_circuit', state=state, consecutive_failures=self._failures)
+
+    def snapshot(self) -> Dict:
+        """현재 서킷 상태 (결과 딕셔너리와 로그용)"""
+        with self._lock:
+            retry_in = 0.0
+            if self._state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'trips': self._trips,
+                'rejected_calls': self._rejected,
+                'retry_in': round(retry_in, 1)
+            }
+
+
+# 프로세스 전체에서 공유하는 모델별 LLM 서킷 브레이커
+# (한 모델의 장애가 다른 후보 모델이나 다른 작업의 호출까지 막지 않도록 모델마다 따로 둠)
+_llm_breakers: Dict[str, CircuitBreaker] = {}
+_llm_breakers_lock = threading.Lock()
+
+# 상태 심각도 (여러 모델 중 가장 나쁜 상태를 대표 상태로 사용)
+_CIRCUIT_SEVERITY = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+
+
+def _breaker_for(model: str) -> CircuitBreaker:
+    """모델의 서킷 브레이커 (처음 호출하는 모델이면 생성)"""
+    breaker = _llm_breakers.get(model)
+    if breaker is None:
+        with _llm_breakers_lock:
+            breaker = _llm_breakers.setdefault(model, CircuitBreaker())
+    return breaker
+
+
+def llm_circuit_state() -> Dict:
+    """
+    모델별 LLM 서킷 브레이커의 현재 상태를 반환합니다.
+
+    Returns:
+        Dict: state (가장 나쁜 모델의 상태, 호출한 모델이 없으면 closed)와 models (모델별 상태)
+    """
+    with _llm_breakers_lock:
+        breakers = dict(_llm_breakers)
+    models = {model: breaker.snapshot() for model, breaker in sorted(breakers.items())}
+    state = max((snapshot['state'] for snapshot in models.values()),
+                key=_CIRCUIT_SEVERITY.get, default=CircuitBreaker.CLOSED)
+    return {'state': state, 'models': models}
+
+
+class LLMClient:
+    """중요도 평가와 요약이 공유하는 OpenAI 호출 래퍼"""
+
+    def __init__(self, base_url: str = OPENAI_BASE_URL):
+        self.base_url = base_url
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """OpenAI 클라이언트 (openai 패키지는 첫 호출 시 로드)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import openai
+                    # 재시도는 직접 수행하여 횟수를 계측
+                    self._client = openai.OpenAI(api_key=OPENAI_API_KEY, base_url=self.base_url, max_retries=0)
+        return self._client
+
+    def complete(self, model: Optional[str], messages: List[Dict], max_completion_tokens: int,
+                 task: str = 'default', timeout: Optional[float] = None) -> str:
+        """
+        채팅 완성 API를 호출하고 응답 텍스트를 반환합니다.
+
+        Args:
+            model (Optional[str]): 사용할 모델명 (None이면 MODEL_ROUTES에 따라 작업별로 선택)
+            messages (List[Dict]): 대화 메시지 리스트
+            max_completion_tokens (int): 최대 응답 토큰 수
+            task (str): 작업 이름 (모델 라우팅과 계측에 사용: impact, summary, overall 등)
+            timeout (Optional[float]): 대기와 재시도를 포함한 최대 소요 시간 (초, 마감 시간 예산에서 계산)
+
+        Returns:
+            str: 응답 텍스트
+        """
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        if timeout is not None and timeout <= 0:
+            METRICS.inc('llm_deadline_skipped_total', task=task)
+            raise DeadlineExceeded("시간 예산이 남지 않아 LLM 호출을 건너뜁니다.")
+
+        # 라우팅할 때는 서킷이 열린 모델을 건너뛰고 다음 후보 모델을 사용
+        routed = model is None
+        candidates = MODEL_ROUTER.ranked(task) if routed else [model]
+        breaker = None
+        for candidate in candidates:
+            candidate_breaker = _breaker_for(candidate)
+            if candidate_breaker.allow():
+                model, breaker = candidate, candidate_breaker
+                break
+            METRICS.inc('llm_circuit_rejected_total', task=task, model=candidate)
+
+        # 모든 후보의 서킷이 열려 있으면 지연과 요청 대기 없이 바로 실패시켜 호출자가 폴백을 사용하게 함
+        if breaker is None:
+            raise LLMCircuitOpenError("LLM 서킷이 열려 있어 호출을 건너뜁니다.")
+
+        started = time.perf_counter()
+        try:
+            if not _llm_semaphore.acquire(timeout=_remaining(expires_at)):
+                METRICS.inc('llm_deadline_skipped_total', task=task)
+                raise DeadlineExceeded("LLM 동시 호출 대기 중 시간 예산을 모두 사용했습니다.")
+            try:
+                # Rate limit 방지를 위한 지연
+                delay = LLM_REQUEST_DELAY if expires_at is None else min(LLM_REQUEST_DELAY, _remaining(expires_at))
+                time.sleep(delay)
+
+                started = time.perf_counter()
+                response = self._create_with_retries(model, messages, max_completion_tokens, task, expires_at)
+            finally:
+                _llm_semaphore.release()
+        except DeadlineExceeded:
+            # 시간 예산 부족은 백엔드나 모델의 장애가 아니므로 서킷 실패와 모델 통계에 넣지 않음
+            breaker.release()
+            raise
+        except Exception as e:
+            # 장애성 오류(연결, 타임아웃, rate limit, 서버 오류)만 서킷 실패로 셈
+            # 잘못된 요청(400 등)은 호출자 문제이므로 다른 호출까지 막지 않음
+            if _is_outage(e):
+                breaker.record_failure()
+            else:
+                breaker.release()
+            if routed:
+                MODEL_ROUTER.record(task, model, time.perf_counter() - started, ok=False)
+            raise
+        breaker.record_success()
+        if routed:
+            MODEL_ROUTER.record(task, model, time.perf_counter() - started, ok=True)
+
+        METRICS.inc('llm_calls_total', task=task, model=model)
+        usage = getattr(response, 'usage', None)
+        if usage is not None:
+            METRICS.inc('llm_tokens_in_total', getattr(usage, 'prompt_tokens', 0) or 0, task=task, model=model)
+            METRICS.inc('llm_tokens_out_total', getattr(usage, 'completion_tokens', 0) or 0, task=task, model=model)
+
+        return response.choices[0].message.content.strip()
+
+    def _create_with_retries(self, model: str, messages: List[Dict], max_completion_tokens: int, task: str,
+                             expires_at: Optional[float] = None):
+        """
+        일시적인 오류(연결, 타임아웃, rate limit, 서버 오류)는 지수 백오프로 재시도합니다.
+
+        마감 시각이 있으면 남은 시간을 요청 타임아웃으로 쓰고, 백오프 후 시간이 남지 않으면 재시도하지 않습니다.
+        """
+        # 첫 호출의 openai 로드 시간이 요청 타임아웃에 더해져 예산을 넘지 않도록 클라이언트를 먼저 준비
+        client = self.client
+        attempt = 0
+        while True:
+            options = {}
+            if expires_at is not None:
+                remaining = _remaining(expires_at)
+                if remaining <= 0:
+                    raise DeadlineExceeded("LLM 응답을 기다릴 시간 예산이 남지 않았습니다.")
+                options['timeout'] = remaining
+
+            started = time.perf_counter()
+            try:
+                return client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_completion_tokens=max_completion_tokens,
+                    **options
+                )
+            except Exception as e:
+                METRICS.inc('llm_errors_total', task=task, model=model)
+                if expires_at is not None and _remaining(expires_at) <= 0:
+                    # 예산에 맞춰 줄인 타임아웃이 끝난 것이므로 백엔드 실패가 아닌 시간 초과로 처리
+                    raise DeadlineExceeded(f"LLM 응답 대기 중 시간 예산을 모두 사용했습니다: {e}") from e
+                backoff = LLM_RETRY_BACKOFF * (2 ** attempt)
+                if (attempt >= LLM_MAX_RETRIES or not _is_retryable(e) or
+                        (expires_at is not None and backoff >= _remaining(expires_at))):
+                    raise
+                attempt += 1
+                METRICS.inc('llm_retries_total', task=task, model=model)
+                log_event('llm_retry', task=task, model=model, attempt=attempt, error=str(e))
+                time.sleep(backoff)
+            finally:
+                METRICS.observe('llm_call_seconds', time.perf_counter() - started, task=task, model=model)
+
+
+def _remaining(expires_at: Optional[float]) -> Optional[float]:
+    """마감 시각까지 남은 시간 (마감 시각이 없으면 None)"""
+    if expires_at is None:
+        return None
+    return max(0.0, expires_at - time.monotonic())
+
+
+def _is_retryable(error: Exception) -> bool:
+    """재시도할 가치가 있는 오류인지 판단합니다."""
+    import openai
+
+    return isinstance(error, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError))
+
+
+def _is_outage(error: Exception) -> bool:
+    """백엔드 장애로 볼 오류인지 판단합니다 (재시도 대상 오류와 타임아웃)."""
+    return _is_retryable(error) or isinstance(error, (TimeoutError, ConnectionError))
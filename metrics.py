@@ -0,0 +1,261 @@
+"""
+파이프라인 계측 모듈
+
+단계별 실행 시간, 소스별 수집 지연, LLM 호출 수와 토큰 사용량, 재시도,
+캐시 적중률을 기록합니다. 기록된 지표는 다음 방식으로 확인할 수 있습니다.
+
+- Prometheus 텍스트 형식 (render_prometheus, dump, serve_metrics)
+- 구조화 로그 ('news_chatbot.metrics' 로거로 JSON 한 줄씩 출력)
+- 요청별 시간 분석 (trace_request로 감싼 구간의 결과를 result 딕셔너리에 첨부)
+"""
+
+import contextvars
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+METRIC_PREFIX = "newsbot_"
+
+logger = logging.getLogger('news_chatbot.metrics')
+
+# 현재 처리 중인 요청의 계측 정보 (스레드/컨텍스트별)
+_current_trace = contextvars.ContextVar('news_chatbot_trace', default=None)
+
+
+def _label_key(labels: Dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(label_key: tuple) -> str:
+    if not label_key:
+        return ""
+    parts = []
+    for name, value in label_key:
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class RequestTrace:
+    """한 번의 분석 요청 동안의 단계별 시간과 카운터"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings = {}
+        self.counters = {}
+
+    def add_time(self, name: str, seconds: float):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def add_count(self, name: str, value: float):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> Dict:
+        return {
+            'total': round(time.perf_counter() - self.started, 3),
+            'stages': {name: round(seconds, 3) for name, seconds in self.timings.items()},
+            'counters': dict(self.counters)
+        }
+
+
+class MetricsRegistry:
+    """프로세스 전체의 카운터와 요약(개수/합계/최댓값) 지표 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._summaries = {}
+        self._help = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """카운터를 증가시킵니다."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add_count(name + _format_labels(key[1]), value)
+
+    def observe(self, name: str, value: float, **labels):
+        """요약 지표에 관측값(주로 초 단위 시간)을 추가합니다."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            summary = self._summaries.setdefault(key, [0, 0.0, 0.0])
+            summary[0] += 1
+            summary[1] += value
+            summary[2] = max(summary[2], value)
+
+    def describe(self, name: str, help_text: str):
+        """Prometheus 출력에 사용할 지표 설명을 등록합니다."""
+        self._help[name] = help_text
+
+    def snapshot(self) -> Dict:
+        """현재 지표를 JSON으로 직렬화 가능한 딕셔너리로 반환합니다."""
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in self._counters.items()
+            ]
+            summaries = [
+                {'name': name, 'labels': dict(labels), 'count': s[0], 'sum': s[1], 'max': s[2]}
+                for (name, labels), s in self._summaries.items()
+            ]
+        return {'counters': counters, 'summaries': summaries}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 지표를 출력합니다."""
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            summaries = sorted(self._summaries.items())
+
+        seen = set()
+        for (name, labels), value in counters:
+            metric = METRIC_PREFIX + name
+            if metric not in seen:
+                seen.add(metric)
+                if name in self._help:
+                    lines.append(f"# HELP {metric} {self._help[name]}")
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_format_labels(labels)} {value}")
+
+        for (name, labels), (count, total, _) in summaries:
+            metric = METRIC_PREFIX + name
+            if metric not in seen:
+                seen.add(metric)
+                if name in self._help:
+                    lines.append(f"# HELP {metric} {self._help[name]}")
+                lines.append(f"# TYPE {metric} summary")
+            label_text = _format_labels(labels)
+            lines.append(f"{metric}_count{label_text} {count}")
+            lines.append(f"{metric}_sum{label_text} {total:.6f}")
+
+        # 최댓값은 별도의 gauge로 노출
+        for (name, labels), (_, _, maximum) in summaries:
+            metric = f"{METRIC_PREFIX}{name}_max"
+            if metric not in seen:
+                seen.add(metric)
+                lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric}{_format_labels(labels)} {maximum:.6f}")
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str):
+        """지표를 파일로 저장합니다 (.json이면 JSON, 그 외에는 Prometheus 텍스트)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.json'):
+                json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+            else:
+                f.write(self.render_prometheus())
+
+    def reset(self):
+        """모든 지표를 초기화합니다."""
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+# 프로세스 전체에서 공유하는 기본 지표 저장소
+METRICS = MetricsRegistry()
+METRICS.describe('stage_seconds', "파이프라인 단계별 실행 시간 (초)")
+METRICS.describe('fetch_seconds', "뉴스 소스별 수집 지연 (초)")
+METRICS.describe('fetch_errors_total', "뉴스 소스별 수집 실패 수")
+METRICS.describe('llm_calls_total', "LLM 호출 수")
+METRICS.describe('llm_errors_total', "실패한 LLM 호출 수")
+METRICS.describe('llm_retries_total', "LLM 호출 재시도 수")
+METRICS.describe('llm_tokens_in_total', "LLM 입력 토큰 수")
+METRICS.describe('llm_tokens_out_total', "LLM 출력 토큰 수")
+METRICS.describe('llm_call_seconds', "LLM 호출 지연 (초)")
+METRICS.describe('cache_requests_total', "캐시 조회 결과별 요청 수")
+METRICS.describe('llm_circuit_transitions_total', "LLM 서킷 브레이커 상태 전환 수")
+METRICS.describe('llm_circuit_rejected_total', "서킷이 열려 있어 건너뛴 LLM 호출 수")
+
+
+@contextmanager
+def trace_request():
+    """
+    분석 요청 하나의 계측 구간을 시작합니다.
+
+    구간 안에서 기록된 단계 시간과 카운터는 RequestTrace에 모입니다.
+    """
+    trace = RequestTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def stage(name: str, **fields):
+    """
+    파이프라인 단계의 실행 시간을 측정합니다.
+
+    같은 단계가 여러 번 실행되면 요청별 시간은 누적됩니다.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        METRICS.observe('stage_seconds', elapsed, stage=name)
+
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add_time(name, elapsed)
+
+        log_event('stage', stage=name, seconds=round(elapsed, 4), **fields)
+
+
+def record_cache(cache: str, result: str):
+    """캐시 조회 결과(hit/miss/stale 등)를 기록합니다."""
+    METRICS.inc('cache_requests_total', cache=cache, result=result)
+
+
+def log_event(event: str, **fields):
+    """구조화 로그를 JSON 한 줄로 남깁니다."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({'event': event, 'ts': time.time(), **fields},
+                               ensure_ascii=False, default=str))
+
+
+def enable_structured_logging(level: int = logging.INFO):
+    """계측 로그를 표준 에러로 출력하도록 설정합니다."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+def serve_metrics(port: int, host: str = '127.0.0.1'):
+    """
+    /metrics 경로로 Prometheus 형식 지표를 제공하는 HTTP 서버를 백그라운드로 실행합니다.
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown()으로 종료)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = METRICS.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,147 @@
+"""
+작업별 LLM 모델 라우팅
+
+중대성 평가, 개별 요약, 종합 요약마다 MODEL_ROUTES의 후보 모델을 우선순위대로 사용합니다.
+(작업, 모델)별 응답 지연과 오류율을 지수 이동 평균(EWMA)으로 추적하여, 지연이
+MODEL_LATENCY_TARGETS를 넘거나 오류율이 한도를 넘은 모델은 일정 시간 제외하고
+다음 후보로 전환합니다. 제외 시간이 지나면 통계를 초기화하고 다시 시도합니다.
+"""
+
+import threading
+import time
+from typing import Dict, List
+from config import (MODEL_NAME, MODEL_ROUTES, MODEL_LATENCY_TARGETS, MODEL_ROUTER_EWMA_ALPHA,
+                    MODEL_ROUTER_MAX_ERROR_RATE, MODEL_ROUTER_COOLDOWN)
+from metrics import METRICS, log_event
+
+
+class _ModelStats:
+    """(작업, 모델) 하나의 지연/오류율 이동 평균과 제외 상태"""
+
+    __slots__ = ('latency', 'error_rate', 'samples', 'demoted_until')
+
+    def __init__(self):
+        self.latency = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.demoted_until = 0.0
+
+
+class ModelRouter:
+    """작업별 후보 모델 중 현재 목표 지연과 오류율을 만족하는 모델을 고릅니다."""
+
+    def __init__(self, routes: Dict[str, List[str]] = MODEL_ROUTES,
+                 latency_targets: Dict[str, float] = MODEL_LATENCY_TARGETS,
+                 alpha: float = MODEL_ROUTER_EWMA_ALPHA, max_error_rate: float = MODEL_ROUTER_MAX_ERROR_RATE,
+                 cooldown: float = MODEL_ROUTER_COOLDOWN, default_model: str = MODEL_NAME):
+        self.routes = routes
+        self.latency_targets = latency_targets
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.default_model = default_model
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def candidates(self, task: str) -> List[str]:
+        """작업의 후보 모델 목록 (설정이 없으면 기본 모델 하나)"""
+        return list(self.routes.get(task) or [self.default_model])
+
+    def _get_stats(self, task: str, model: str) -> _ModelStats:
+        stats = self._stats.get((task, model))
+        if stats is None:
+            stats = self._stats[(task, model)] = _ModelStats()
+        return stats
+
+    def select(self, task: str) -> str:
+        """
+        작업에 사용할 모델을 고릅니다.
+
+        제외되지 않은 후보 중 우선순위가 가장 높은 모델을 반환하며,
+        모든 후보가 제외된 경우에는 가장 먼저 제외가 풀리는 모델을 반환합니다.
+
+        Args:
+            task (str): 작업 이름 (impact, summary, overall)
+
+        Returns:
+            str: 모델명
+        """
+        now = time.monotonic()
+        candidates = self.candidates(task)
+
+        with self._lock:
+            for model in candidates:
+                stats = self._get_stats(task, model)
+                if stats.demoted_until and stats.demoted_until <= now:
+                    # 제외 시간이 지나면 이전 통계를 버리고 다시 시도
+                    self._stats[(task, model)] = _ModelStats()
+                    stats = self._stats[(task, model)]
+                if stats.demoted_until <= now:
+                    return model
+
+            return min(candidates, key=lambda model: self._get_stats(task, model).demoted_until)
+
+    def ranked(self, task: str) -> List[str]:
+        """select()가 고른 모델을 맨 앞에 두고 나머지 후보를 우선순위대로 이어 붙인 목록"""
+        selected = self.select(task)
+        return [selected] + [model for model in self.candidates(task) if model != selected]
+
+    def record(self, task: str, model: str, seconds: float, ok: bool):
+        """
+        호출 결과를 기록하고, 목표를 벗어난 모델은 제외합니다.
+
+        Args:
+            task (str): 작업 이름
+            model (str): 호출한 모델명
+            seconds (float): 응답 지연 (초)
+            ok (bool): 호출 성공 여부
+        """
+        target = self.latency_targets.get(task)
+
+        with self._lock:
+            stats = self._get_stats(task, model)
+            stats.samples += 1
+            stats.error_rate = self.alpha * (0.0 if ok else 1.0) + (1 - self.alpha) * stats.error_rate
+            if ok:
+                stats.latency = seconds if stats.latency is None else (
+                    self.alpha * seconds + (1 - self.alpha) * stats.latency
+                )
+
+            reason = None
+            if stats.error_rate > self.max_error_rate:
+                reason = 'error_rate'
+            elif target is not None and stats.latency is not None and stats.latency > target:
+                reason = 'latency'
+
+            # 다른 후보가 있을 때만 제외 (후보가 하나뿐이면 계속 사용)
+            if reason and not stats.demoted_until and len(self.candidates(task)) > 1:
+                stats.demoted_until = time.monotonic() + self.cooldown
+            else:
+                reason = None
+
+        if reason:
+            METRICS.inc('model_failovers_total', task=task, model=model, reason=reason)
+            log_event('model_failover', task=task, model=model, reason=reason,
+                      latency=round(stats.latency or 0.0, 3), error_rate=round(stats.error_rate, 3))
+
+    def snapshot(self) -> Dict:
+        """작업별 현재 선택 모델과 후보별 통계 (결과 딕셔너리와 로그용)"""
+        now = time.monotonic()
+        snapshot = {}
+        for task in sorted(set(self.routes) | {task for task, _ in self._stats}):
+            models = {}
+            with self._lock:
+                for model in self.candidates(task):
+                    stats = self._get_stats(task, model)
+                    models[model] = {
+                        'latency': round(stats.latency, 3) if stats.latency is not None else None,
+                        'error_rate': round(stats.error_rate, 3),
+                        'samples': stats.samples,
+                        'demoted': stats.demoted_until > now
+                    }
+            snapshot[task] = {'selected': self.select(task), 'models': models}
+        return snapshot
+
+
+# 프로세스 전체에서 공유하는 모델 라우터
+MODEL_ROUTER = ModelRouter()
@@ -0,0 +1,85 @@
+from typing import Dict, Iterator, List
+
+
+class NewsArticle:
+    """
+    검색부터 요약까지 파이프라인 전체에서 사용하는 뉴스 기사 레코드
+
+    __slots__로 필드를 고정하여 기사마다 딕셔너리를 두는 것보다 메모리를 적게 쓰고
+    속성 접근이 빠릅니다. 기존 코드와의 호환을 위해 news.get('title'),
+    news['final_score'] = ..., 'summary' in news 같은 딕셔너리 방식 접근도 지원하며,
+    값이 설정되지 않은 필드는 딕셔너리에 키가 없는 것과 같이 동작합니다.
+    """
+
+    # 검색 단계에서 채워지는 필드
+    BASE_FIELDS = ('title', 'description', 'content', 'url', 'source', 'published_at', 'company')
+    # 평가/요약 단계에서 추가되는 필드
+    ENRICHED_FIELDS = ('reliability_score', 'impact_score', 'frequency_score', 'final_score',
+                       'summary', 'rank', 'cluster_id', 'cluster_size', 'story_representative', 'degraded')
+
+    __slots__ = BASE_FIELDS + ENRICHED_FIELDS
+
+    def __init__(self, title: str = '', description: str = '', content: str = '', url: str = '',
+                 source: str = '', published_at: str = '', company: str = '', **enriched):
+        self.title = title
+        self.description = description
+        self.content = content
+        self.url = url
+        self.source = source
+        self.published_at = published_at
+        self.company = company
+        for key, value in enriched.items():
+            self[key] = value
+
+    def to_dict(self) -> Dict:
+        """설정된 필드만 담은 딕셔너리를 반환합니다 (결과 형식용)."""
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+    # 딕셔너리 호환 인터페이스
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        if key not in self.__slots__:
+            raise KeyError(f"NewsArticle에 없는 필드입니다: {key}")
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and hasattr(self, key)
+
+    def keys(self) -> List[str]:
+        return [key for key in self.__slots__ if hasattr(self, key)]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __repr__(self) -> str:
+        return f"NewsArticle(title={self.title!r}, source={self.source!r}, url={self.url!r})"
+
+
+def mark_degraded(news, part: str):
+    """LLM 대신 폴백으로 채운 부분(impact, summary 등)을 기사의 degraded 목록에 기록합니다."""
+    degraded = news.get('degraded') or []
+    if part not in degraded:
+        news['degraded'] = degraded + [part]
+
+
+def is_degraded(news, part: str) -> bool:
+    """기사의 해당 부분이 폴백으로 채워졌는지 확인합니다."""
+    return part in (news.get('degraded') or ())
+
+
+def to_result_list(news_list: List) -> List[Dict]:
+    """기사 레코드 리스트를 기존 결과 형식(딕셔너리 리스트)으로 변환합니다."""
+    return [news.to_dict() if isinstance(news, NewsArticle) else news for news in news_list]
@@ -1,36 +1,88 @@
-import requests
-import feedparser
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+import threading
 import time
 import re
-from typing import List, Dict
-from config import NEWS_API_KEY, SEARCH_LANGUAGE, SEARCH_DAYS, MAX_NEWS_COUNT, TRUSTED_SOURCES
+from typing import Iterator, List, Dict, Optional
+from company_aliases import alias_matcher, newsapi_query
+from deadline import Deadline
+from metrics import METRICS, record_cache
+from news_article import NewsArticle
+from config import NEWS_API_KEY, NEWS_API_URL, RSS_FEEDS, SEARCH_LANGUAGE, SEARCH_DAYS, MAX_NEWS_COUNT, TRUSTED_SOURCES, NEWSAPI_MAX_PAGES, FEED_CACHE_TTL, FEED_PARSER, FEED_PARSER_WORKERS, FETCH_TIMEOUT, BODY_CACHE_ENABLED
 
 class NewsSearcher:
     def __init__(self):
         self.news_api_key = NEWS_API_KEY
+        self.news_api_url = NEWS_API_URL
+        self.rss_feeds = list(RSS_FEEDS)
+        self.newsapi_max_pages = NEWSAPI_MAX_PAGES
         self.search_days = SEARCH_DAYS
+        self.feed_cache_ttl = FEED_CACHE_TTL
+        self.feed_parser = FEED_PARSER
+        self.feed_parser_workers = FEED_PARSER_WORKERS
         
-    def search_news(self, company: str) -> List[Dict]:
+        # 여러 회사 분석 시 RSS 피드를 한 번만 다운로드하기 위한 캐시
+        self._feed_cache = {}
+        self._feed_locks = {}
+        self._feed_locks_guard = threading.Lock()
+        
+        # HTTP 세션은 첫 요청 시 생성하여 연결을 재사용
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # 기사 본문 디스크 캐시 (첫 본문 요청 시 생성)
+        self.body_cache_enabled = BODY_CACHE_ENABLED
+        self._body_cache = None
+        self._body_cache_lock = threading.Lock()
+        
+    def _get_session(self):
+        """연결 재사용을 위한 HTTP 세션을 반환합니다 (requests는 처음 사용할 때 로드)."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    self._session = requests.Session()
+        return self._session
+    
+    def _get_body_cache(self):
+        """기사 본문 캐시를 반환합니다 (사용하지 않거나 열 수 없으면 None)."""
+        if self.body_cache_enabled and self._body_cache is None:
+            with self._body_cache_lock:
+                if self._body_cache is None:
+                    try:
+                        from body_cache import BodyCache
+                        self._body_cache = BodyCache()
+                    except Exception as e:
+                        print(f"본문 캐시를 열 수 없어 사용하지 않습니다: {e}")
+                        self.body_cache_enabled = False
+        return self._body_cache
+    
+    def _timeout(self, deadline: Optional[Deadline]) -> float:
+        """요청 타임아웃 (마감 시간이 있으면 남은 시간을 넘지 않음)"""
+        return deadline.timeout(FETCH_TIMEOUT) if deadline is not None else FETCH_TIMEOUT
+    
+    def _has_time(self, deadline: Optional[Deadline]) -> bool:
+        """다음 수집 요청을 시작할 시간이 남았는지 확인합니다."""
+        return deadline is None or deadline.check('search')
+        
+    def search_news(self, company: str, deadline: Optional[Deadline] = None) -> List[NewsArticle]:
         """
         특정 회사에 대한 최근 뉴스를 검색합니다.
         
         Args:
             company (str): 검색할 회사명
+            deadline (Optional[Deadline]): 검색 단계의 시간 예산 (넘으면 남은 소스는 건너뜀)
             
         Returns:
-            List[Dict]: 뉴스 리스트
+            List[NewsArticle]: 뉴스 리스트
         """
         news_list = []
         
-        # NewsAPI를 통한 검색 (한국어 + 영어)
+        # NewsAPI를 통한 검색 (모든 별칭을 OR로 묶어 언어 구분 없이 한 번에 검색)
         if self.news_api_key and self.news_api_key != 'your_news_api_key_here':
-            news_list.extend(self._search_newsapi(company, 'ko'))  # 한국어 뉴스
-            news_list.extend(self._search_newsapi(company, 'en'))  # 영어 뉴스
+            news_list.extend(self._search_newsapi(company, deadline=deadline))
         
         # RSS 피드를 통한 검색 (백업)
-        news_list.extend(self._search_rss_feeds(company))
+        news_list.extend(self._search_rss_feeds(company, deadline))
         
         # 중복 제거 및 정렬
         news_list = self._deduplicate_news(news_list)
@@ -38,90 +90,235 @@ class NewsSearcher:
         
         return news_list
     
-    def _search_newsapi(self, company: str, language: str = 'ko') -> List[Dict]:
-        """NewsAPI를 통한 뉴스 검색"""
-        news_list = []
+    def iter_news(self, company: str, deadline: Optional[Deadline] = None) -> Iterator[NewsArticle]:
+        """
+        특정 회사에 대한 뉴스 후보를 개수 제한 없이 하나씩 생성합니다.
         
-        try:
-            # 최근 24시간 계산
-            from_date = (datetime.now() - timedelta(days=self.search_days)).strftime('%Y-%m-%d')
-            
-            url = "https://newsapi.org/v2/everything"
-            params = {
-                'q': company,
-                'from': from_date,
-                'language': language,
-                'sortBy': 'publishedAt',
-                'apiKey': self.news_api_key,
-                'pageSize': 50
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
+        search_news와 달리 MAX_NEWS_COUNT로 자르지 않으며, NewsAPI는 여러 페이지를
+        가져옵니다. 중복 제거는 소비하는 쪽(스트리밍 상위 k개 선택)에서 수행합니다.
+        
+        Args:
+            company (str): 검색할 회사명
+            deadline (Optional[Deadline]): 검색 단계의 시간 예산 (넘으면 남은 소스는 건너뜀)
             
-            data = response.json()
+        Yields:
+            NewsArticle: 뉴스 후보
+        """
+        if self.news_api_key and self.news_api_key != 'your_news_api_key_here':
+            yield from self._iter_newsapi(company, max_pages=self.newsapi_max_pages, deadline=deadline)
+        
+        yield from self._iter_rss_feeds(company, deadline, streaming=True)
+    
+    def _search_newsapi(self, company: str, language: Optional[str] = None,
+                        deadline: Optional[Deadline] = None) -> List[NewsArticle]:
+        """NewsAPI를 통한 뉴스 검색"""
+        return list(self._iter_newsapi(company, language, deadline=deadline))
+    
+    def _iter_newsapi(self, company: str, language: Optional[str] = None, max_pages: int = 1,
+                      deadline: Optional[Deadline] = None) -> Iterator[NewsArticle]:
+        """NewsAPI 검색 결과를 페이지 단위로 가져오며 하나씩 생성합니다 (language가 None이면 모든 언어)."""
+        page_size = 50
+        query = newsapi_query(company)
+        source = f'newsapi_{language}' if language else 'newsapi'
+        
+        for page in range(1, max_pages + 1):
+            if not self._has_time(deadline):
+                return
             
-            for article in data.get('articles', []):
-                news_item = {
-                    'title': article.get('title', ''),
-                    'description': article.get('description', ''),
-                    'content': article.get('content', ''),
-                    'url': article.get('url', ''),
-                    'source': article.get('source', {}).get('name', ''),
-                    'published_at': article.get('publishedAt', ''),
-                    'company': company
+            try:
+                # 최근 24시간 계산
+                from_date = (datetime.now() - timedelta(days=self.search_days)).strftime('%Y-%m-%d')
+                
+                url = self.news_api_url
+                params = {
+                    'q': query,
+                    'from': from_date,
+                    'sortBy': 'publishedAt',
+                    'apiKey': self.news_api_key,
+                    'pageSize': page_size
                 }
-                news_list.append(news_item)
+                if language:
+                    params['language'] = language
+                if page > 1:
+                    params['page'] = page
                 
-        except Exception as e:
-            print(f"NewsAPI 검색 중 오류 발생: {e}")
+                started = time.perf_counter()
+                try:
+                    response = self._get_session().get(url, params=params, timeout=self._timeout(deadline))
+                finally:
+                    METRICS.observe('fetch_seconds', time.perf_counter() - started, source=source)
+                response.raise_for_status()
+                
+                articles = response.json().get('articles', [])
+                
+                for article in articles:
+                    yield NewsArticle(
+                        title=article.get('title', ''),
+                        description=article.get('description', ''),
+                        content=article.get('content', ''),
+                        url=article.get('url', ''),
+                        source=article.get('source', {}).get('name', ''),
+                        published_at=article.get('publishedAt', ''),
+                        company=company
+                    )
+                
+            except Exception as e:
+                METRICS.inc('fetch_errors_total', source=source)
+                print(f"NewsAPI 검색 중 오류 발생: {e}")
+                return
             
-        return news_list
+            # 마지막 페이지
+            if len(articles) < page_size:
+                return
     
-    def _search_rss_feeds(self, company: str) -> List[Dict]:
+    def _search_rss_feeds(self, company: str, deadline: Optional[Deadline] = None) -> List[NewsArticle]:
         """RSS 피드를 통한 뉴스 검색"""
-        news_list = []
+        return list(self._iter_rss_feeds(company, deadline))
+    
+    def _iter_rss_feeds(self, company: str, deadline: Optional[Deadline] = None,
+                        streaming: bool = False) -> Iterator[NewsArticle]:
+        """
+        RSS 피드에서 회사 별칭이 포함된 뉴스를 하나씩 생성합니다.
         
-        # 주요 경제 뉴스 RSS 피드 (한국 + 해외)
-        rss_feeds = [
-            # 해외 뉴스
-            'https://feeds.reuters.com/reuters/businessNews',
-            'https://feeds.bloomberg.com/markets/news.rss',
-            'https://feeds.finance.yahoo.com/rss/2.0/headline',
-            'https://feeds.bbci.co.uk/news/business/rss.xml',
-            'https://rss.cnn.com/rss/money_latest.rss',
-            'https://feeds.marketwatch.com/marketwatch/topstories/',
-            # 한국 뉴스 (RSS 피드가 있는 경우)
-            'https://rss.joins.com/joins_news_list.xml',
-            'https://rss.donga.com/total.xml'
-        ]
-        
-        for feed_url in rss_feeds:
+        streaming이 True이면 프로세스 풀을 쓰지 않는 한 피드를 하나씩 받아 파싱하고 바로 생성하여,
+        메모리에는 피드 하나 분량만 남습니다.
+        """
+        if self.feed_parser == 'lxml':
             try:
-                feed = feedparser.parse(feed_url)
+                import lxml.etree  # noqa: F401
+            except ImportError:
+                print("lxml이 설치되어 있지 않아 feedparser로 RSS 피드를 파싱합니다.")
+            else:
+                yield from self._iter_rss_feeds_fast(company, deadline, streaming)
+                return
+        
+        for feed_url in self.rss_feeds:
+            if not self._has_time(deadline):
+                return
+            try:
+                yield from self._parse_with_feedparser(self._fetch_feed(feed_url, self._timeout(deadline)), company)
+            except Exception as e:
+                METRICS.inc('fetch_errors_total', source=feed_url)
+                print(f"RSS 피드 {feed_url} 검색 중 오류: {e}")
+    
+    def _iter_rss_feeds_fast(self, company: str, deadline: Optional[Deadline] = None,
+                             streaming: bool = False) -> Iterator[NewsArticle]:
+        """
+        lxml 스트리밍 파서로 RSS 피드를 파싱합니다.
+        
+        피드가 많거나 크면 모두 받은 뒤 프로세스 풀에서 한 번에 파싱합니다. 스트리밍 모드에서는
+        피드 수만으로 프로세스 풀 사용을 정하고, 쓰지 않으면 피드마다 받아서 바로 파싱합니다.
+        lxml로 읽을 수 없는 피드는 feedparser로 다시 파싱합니다.
+        """
+        from fast_feed_parser import parse_feed, parse_feeds, should_use_pool
+        
+        if streaming and not should_use_pool(self.rss_feeds, self.feed_parser_workers, check_size=False):
+            for feed_url in self.rss_feeds:
+                if not self._has_time(deadline):
+                    return
+                try:
+                    data = self._fetch_feed(feed_url, self._timeout(deadline))
+                except Exception as e:
+                    METRICS.inc('fetch_errors_total', source=feed_url)
+                    print(f"RSS 피드 {feed_url} 검색 중 오류: {e}")
+                    continue
                 
-                for entry in feed.entries:
-                    # 회사명이 제목이나 요약에 포함된 경우만
-                    if (company.lower() in entry.title.lower() or 
-                        company.lower() in entry.get('summary', '').lower()):
-                        
-                        news_item = {
-                            'title': entry.title,
-                            'description': entry.get('summary', ''),
-                            'content': entry.get('content', [{}])[0].get('value', '') if entry.get('content') else '',
-                            'url': entry.link,
-                            'source': feed.feed.get('title', 'RSS Feed'),
-                            'published_at': entry.get('published', ''),
-                            'company': company
-                        }
-                        news_list.append(news_item)
-                        
+                started = time.perf_counter()
+                try:
+                    parsed, error = parse_feed(data, company), None
+                except Exception as e:
+                    parsed, error = None, f"{type(e).__name__}: {e}"
+                METRICS.observe('feed_parse_seconds', time.perf_counter() - started, parser='lxml')
+                yield from self._feed_articles(feed_url, data, parsed, error, company)
+            return
+        
+        feed_urls, payloads = [], []
+        for feed_url in self.rss_feeds:
+            if not self._has_time(deadline):
+                break
+            try:
+                payloads.append(self._fetch_feed(feed_url, self._timeout(deadline)))
+                feed_urls.append(feed_url)
+            except Exception as e:
+                METRICS.inc('fetch_errors_total', source=feed_url)
+                print(f"RSS 피드 {feed_url} 검색 중 오류: {e}")
+        
+        if not payloads:
+            return
+        
+        parser = 'lxml_pool' if should_use_pool(payloads, self.feed_parser_workers) else 'lxml'
+        started = time.perf_counter()
+        parsed_feeds = parse_feeds(payloads, company, self.feed_parser_workers)
+        METRICS.observe('feed_parse_seconds', time.perf_counter() - started, parser=parser)
+        
+        for feed_url, data, (parsed, error) in zip(feed_urls, payloads, parsed_feeds):
+            yield from self._feed_articles(feed_url, data, parsed, error, company)
+    
+    def _feed_articles(self, feed_url: str, data: bytes, parsed: Optional[Dict], error: Optional[str],
+                       company: str) -> Iterator[NewsArticle]:
+        """lxml 파싱 결과를 뉴스로 변환합니다. 파싱에 실패한 피드는 feedparser로 다시 파싱합니다."""
+        if error is not None:
+            print(f"RSS 피드 {feed_url} 파싱 중 오류: {error} (feedparser로 재시도)")
+            try:
+                yield from self._parse_with_feedparser(data, company)
             except Exception as e:
+                METRICS.inc('fetch_errors_total', source=feed_url)
                 print(f"RSS 피드 {feed_url} 검색 중 오류: {e}")
+            return
+        
+        for entry in parsed['entries']:
+            yield NewsArticle(source=parsed['title'], company=company, **entry)
+    
+    def _parse_with_feedparser(self, data: bytes, company: str) -> Iterator[NewsArticle]:
+        """feedparser로 피드 원문 하나를 파싱하여 회사 별칭이 포함된 뉴스를 생성합니다."""
+        import feedparser
+        
+        feed = feedparser.parse(data)
+        matcher = alias_matcher(company)
+        
+        for entry in feed.entries:
+            # 회사 별칭(다른 언어 이름, 티커 포함)이 제목이나 요약에 포함된 경우만
+            if matcher.matches(entry.title, entry.get('summary', '')):
                 
-        return news_list
+                yield NewsArticle(
+                    title=entry.title,
+                    description=entry.get('summary', ''),
+                    content=entry.get('content', [{}])[0].get('value', '') if entry.get('content') else '',
+                    url=entry.link,
+                    source=feed.feed.get('title', 'RSS Feed'),
+                    # 게시 시각이 없으면 수정 시각 사용 (Atom updated, dc:date - lxml 파서와 같은 규칙)
+                    published_at=entry.get('published') or entry.get('updated', ''),
+                    company=company
+                )
     
-    def _deduplicate_news(self, news_list: List[Dict]) -> List[Dict]:
+    def _fetch_feed(self, feed_url: str, timeout: float = FETCH_TIMEOUT) -> bytes:
+        """
+        RSS 피드 원문을 다운로드합니다.
+        
+        캐시 유효 시간 내에는 다운로드한 내용을 재사용하며,
+        같은 피드를 여러 스레드가 동시에 요청하면 한 번만 다운로드합니다.
+        """
+        with self._feed_locks_guard:
+            lock = self._feed_locks.setdefault(feed_url, threading.Lock())
+        
+        with lock:
+            cached = self._feed_cache.get(feed_url)
+            if cached and time.time() - cached[0] <= self.feed_cache_ttl:
+                record_cache('feed', 'hit')
+                return cached[1]
+            
+            record_cache('feed', 'miss')
+            started = time.perf_counter()
+            try:
+                response = self._get_session().get(feed_url, timeout=timeout)
+            finally:
+                METRICS.observe('fetch_seconds', time.perf_counter() - started, source=feed_url)
+            response.raise_for_status()
+            
+            self._feed_cache[feed_url] = (time.time(), response.content)
+            return response.content
+    
+    def _deduplicate_news(self, news_list: List[NewsArticle]) -> List[NewsArticle]:
         """중복 뉴스 제거"""
         seen_urls = set()
         unique_news = []
@@ -134,9 +331,21 @@ class NewsSearcher:
         return unique_news
     
     def get_news_content(self, url: str) -> str:
-        """뉴스 URL에서 전체 내용을 추출합니다."""
+        """뉴스 URL에서 전체 내용을 추출합니다 (이전에 추출한 본문은 디스크 캐시에서 읽음)."""
+        body_cache = self._get_body_cache()
+        if body_cache is not None:
+            cached = body_cache.get(url)
+            if cached is not None:
+                return cached
+        
         try:
-            response = requests.get(url, timeout=10)
+            from bs4 import BeautifulSoup
+            
+            started = time.perf_counter()
+            try:
+                response = self._get_session().get(url, timeout=FETCH_TIMEOUT)
+            finally:
+                METRICS.observe('fetch_seconds', time.perf_counter() - started, source='article_body')
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -162,8 +371,15 @@ class NewsSearcher:
                 # 모든 텍스트 추출
                 content = soup.get_text(strip=True)
             
-            return content[:2000]  # 최대 2000자로 제한
+            content = content[:2000]  # 최대 2000자로 제한
+            if content and body_cache is not None:
+                try:
+                    body_cache.put(url, content)
+                except Exception as e:
+                    print(f"본문 캐시 저장 중 오류: {e}")
+            return content
             
         except Exception as e:
+            METRICS.inc('fetch_errors_total', source='article_body')
             print(f"뉴스 내용 추출 중 오류: {e}")
             return ""
@@ -0,0 +1,271 @@
+import atexit
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+import config
+from config import (
+    RESULT_CACHE_BACKEND, RESULT_CACHE_TTL, RESULT_CACHE_STALE_TTL,
+    RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_PATH
+)
+
+# 결과에 영향을 주는 설정값들 (이 값이 바뀌면 캐시 키도 바뀜)
+FINGERPRINT_SETTINGS = [
+    'MODEL_NAME', 'MODEL_ROUTES', 'TEMPERATURE', 'SEARCH_LANGUAGE', 'SEARCH_DAYS',
+    'MAX_NEWS_COUNT', 'WEIGHTS', 'TRUSTED_SOURCES', 'IMPORTANCE_KEYWORDS', 'COMPANY_ALIASES'
+]
+
+
+def config_fingerprint() -> str:
+    """분석 결과에 영향을 주는 설정값들의 해시를 계산합니다."""
+    settings = {name: getattr(config, name, None) for name in FINGERPRINT_SETTINGS}
+    encoded = json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+class MemoryLRUBackend:
+    """프로세스 메모리에 결과를 보관하는 LRU 캐시 백엔드"""
+
+    def __init__(self, max_entries: int = RESULT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteBackend:
+    """SQLite 파일에 결과를 보관하는 영구 캐시 백엔드 (프로세스 재시작 후에도 유지)"""
+
+    def __init__(self, path: str = RESULT_CACHE_PATH, max_entries: int = RESULT_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        import sqlite3
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, accessed_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return {'stored_at': row[0], 'value': json.loads(row[1])}
+
+    def set(self, key: str, entry: Dict):
+        value = json.dumps(entry['value'], ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, stored_at, accessed_at, value) VALUES (?, ?, ?, ?)",
+                (key, entry['stored_at'], time.time(), value)
+            )
+            # 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+            self._conn.execute(
+                "DELETE FROM results WHERE key NOT IN "
+                "(SELECT key FROM results ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+def create_backend(name: str = RESULT_CACHE_BACKEND):
+    """설정된 이름에 맞는 캐시 백엔드를 생성합니다."""
+    if name == 'memory':
+        return MemoryLRUBackend()
+    if name == 'sqlite':
+        return SQLiteBackend()
+    raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {name}")
+
+
+class _Flight:
+    """같은 키에 대해 진행 중인 동기 계산 (동시에 들어온 요청은 끝나기를 기다려 결과를 공유)"""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultCache:
+    """
+    TTL과 stale-while-revalidate를 지원하는 분석 결과 캐시
+
+    - TTL 이내: 캐시된 결과를 그대로 반환 ('hit')
+    - TTL 이후 stale_ttl 이내: 오래된 결과를 즉시 반환하고 백그라운드에서 갱신 ('stale')
+    - 그 이후 또는 캐시 없음: 동기적으로 계산 후 저장 ('miss').
+      같은 키의 계산이 이미 진행 중이면 새로 계산하지 않고 그 결과를 기다려 받음
+    """
+
+    def __init__(self, backend=None, ttl: float = RESULT_CACHE_TTL,
+                 stale_ttl: float = RESULT_CACHE_STALE_TTL):
+        self.backend = backend if backend is not None else create_backend()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._refreshing = set()
+        self._refresh_threads = set()
+        self._refresh_lock = threading.Lock()
+        self._exit_hook_registered = False
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+
+    def make_key(self, company: str, **options) -> str:
+        """회사명, 실행 옵션, 설정값으로 캐시 키를 만듭니다."""
+        option_text = json.dumps(options, sort_keys=True, default=str)
+        return f"{company.strip().lower()}|{option_text}|{config_fingerprint()}"
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict],
+                       cacheable: Optional[Callable[[Dict], bool]] = None) -> Tuple[Dict, str, float]:
+        """
+        캐시에서 결과를 찾고, 없거나 만료되었으면 compute로 계산합니다.
+
+        Args:
+            key (str): 캐시 키
+            compute (Callable): 결과를 계산하는 함수 (예외 발생 시 캐시하지 않음)
+            cacheable (Optional[Callable]): 계산 결과를 저장할지 판단하는 함수 (False면 저장하지 않음)
+
+        Returns:
+            Tuple[Dict, str, float]: (결과, 캐시 상태, 캐시 나이(초))
+        """
+        entry = self.backend.get(key)
+        now = time.time()
+
+        if entry is not None:
+            age = now - entry['stored_at']
+            if age <= self.ttl:
+                return copy.deepcopy(entry['value']), 'hit', age
+            if age <= self.ttl + self.stale_ttl:
+                self._refresh_in_background(key, compute, cacheable)
+                return copy.deepcopy(entry['value']), 'stale', age
+
+        return self._compute_once(key, compute, cacheable), 'miss', 0.0
+
+    def _compute_once(self, key: str, compute: Callable[[], Dict],
+                      cacheable: Optional[Callable[[Dict], bool]] = None) -> Dict:
+        """같은 키에 대해 동시에 들어온 캐시 미스는 한 번만 계산하고 결과(또는 예외)를 나누어 받습니다."""
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        try:
+            value = compute()
+            if cacheable is None or cacheable(value):
+                self.backend.set(key, {'stored_at': time.time(), 'value': copy.deepcopy(value)})
+            # 호출자가 결과를 고치기 전에 기다리는 요청에 넘겨줄 사본을 만들어 둠
+            flight.value = copy.deepcopy(value)
+            return value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, key: str):
+        """캐시 항목을 삭제합니다."""
+        self.backend.delete(key)
+
+    def _refresh_in_background(self, key: str, compute: Callable[[], Dict],
+                               cacheable: Optional[Callable[[Dict], bool]] = None):
+        """같은 키에 대해 하나의 백그라운드 갱신만 실행합니다."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = compute()
+                if cacheable is None or cacheable(value):
+                    self.backend.set(key, {'stored_at': time.time(), 'value': copy.deepcopy(value)})
+            except Exception as e:
+                print(f"캐시 백그라운드 갱신 중 오류: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+                    self._refresh_threads.discard(threading.current_thread())
+
+        thread = threading.Thread(target=refresh, daemon=True)
+        with self._refresh_lock:
+            self._refresh_threads.add(thread)
+            # 명령행 1회 실행처럼 결과 출력 직후 종료하는 경우에도 갱신 결과가 저장되도록 종료 시 대기
+            if not self._exit_hook_registered:
+                atexit.register(self._wait_at_exit)
+                self._exit_hook_registered = True
+        thread.start()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> bool:
+        """
+        진행 중인 백그라운드 갱신이 끝날 때까지 기다립니다.
+
+        Args:
+            timeout (Optional[float]): 최대 대기 시간 (초, None이면 끝날 때까지)
+
+        Returns:
+            bool: 모든 갱신이 끝났으면 True
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._refresh_lock:
+            threads = list(self._refresh_threads)
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in threads)
+
+    def _wait_at_exit(self):
+        with self._refresh_lock:
+            pending = len(self._refresh_threads)
+        if pending:
+            print("캐시 백그라운드 갱신이 끝나기를 기다리는 중...")
+            self.wait_for_refreshes()
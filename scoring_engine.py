@@ -0,0 +1,148 @@
+"""
+벡터화된 배치 점수 계산 엔진
+
+뉴스 단위 파이썬 루프 대신 구성 요소 점수(신뢰성, 중대성, 빈도)를 NumPy 배열로 모아
+가중치를 한 번의 벡터 연산으로 적용하고, 상위 k개는 argpartition으로 선택합니다.
+numpy/scikit-learn은 시작 시간을 위해 실제 계산 시점에 로드합니다.
+"""
+
+from typing import Dict, List, Sequence
+from config import WEIGHTS
+
+# 가중치 벡터의 구성 요소 순서
+COMPONENTS = ('reliability', 'impact', 'frequency')
+
+
+class BatchScorer:
+    """구성 요소 점수 결합, 빈도 점수, 상위 k개 선택을 배열 단위로 수행합니다."""
+
+    def __init__(self, weights: Dict = WEIGHTS, similarity_threshold: float = 0.3,
+                 max_features: int = 100, chunk_size: int = 2048):
+        self.weights = weights
+        self.similarity_threshold = similarity_threshold
+        self.max_features = max_features
+        self.chunk_size = chunk_size
+
+    def combine(self, reliability: Sequence[float], impact: Sequence[float], frequency: Sequence[float]):
+        """
+        구성 요소 점수에 가중치를 적용하여 최종 점수를 계산합니다.
+
+        Args:
+            reliability, impact, frequency: 뉴스별 구성 요소 점수 (길이 n)
+
+        Returns:
+            np.ndarray: 최종 점수 (길이 n)
+        """
+        import numpy as np
+
+        components = np.column_stack([
+            np.asarray(reliability, dtype=np.float64),
+            np.asarray(impact, dtype=np.float64),
+            np.asarray(frequency, dtype=np.float64)
+        ])
+        weight_vector = np.array([self.weights[name] for name in COMPONENTS], dtype=np.float64)
+        return components @ weight_vector
+
+    def frequency_scores(self, texts: List[str]):
+        """
+        유사한 뉴스의 빈도 점수를 한 번에 계산합니다.
+
+        TF-IDF를 한 번만 학습하고, 코사인 유사도 행렬을 행 단위 청크로 계산하여
+        자기 자신을 제외하고 유사도가 임계값을 넘는 뉴스 수를 (n-1)로 나눕니다.
+
+        Args:
+            texts (List[str]): 뉴스별 비교 텍스트 (제목 + 설명)
+
+        Returns:
+            np.ndarray: 빈도 점수 (0-1)
+        """
+        import numpy as np
+
+        n = len(texts)
+        if n <= 1:
+            return np.full(n, 0.5)
+
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        try:
+            vectorizer = TfidfVectorizer(max_features=self.max_features, stop_words=None)
+            tfidf_matrix = vectorizer.fit_transform(texts)
+        except ValueError as e:
+            # 어휘가 비어 있는 경우 등
+            print(f"빈도 점수 계산 중 오류: {e}")
+            return np.full(n, 0.5)
+
+        # TF-IDF 벡터는 L2 정규화되어 있으므로 내적이 곧 코사인 유사도
+        similar_counts = np.empty(n, dtype=np.int64)
+        transposed = tfidf_matrix.T.tocsc()
+        for start in range(0, n, self.chunk_size):
+            block = tfidf_matrix[start:start + self.chunk_size] @ transposed
+            above = (block > self.similarity_threshold).sum(axis=1).A1
+            # 가장 유사한 항목(보통 자기 자신)은 제외
+            row_max = block.max(axis=1).toarray().ravel()
+            similar_counts[start:start + self.chunk_size] = above - (row_max > self.similarity_threshold)
+
+        return np.minimum(similar_counts / (n - 1), 1.0)
+
+    @staticmethod
+    def cluster_frequency_scores(cluster_sizes: Sequence[int]):
+        """
+        스토리 클러스터 크기로 빈도 점수를 계산합니다.
+
+        같은 스토리의 다른 기사 수(크기 - 1)를 (n-1)로 나누어 frequency_scores와 같은 척도를 씁니다.
+
+        Args:
+            cluster_sizes (Sequence[int]): 뉴스별 소속 클러스터 크기
+
+        Returns:
+            np.ndarray: 빈도 점수 (0-1)
+        """
+        import numpy as np
+
+        sizes = np.asarray(cluster_sizes, dtype=np.float64)
+        n = len(sizes)
+        if n <= 1:
+            return np.full(n, 0.5)
+        return np.minimum((sizes - 1) / (n - 1), 1.0)
+
+    @staticmethod
+    def top_k_indices(scores, k: int):
+        """
+        점수가 높은 상위 k개의 인덱스를 내림차순으로 반환합니다.
+
+        argpartition으로 O(n)에 후보를 고르고 k개만 정렬하며,
+        동점은 원래 순서를 유지하여 안정 정렬과 같은 결과를 냅니다.
+        """
+        import numpy as np
+
+        scores = np.asarray(scores, dtype=np.float64)
+        n = len(scores)
+        if k <= 0 or n == 0:
+            return np.empty(0, dtype=np.int64)
+        if k >= n:
+            return np.argsort(-scores, kind='stable')
+
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        threshold = scores[candidates].min()
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+        chosen = np.sort(np.concatenate([above, ties]))
+        return chosen[np.argsort(-scores[chosen], kind='stable')]
+
+    @staticmethod
+    def rank_order(scores, k: int):
+        """
+        상위 k개는 argpartition으로, 나머지는 NumPy 안정 정렬로 배치한 전체 순서를 반환합니다.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (상위 k개 인덱스, 나머지 인덱스)
+        """
+        import numpy as np
+
+        scores = np.asarray(scores, dtype=np.float64)
+        top = BatchScorer.top_k_indices(scores, k)
+        mask = np.ones(len(scores), dtype=bool)
+        mask[top] = False
+        rest = np.flatnonzero(mask)
+        rest = rest[np.argsort(-scores[rest], kind='stable')]
+        return top, rest
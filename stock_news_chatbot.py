@@ -7,6 +7,8 @@
 
 사용법:
     python stock_news_chatbot.py
+    python stock_news_chatbot.py --interactive
+    python stock_news_chatbot.py --watchlist watchlist.txt --output results.jsonl
 
 또는
 
@@ -15,97 +17,303 @@
     result = chatbot.search_and_summarize("삼성전자")
 """
 
+import argparse
 import os
 import sys
+import threading
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
-import openai
 
 # 로컬 모듈 import
 from news_search import NewsSearcher
 from importance_evaluator import ImportanceEvaluator
 from summarizer import NewsSummarizer
-from config import OPENAI_API_KEY, MODEL_NAME, TARGET_COMPANY
+from result_cache import ResultCache
+from analysis_state import AnalysisStateStore
+from news_article import to_result_list, is_degraded
+from streaming_topk import StreamingTopK
+from llm_client import llm_circuit_state
+from model_router import MODEL_ROUTER
+from deadline import Deadline
+from story_clustering import StoryClusterer
+from metrics import METRICS, trace_request, stage, record_cache, log_event, enable_structured_logging, serve_metrics
+from watchlist_batch import load_watchlist, run_watchlist
+from config import (MODEL_ROUTES, TARGET_COMPANY, RESULT_CACHE_ENABLED, BATCH_MAX_WORKERS, STREAM_TOP_K, ENABLE_STORY_CLUSTERING,
+                    ANALYSIS_DEADLINE, DEADLINE_STAGE_SHARES)
 
 class StockNewsChatbot:
     def __init__(self):
         """주식 뉴스 챗봇 초기화"""
-        # OpenAI API 설정
-        openai.api_key = OPENAI_API_KEY
-        self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
-        
-        # 모듈 초기화
+        # 모듈 초기화 (OpenAI 클라이언트와 무거운 라이브러리는 처음 사용할 때 생성/로드)
         self.news_searcher = NewsSearcher()
         self.importance_evaluator = ImportanceEvaluator()
         self.summarizer = NewsSummarizer()
         
+        # 결과 캐시 및 증분 분석 상태 저장소 초기화
+        self.result_cache = ResultCache() if RESULT_CACHE_ENABLED else None
+        self.state_store = AnalysisStateStore()
+        self.stream_top_k = STREAM_TOP_K
+        self.story_clusterer = StoryClusterer() if ENABLE_STORY_CLUSTERING else None
+        
         print("주식 뉴스 챗봇이 초기화되었습니다!")
-        print(f"사용 모델: {MODEL_NAME}")
+        print("사용 모델: " + ", ".join(f"{task} {models[0]}" for task, models in MODEL_ROUTES.items()))
         print("=" * 50)
     
-    def search_and_summarize(self, company: str) -> Dict:
+    def search_and_summarize(self, company: str, use_cache: bool = True, incremental: bool = False,
+                             streaming: bool = False, deadline: Optional[float] = ANALYSIS_DEADLINE,
+                             refresh: bool = False) -> Dict:
         """
         특정 회사에 대한 뉴스를 검색하고 요약합니다.
         
         Args:
             company (str): 검색할 회사명
+            use_cache (bool): 결과 캐시 사용 여부
+            incremental (bool): 이전 실행 결과를 재사용하여 새 뉴스만 평가/요약
+            streaming (bool): 개수 제한 없이 후보를 스트리밍하며 저비용 점수 상위 k개만 정밀 평가
+            deadline (Optional[float]): 전체 시간 예산 (초). 넘으면 남은 평가와 요약은 폴백으로 대체
+            refresh (bool): 캐시된 결과를 지우고 다시 분석하여 캐시에 저장
             
         Returns:
             Dict: 검색 결과 및 요약 정보
         """
-        print(f"'{company}'에 대한 최근 뉴스를 검색 중...")
-        
         try:
-            # 1. 뉴스 검색
-            news_list = self.news_searcher.search_news(company)
-            
-            if not news_list:
-                return {
-                    'company': company,
-                    'search_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'total_news': 0,
-                    'message': f"'{company}'에 대한 최근 뉴스를 찾을 수 없습니다.",
-                    'news_list': [],
-                    'overall_summary': ""
-                }
-            
-            print(f"총 {len(news_list)}개의 뉴스를 찾았습니다.")
-            
-            # 2. 중요도 평가
-            print("뉴스 중요도를 평가 중...")
-            evaluated_news = self.importance_evaluator.evaluate_news_importance(news_list)
+            if use_cache and self.result_cache is not None:
+                key = self.result_cache.make_key(company, incremental=incremental, streaming=streaming)
+                if refresh:
+                    self.result_cache.invalidate(key)
+                # 폴백으로 채운 부분이 있거나 뉴스가 없는 결과(소스 장애 포함)는 캐시하지 않아 다음 요청에서 다시 분석
+                result, status, age = self.result_cache.get_or_compute(
+                    key, lambda: self._analyze(company, incremental, streaming, deadline),
+                    cacheable=lambda value: not value.get('degraded') and value.get('total_news', 0) > 0
+                )
+                record_cache('result', status)
+                if status != 'miss':
+                    print(f"캐시된 결과를 사용합니다 ({status}, {age:.0f}초 전)")
+                result['cache'] = {'status': status, 'age': round(age, 1)}
+                return result
             
-            # 3. 뉴스 요약
-            print("뉴스를 요약 중...")
-            summarized_news = self.summarizer.summarize_news(evaluated_news)
+            return self._analyze(company, incremental, streaming, deadline)
             
-            # 4. 종합 요약 생성
-            print("종합 요약을 생성 중...")
-            overall_summary = self.summarizer.generate_overall_summary(summarized_news)
-            # print(f"DEBUG: 생성된 종합 요약: '{overall_summary}'")
-            
-            result = {
+        except Exception as e:
+            print(f"오류가 발생했습니다: {e}")
+            return {
                 'company': company,
                 'search_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'total_news': len(news_list),
-                'message': f"'{company}'에 대한 {len(news_list)}개의 뉴스를 분석했습니다.",
-                'news_list': summarized_news,
-                'overall_summary': overall_summary
+                'total_news': 0,
+                'message': f"오류가 발생했습니다: {str(e)}",
+                'news_list': [],
+                'overall_summary': "",
+                'error': str(e)
             }
+    
+    def _analyze(self, company: str, incremental: bool = False, streaming: bool = False,
+                 deadline: Optional[float] = None) -> Dict:
+        """
+        전체 파이프라인을 계측하며 실행하고, 단계별 시간 분석을 결과에 첨부합니다.
+        
+        Args:
+            company (str): 검색할 회사명
+            incremental (bool): 이전 실행 결과를 재사용하여 새 뉴스만 평가/요약
+            streaming (bool): 후보를 스트리밍하며 저비용 점수 상위 k개만 정밀 평가
+            deadline (Optional[float]): 전체 시간 예산 (초, None이면 제한 없음)
             
-            print("분석이 완료되었습니다!")
-            return result
+        Returns:
+            Dict: 검색 결과 및 요약 정보 ('timings' 포함)
+        """
+        with trace_request() as trace:
+            result = self._run_pipeline(company, incremental, streaming, Deadline(deadline))
+        
+        result['timings'] = trace.to_dict()
+        # 뉴스 소스 수집 실패 수 (NewsSearcher는 소스별 오류를 건너뛰므로 결과에 따로 표시)
+        fetch_errors = sum(value for name, value in trace.counters.items() if name.startswith('fetch_errors_total'))
+        if fetch_errors:
+            result['fetch_errors'] = fetch_errors
+        log_event('analysis', company=company, total_news=result['total_news'], **result['timings'])
+        return result
+    
+    def _run_pipeline(self, company: str, incremental: bool = False, streaming: bool = False,
+                      deadline: Optional[Deadline] = None) -> Dict:
+        """
+        뉴스 검색부터 종합 요약까지 전체 파이프라인을 실행합니다.
+        
+        시간 예산이 있으면 단계마다 남은 시간의 DEADLINE_STAGE_SHARES 비율을 하위 예산으로 나누어 줍니다.
+        
+        Args:
+            company (str): 검색할 회사명
+            incremental (bool): 이전 실행 결과를 재사용하여 새 뉴스만 평가/요약
+            streaming (bool): 후보를 스트리밍하며 저비용 점수 상위 k개만 정밀 평가
+            deadline (Optional[Deadline]): 전체 시간 예산
             
-        except Exception as e:
-            print(f"오류가 발생했습니다: {e}")
+        Returns:
+            Dict: 검색 결과 및 요약 정보
+        """
+        if deadline is None:
+            deadline = Deadline()
+        
+        print(f"'{company}'에 대한 최근 뉴스를 검색 중...")
+        
+        # 1. 뉴스 검색 (스트리밍 모드에서는 저비용 점수 상위 k개만 남김)
+        stream_stats = None
+        with stage('search'):
+            search_deadline = deadline.child(DEADLINE_STAGE_SHARES['search'])
+            if streaming:
+                news_list, stream_stats = self._stream_candidates(company, search_deadline)
+            else:
+                news_list = self.news_searcher.search_news(company, search_deadline)
+        
+        if not news_list:
             return {
                 'company': company,
                 'search_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'total_news': 0,
-                'message': f"오류가 발생했습니다: {str(e)}",
+                'message': f"'{company}'에 대한 최근 뉴스를 찾을 수 없습니다.",
                 'news_list': [],
                 'overall_summary': ""
             }
+        
+        if stream_stats:
+            print(f"후보 {stream_stats['candidates_scanned']}개 중 상위 {len(news_list)}개를 정밀 평가합니다.")
+        else:
+            print(f"총 {len(news_list)}개의 뉴스를 찾았습니다.")
+        
+        # 같은 사건을 다룬 기사를 스토리로 묶어 대표 기사만 LLM으로 평가/요약
+        story_count = None
+        if self.story_clusterer:
+            with stage('clustering'):
+                story_count = self.story_clusterer.cluster(news_list, company)
+            METRICS.inc('story_clusters_total', story_count)
+            print(f"{story_count}개의 스토리로 묶었습니다.")
+        
+        # 이전 실행에서 처리한 뉴스의 점수와 요약 재사용
+        if incremental:
+            state = self.state_store.load(company)
+            new_count = self._apply_previous_state(news_list, state)
+            METRICS.inc('incremental_articles_total', new_count, kind='new')
+            METRICS.inc('incremental_articles_total', len(news_list) - new_count, kind='reused')
+            print(f"새 뉴스 {new_count}개, 이전 분석 재사용 {len(news_list) - new_count}개")
+        
+        # 2. 중요도 평가
+        print("뉴스 중요도를 평가 중...")
+        with stage('importance'):
+            evaluated_news = self.importance_evaluator.evaluate_news_importance(
+                news_list, reuse_scores=incremental, deadline=deadline.child(DEADLINE_STAGE_SHARES['importance'])
+            )
+        
+        # 3. 뉴스 요약
+        print("뉴스를 요약 중...")
+        with stage('summarize'):
+            summarized_news = self.summarizer.summarize_news(
+                evaluated_news, reuse_summaries=incremental, deadline=deadline.child(DEADLINE_STAGE_SHARES['summarize'])
+            )
+        
+        # 4. 종합 요약 생성 (증분 모드에서는 상위 뉴스가 바뀐 경우에만)
+        top_urls = [news.get('url', '') for news in summarized_news[:5]]
+        overall_regenerated = not (incremental and state['overall_summary'] and state['top_urls'] == top_urls)
+        overall_degraded = False
+        if overall_regenerated:
+            print("종합 요약을 생성 중...")
+            with stage('overall_summary'):
+                overall_summary, overall_degraded = self.summarizer.generate_overall_summary(summarized_news, deadline)
+        else:
+            print("상위 뉴스가 바뀌지 않아 이전 종합 요약을 재사용합니다.")
+            overall_summary = state['overall_summary']
+        # print(f"DEBUG: 생성된 종합 요약: '{overall_summary}'")
+        
+        # 폴백으로 채운 부분 (기사별 degraded 플래그, 시간 초과로 생략된 단계, LLM 대신 채운 종합 요약)
+        degraded = {}
+        for part in ('impact', 'summary'):
+            count = sum(1 for news in summarized_news if is_degraded(news, part))
+            if count:
+                degraded[part] = count
+        if 'search' in deadline.exceeded_stages:
+            degraded['search'] = True
+        if overall_degraded or 'overall_summary' in deadline.exceeded_stages:
+            degraded['overall_summary'] = True
+        
+        if incremental:
+            # 폴백이나 오류 문구로 채운 종합 요약은 저장하지 않아 다음 실행에서 다시 생성
+            saved_overall = "" if degraded.get('overall_summary') else overall_summary
+            self.state_store.save(company, summarized_news, top_urls, saved_overall)
+        
+        result = {
+            'company': company,
+            'search_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_news': len(news_list),
+            'message': f"'{company}'에 대한 {len(news_list)}개의 뉴스를 분석했습니다.",
+            'news_list': to_result_list(summarized_news),
+            'overall_summary': overall_summary
+        }
+        
+        if stream_stats:
+            result['streaming'] = stream_stats
+        
+        if story_count is not None:
+            result['stories'] = story_count
+        
+        # LLM 서킷 상태 (open/half_open이면 일부 점수와 요약은 로컬 폴백으로 생성됨)
+        result['llm_circuit'] = llm_circuit_state()
+        # 작업별로 현재 선택된 모델 (지연/오류율에 따라 전환될 수 있음)
+        result['llm_routing'] = {task: info['selected'] for task, info in MODEL_ROUTER.snapshot().items()}
+        result['degraded'] = degraded
+        if deadline.budget is not None:
+            result['deadline'] = deadline.to_dict()
+        
+        if incremental:
+            result['incremental'] = {
+                'new_news': new_count,
+                'reused_news': len(news_list) - new_count,
+                'overall_regenerated': overall_regenerated
+            }
+        
+        print("분석이 완료되었습니다!")
+        return result
+    
+    def _stream_candidates(self, company: str, deadline: Optional[Deadline] = None):
+        """
+        뉴스 후보를 스트리밍하며 저비용 점수(신뢰성 + 키워드 중대성) 상위 k개만 유지합니다.
+        
+        Args:
+            company (str): 검색할 회사명
+            deadline (Optional[Deadline]): 검색 단계의 시간 예산
+            
+        Returns:
+            Tuple[List[NewsArticle], Dict]: (선별된 뉴스 리스트, 스트리밍 통계)
+        """
+        top_k = StreamingTopK(self.stream_top_k)
+        top_k.consume(
+            self.news_searcher.iter_news(company, deadline),
+            score_fn=self.importance_evaluator.cheap_score,
+            key_fn=lambda news: news.get('url')
+        )
+        METRICS.inc('stream_candidates_total', top_k.scanned)
+        return top_k.results(), top_k.stats()
+    
+    def _apply_previous_state(self, news_list: List[Dict], state: Dict) -> int:
+        """
+        이전 실행에서 처리한 뉴스에 저장된 중대성 점수와 요약을 채워 넣습니다.
+        
+        Args:
+            news_list (List[Dict]): 이번에 검색된 뉴스 리스트
+            state (Dict): 이전 실행 상태
+            
+        Returns:
+            int: 이전에 처리되지 않은 새 뉴스 개수
+        """
+        new_count = 0
+        
+        for news in news_list:
+            previous = state['articles'].get(news.get('url', ''))
+            if previous is None:
+                new_count += 1
+                continue
+            
+            if previous.get('impact_score') is not None:
+                news['impact_score'] = previous['impact_score']
+            if previous.get('summary'):
+                news['summary'] = previous['summary']
+        
+        return new_count
     
     def display_results(self, result: Dict):
         """
@@ -121,6 +329,20 @@ class StockNewsChatbot:
         print(f"총 뉴스 수: {result['total_news']}개")
         print(f"{result['message']}")
         
+        if result.get('deadline', {}).get('exceeded'):
+            print(f"시간 예산({result['deadline']['budget']}초)을 넘어 일부 단계는 간이 방식으로 처리했습니다: "
+                  f"{', '.join(result['deadline']['exceeded_stages'])}")
+        
+        if result.get('fetch_errors'):
+            print(f"뉴스 소스 {result['fetch_errors']}곳에서 수집에 실패했습니다.")
+
+        circuit = result.get('llm_circuit')
+        if circuit and circuit['state'] != 'closed':
+            tripped = [f"{model}: {info['state']}" for model, info in circuit.get('models', {}).items()
+                       if info['state'] != 'closed']
+            print(f"LLM 모델 장애로 일부 점수와 요약은 다른 후보 모델이나 키워드/기본 방식으로 생성되었습니다 "
+                  f"(서킷: {', '.join(tripped)})")
+        
         if result.get('overall_summary'):
             print("\n종합 요약")
             print("-" * 40)
@@ -148,86 +370,178 @@ class StockNewsChatbot:
                 
                 print("-" * 40)
     
-    # def interactive_mode(self):
-    #     """대화형 모드로 챗봇을 실행합니다."""
-    #     print("\n🎉 주식 뉴스 챗봇 대화형 모드")
-    #     print("=" * 50)
-    #     print("사용법:")
-    #     print("- 회사명을 입력하면 해당 회사의 최근 뉴스를 분석합니다")
-    #     print("- 'quit', 'exit', '종료'를 입력하면 프로그램을 종료합니다")
-    #     print("- 'help'를 입력하면 도움말을 볼 수 있습니다")
-    #     print("=" * 50)
-    #     
-    #     while True:
-    #         try:
-    #             user_input = input("\n🔍 분석할 회사명을 입력하세요: ").strip()
-    #             
-    #             if not user_input:
-    #                 print("❌ 회사명을 입력해주세요.")
-    #                 continue
-    #             
-    #             # 종료 명령어
-    #             if user_input.lower() in ['quit', 'exit', '종료', 'q']:
-    #                 print("👋 주식 뉴스 챗봇을 종료합니다. 감사합니다!")
-    #                 break
-    #             
-    #             # 도움말
-    #             if user_input.lower() in ['help', '도움말', 'h']:
-    #                 self._show_help()
-    #                 continue
-    #             
-    #             # 뉴스 검색 및 분석
-    #             result = self.search_and_summarize(user_input)
-    #             self.display_results(result)
-    #             
-    #         except KeyboardInterrupt:
-    #             print("\n\n👋 사용자가 프로그램을 종료했습니다.")
-    #             break
-    #         except Exception as e:
-    #             print(f"❌ 예상치 못한 오류가 발생했습니다: {e}")
+    def interactive_mode(self):
+        """
+        대화형 모드로 챗봇을 실행합니다.
+        
+        하나의 챗봇 인스턴스를 계속 사용하므로 HTTP 연결, RSS 피드 캐시,
+        결과 캐시, 이미 로드된 라이브러리가 질의 간에 재사용됩니다.
+        같은 회사를 다시 조회하면 증분 분석으로 새 뉴스만 처리합니다.
+        """
+        print("\n주식 뉴스 챗봇 대화형 모드")
+        print("=" * 50)
+        print("사용법:")
+        print("- 회사명을 입력하면 해당 회사의 최근 뉴스를 분석합니다")
+        print("- 'refresh 회사명'을 입력하면 캐시된 결과를 버리고 새 뉴스를 반영하여 다시 캐시합니다")
+        print("- 'quit', 'exit', '종료'를 입력하면 프로그램을 종료합니다")
+        print("- 'help'를 입력하면 도움말을 볼 수 있습니다")
+        print("=" * 50)
+        
+        # 첫 질의를 입력하는 동안 무거운 라이브러리를 미리 로드
+        threading.Thread(target=self._warm_up, daemon=True).start()
+        
+        while True:
+            try:
+                user_input = input("\n분석할 회사명을 입력하세요: ").strip()
+            except (KeyboardInterrupt, EOFError):
+                print("\n\n사용자가 프로그램을 종료했습니다.")
+                break
+            
+            if not user_input:
+                print("회사명을 입력해주세요.")
+                continue
+            
+            # 종료 명령어
+            if user_input.lower() in ['quit', 'exit', '종료', 'q']:
+                print("주식 뉴스 챗봇을 종료합니다. 감사합니다!")
+                break
+            
+            # 도움말
+            if user_input.lower() in ['help', '도움말', 'h']:
+                self._show_help()
+                continue
+            
+            refresh = False
+            company = user_input
+            if user_input.lower().startswith('refresh '):
+                refresh = True
+                company = user_input[len('refresh '):].strip()
+            
+            try:
+                # 뉴스 검색 및 분석
+                started = time.perf_counter()
+                result = self.search_and_summarize(company, incremental=True, refresh=refresh)
+                elapsed = time.perf_counter() - started
+                
+                self.display_results(result)
+                self._show_query_timing(result, elapsed)
+                
+            except KeyboardInterrupt:
+                print("\n분석을 중단했습니다.")
+            except Exception as e:
+                print(f"예상치 못한 오류가 발생했습니다: {e}")
+    
+    def _warm_up(self):
+        """첫 질의 지연을 줄이기 위해 분석에 필요한 라이브러리를 미리 로드합니다."""
+        try:
+            # BatchScorer가 사용하는 라이브러리와 설정된 RSS 파서
+            import numpy  # noqa: F401
+            from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: F401
+            if self.news_searcher.feed_parser == 'lxml':
+                import lxml.etree  # noqa: F401
+            else:
+                import feedparser  # noqa: F401
+            # 중요도 평가와 요약은 각자 LLM 클라이언트를 가지므로 둘 다 미리 생성
+            self.importance_evaluator.llm.client
+            self.summarizer.llm.client
+            self.news_searcher._get_session()
+        except Exception as e:
+            print(f"사전 로드 중 오류: {e}")
+    
+    def _show_query_timing(self, result: Dict, elapsed: float):
+        """질의 처리 시간과 재사용 정보를 표시합니다."""
+        details = []
+        
+        cache = result.get('cache')
+        if cache:
+            details.append(f"캐시: {cache['status']}")
+        
+        incremental = result.get('incremental')
+        if incremental:
+            details.append(f"새 뉴스: {incremental['new_news']}개")
+            details.append(f"재사용: {incremental['reused_news']}개")
+        
+        suffix = f" ({', '.join(details)})" if details else ""
+        print(f"\n처리 시간: {elapsed:.2f}초{suffix}")
+        
+        timings = result.get('timings')
+        if timings and cache and cache['status'] == 'miss':
+            stages = ", ".join(f"{name} {seconds:.2f}초" for name, seconds in timings['stages'].items())
+            print(f"단계별 시간: {stages}")
     
-    # def _show_help(self):
-    #     """도움말을 표시합니다."""
-    #     print("\n📚 주식 뉴스 챗봇 도움말")
-    #     print("-" * 30)
-    #     print("🔍 기능:")
-    #     print("  - 특정 회사의 최근 24시간 뉴스 검색")
-    #     print("  - 뉴스 중요도 평가 (신뢰성, 중대성, 빈도)")
-    #     print("  - AI 기반 뉴스 요약")
-    #     print("  - 중요도 순 정렬")
-    #     print("\n💡 사용 예시:")
-    #     print("  - 삼성전자")
-    #     print("  - SK하이닉스")
-    #     print("  - 네이버")
-    #     print("  - 카카오")
-    #     print("\n⚙️ 중요도 평가 기준:")
-    #     print("  - 신뢰성 (40%): 뉴스 소스의 신뢰도")
-    #     print("  - 중대성 (40%): 주가에 미치는 영향도")
-    #     print("  - 빈도 (20%): 유사 뉴스의 빈도")
+    def _show_help(self):
+        """도움말을 표시합니다."""
+        print("\n주식 뉴스 챗봇 도움말")
+        print("-" * 30)
+        print("기능:")
+        print("  - 특정 회사의 최근 24시간 뉴스 검색")
+        print("  - 뉴스 중요도 평가 (신뢰성, 중대성, 빈도)")
+        print("  - AI 기반 뉴스 요약")
+        print("  - 중요도 순 정렬")
+        print("  - 같은 세션의 재조회는 캐시와 증분 분석으로 새 작업만 수행")
+        print("\n사용 예시:")
+        print("  - 삼성전자")
+        print("  - SK하이닉스")
+        print("  - refresh 네이버")
+        print("  - 카카오")
+        print("\n중요도 평가 기준:")
+        print("  - 신뢰성 (40%): 뉴스 소스의 신뢰도")
+        print("  - 중대성 (40%): 주가에 미치는 영향도")
+        print("  - 빈도 (20%): 유사 뉴스의 빈도")
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="주식 뉴스 검색 및 요약 챗봇")
+    parser.add_argument('company', nargs='?', help="분석할 회사명 (생략 시 config.py의 TARGET_COMPANY)")
+    parser.add_argument('-i', '--interactive', action='store_true', help="대화형 모드로 실행")
+    parser.add_argument('--incremental', action='store_true', help="이전 실행 결과를 재사용하여 새 뉴스만 평가/요약")
+    parser.add_argument('--streaming', action='store_true', help="뉴스 개수 제한 없이 후보를 스트리밍하여 상위 후보만 정밀 평가")
+    parser.add_argument('--deadline', type=float, default=ANALYSIS_DEADLINE, help="회사별 전체 분석 시간 예산 (초)")
+    parser.add_argument('--metrics-dump', help="종료 시 지표를 저장할 파일 (.json 또는 Prometheus 텍스트)")
+    parser.add_argument('--metrics-port', type=int, help="Prometheus 지표를 제공할 HTTP 포트 (/metrics)")
+    parser.add_argument('--log-metrics', action='store_true', help="단계별 계측 정보를 구조화 로그(JSON)로 출력")
+    parser.add_argument('--watchlist', help="관심 종목 파일 (한 줄에 회사명 하나)")
+    parser.add_argument('--output', default='watchlist_results.jsonl', help="일괄 분석 결과 파일 (JSON Lines)")
+    parser.add_argument('--workers', type=int, default=BATCH_MAX_WORKERS, help="일괄 분석 동시 작업자 수")
+    args = parser.parse_args()
+    
+    if args.log_metrics:
+        enable_structured_logging()
+    if args.metrics_port:
+        serve_metrics(args.metrics_port)
+        print(f"지표 제공: http://127.0.0.1:{args.metrics_port}/metrics")
+    
     try:
         # 챗봇 초기화
         chatbot = StockNewsChatbot()
         
+        # 대화형 모드
+        if args.interactive:
+            chatbot.interactive_mode()
+        # 관심 종목 일괄 분석
+        elif args.watchlist:
+            companies = load_watchlist(args.watchlist)
+            run_watchlist(chatbot, companies, args.output, max_workers=args.workers,
+                          incremental=args.incremental, streaming=args.streaming, deadline=args.deadline)
         # 명령행 인수가 있으면 해당 회사 분석
-        if len(sys.argv) > 1:
-            company = sys.argv[1]
-            result = chatbot.search_and_summarize(company)
+        elif args.company:
+            result = chatbot.search_and_summarize(args.company, incremental=args.incremental,
+                                                  streaming=args.streaming, deadline=args.deadline)
             chatbot.display_results(result)
         else:
             # config.py에서 설정된 기업명으로 분석
             print(f"설정된 기업명: {TARGET_COMPANY}")
-            result = chatbot.search_and_summarize(TARGET_COMPANY)
+            result = chatbot.search_and_summarize(TARGET_COMPANY, incremental=args.incremental,
+                                                  streaming=args.streaming, deadline=args.deadline)
             chatbot.display_results(result)
             
-            # 추가 분석을 위한 대화형 모드 실행 (주석처리)
-            # chatbot.interactive_mode()
             
     except Exception as e:
         print(f"프로그램 실행 중 오류가 발생했습니다: {e}")
         sys.exit(1)
+    finally:
+        if args.metrics_dump:
+            METRICS.dump(args.metrics_dump)
 
 if __name__ == "__main__":
     main()
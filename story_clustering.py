@@ -0,0 +1,139 @@
+"""
+같은 사건을 다룬 기사들을 하나의 스토리로 묶는 클러스터링
+
+기사 제목과 설명의 단어 집합으로 MinHash 서명을 만들고, LSH 밴드 버킷으로
+후보 클러스터만 찾은 뒤 대표 기사와의 Jaccard 유사도로 확정합니다.
+기사를 하나씩 추가하는 증분 방식이며, 버킷 조회 덕분에 전체 비용은 기사 수에 거의 선형입니다.
+"""
+
+import re
+import zlib
+from typing import Dict, List, Set
+from company_aliases import company_names
+from config import STORY_SIMILARITY_THRESHOLD, STORY_MINHASH_PERMUTATIONS, STORY_LSH_BANDS
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+# MinHash 순열용 메르센 소수 (2^31 - 1): 계수와 해시의 곱이 int64 범위를 넘지 않음
+_PRIME = (1 << 31) - 1
+
+
+class ClusterState:
+    """클러스터링 한 번의 상태 (LSH 버킷, 클러스터별 대표 단어 집합과 크기)"""
+
+    __slots__ = ('buckets', 'cluster_tokens', 'cluster_sizes')
+
+    def __init__(self):
+        self.buckets = {}
+        self.cluster_tokens = []
+        self.cluster_sizes = []
+
+
+class StoryClusterer:
+    """
+    MinHash/LSH 스토리 클러스터러
+
+    MinHash 계수만 인스턴스에 두고 실행별 상태는 ClusterState로 따로 두므로,
+    여러 스레드(관심 종목 일괄 분석, 캐시 백그라운드 갱신)가 하나의 인스턴스를 함께 써도 안전합니다.
+    """
+
+    def __init__(self, threshold: float = STORY_SIMILARITY_THRESHOLD,
+                 num_perm: int = STORY_MINHASH_PERMUTATIONS, bands: int = STORY_LSH_BANDS,
+                 seed: int = 1):
+        import random
+
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+
+    def _tokens(self, news: Dict, ignore: Set[str]) -> Set[str]:
+        text = f"{news.get('title') or ''} {news.get('description') or ''}".lower()
+        return {
+            token for token in _TOKEN_PATTERN.findall(text)
+            if len(token) > 1 and not token.isdigit() and token not in ignore
+        }
+
+    def _signature(self, tokens: Set[str]):
+        import numpy as np
+
+        hashes = np.fromiter((zlib.crc32(t.encode('utf-8')) & _PRIME for t in tokens),
+                             dtype=np.int64, count=len(tokens))
+        a = np.asarray(self._a, dtype=np.int64)[:, None]
+        b = np.asarray(self._b, dtype=np.int64)[:, None]
+        return ((a * hashes[None, :] + b) % _PRIME).min(axis=1)
+
+    def add(self, state: ClusterState, news: Dict, ignore: Set[str] = frozenset()) -> int:
+        """
+        기사를 추가하고 속한 클러스터 번호를 반환합니다.
+
+        Args:
+            state (ClusterState): 이번 클러스터링의 상태
+            news (Dict): 뉴스 정보
+            ignore (Set[str]): 유사도 계산에서 제외할 단어 (예: 회사명)
+
+        Returns:
+            int: 클러스터 번호
+        """
+        tokens = self._tokens(news, ignore)
+        if not tokens:
+            return self._new_cluster(state, tokens, [])
+
+        signature = self._signature(tokens)
+        band_keys = [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+        # 버킷을 공유하는 클러스터만 후보로 비교
+        candidates = set()
+        for key in band_keys:
+            candidates.update(state.buckets.get(key, ()))
+
+        best_cluster, best_similarity = None, self.threshold
+        for cluster_id in candidates:
+            reference = state.cluster_tokens[cluster_id]
+            similarity = len(tokens & reference) / len(tokens | reference)
+            if similarity >= best_similarity:
+                best_cluster, best_similarity = cluster_id, similarity
+
+        if best_cluster is None:
+            return self._new_cluster(state, tokens, band_keys)
+
+        state.cluster_sizes[best_cluster] += 1
+        return best_cluster
+
+    def _new_cluster(self, state: ClusterState, tokens: Set[str], band_keys: List) -> int:
+        cluster_id = len(state.cluster_tokens)
+        state.cluster_tokens.append(tokens)
+        state.cluster_sizes.append(1)
+        for key in band_keys:
+            state.buckets.setdefault(key, []).append(cluster_id)
+        return cluster_id
+
+    def cluster(self, news_list: List, company: str = '') -> int:
+        """
+        뉴스 리스트 전체를 클러스터링하고 각 뉴스에 cluster_id, cluster_size를 기록합니다.
+
+        Args:
+            news_list (List): 뉴스 리스트 (중복 제거 이후)
+            company (str): 모든 기사에 공통으로 등장하여 유사도에서 제외할 회사명 (별칭도 함께 제외)
+
+        Returns:
+            int: 클러스터(스토리) 개수
+        """
+        state = ClusterState()
+        ignore = {token for name in company_names(company) for token in _TOKEN_PATTERN.findall(name.lower())}
+
+        cluster_ids = [self.add(state, news, ignore) for news in news_list]
+        for news, cluster_id in zip(news_list, cluster_ids):
+            news['cluster_id'] = cluster_id
+            news['cluster_size'] = state.cluster_sizes[cluster_id]
+
+        return len(state.cluster_sizes)
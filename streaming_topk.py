@@ -0,0 +1,73 @@
+import heapq
+import itertools
+from typing import Callable, Dict, Iterable, List
+
+
+class StreamingTopK:
+    """
+    후보 스트림에서 저비용 점수 기준 상위 k개만 유지하는 최소 힙
+
+    메모리는 k에 비례하며, 점수가 같으면 먼저 들어온 후보를 우선합니다.
+    중복 URL은 힙에 남아 있는 항목과만 비교하면 충분합니다. 힙에서 밀려난 항목과
+    같은 점수의 중복은 힙의 최솟값(단조 증가)을 넘을 수 없기 때문입니다.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []
+        self._members = {}
+        self._sequence = itertools.count()
+        self.scanned = 0
+        self.duplicates = 0
+
+    def push(self, score: float, item, key: str = None) -> bool:
+        """
+        후보를 추가합니다.
+
+        Args:
+            score (float): 저비용 점수
+            item: 후보 항목
+            key (str): 중복 판단 키 (보통 URL)
+
+        Returns:
+            bool: 힙에 남았는지 여부
+        """
+        self.scanned += 1
+
+        if key is not None and key in self._members:
+            self.duplicates += 1
+            return False
+
+        # 점수가 같으면 순번이 작은(먼저 들어온) 항목이 더 크게 비교되도록 -순번 사용
+        entry = (score, -next(self._sequence), key, item)
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            evicted = heapq.heapreplace(self._heap, entry)
+            if evicted[2] is not None:
+                self._members.pop(evicted[2], None)
+        else:
+            return False
+
+        if key is not None:
+            self._members[key] = entry
+        return True
+
+    def consume(self, items: Iterable, score_fn: Callable, key_fn: Callable = None) -> 'StreamingTopK':
+        """이터러블 전체를 소비하며 상위 k개를 유지합니다."""
+        for item in items:
+            self.push(score_fn(item), item, key_fn(item) if key_fn else None)
+        return self
+
+    def results(self) -> List:
+        """유지 중인 후보를 점수 내림차순(동점은 먼저 들어온 순)으로 반환합니다."""
+        return [entry[3] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def stats(self) -> Dict:
+        """스트리밍 통계"""
+        return {
+            'candidates_scanned': self.scanned,
+            'duplicates_skipped': self.duplicates,
+            'survivors': len(self._heap)
+        }
@@ -1,21 +1,27 @@
-import openai
-import time
-from typing import List, Dict
-from config import OPENAI_API_KEY, MODEL_NAME, TEMPERATURE
+from typing import List, Dict, Optional, Tuple
+from llm_client import LLMClient, LLMCircuitOpenError
+from deadline import Deadline, DeadlineExceeded, call_timeout
+from news_article import mark_degraded, is_degraded
+from metrics import stage
+from scoring_engine import BatchScorer
+from config import TEMPERATURE
 
 class NewsSummarizer:
     def __init__(self):
-        openai.api_key = OPENAI_API_KEY
-        self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
-        self.model = MODEL_NAME
+        self.llm = LLMClient()
+        self.model = None  # None이면 MODEL_ROUTES에 따라 작업별 모델 사용
         self.temperature = TEMPERATURE
+        self.summary_count = 10  # 요약할 상위 뉴스 개수
     
-    def summarize_news(self, news_list: List[Dict]) -> List[Dict]:
+    def summarize_news(self, news_list: List[Dict], reuse_summaries: bool = False,
+                       deadline: Optional[Deadline] = None) -> List[Dict]:
         """
         뉴스 리스트를 요약합니다.
         
         Args:
             news_list (List[Dict]): 중요도 점수가 포함된 뉴스 리스트
+            reuse_summaries (bool): 이미 요약이 있는 뉴스는 요약 생성을 생략
+            deadline (Optional[Deadline]): 요약 단계의 시간 예산 (넘으면 기본 요약 사용)
             
         Returns:
             List[Dict]: 요약이 추가된 뉴스 리스트
@@ -23,28 +29,61 @@ class NewsSummarizer:
         if not news_list:
             return []
         
-        # 중요도 순으로 정렬
-        sorted_news = sorted(news_list, key=lambda x: x.get('final_score', 0), reverse=True)
-        
-        # 상위 뉴스들에 대해 요약 생성
-        for i, news in enumerate(sorted_news[:10]):  # 상위 10개만 요약
-            try:
-                summary = self._generate_summary(news)
-                news['summary'] = summary
-                news['rank'] = i + 1
-            except Exception as e:
-                print(f"뉴스 요약 중 오류 발생: {e}")
-                news['summary'] = news.get('description', '')[:200] + "..."
-                news['rank'] = i + 1
-        
-        return sorted_news
+        # 상위 10개는 argpartition으로 선택하고, 나머지는 중요도 순으로 뒤에 배치
+        scores = [news.get('final_score', 0) for news in news_list]
+        top_indices, rest_indices = BatchScorer.rank_order(scores, self.summary_count)
+        top_news = [news_list[i] for i in top_indices]
+        
+        # 상위 뉴스들에 대해 요약 생성 (같은 스토리 클러스터는 한 번만 요약)
+        story_summaries = {}
+        # 남은 LLM 호출 수 (단계 시간 예산을 남은 호출끼리 나누어 씀)
+        reused = [reuse_summaries and bool(news.get('summary')) for news in top_news]
+        reused_clusters = {news.get('cluster_id') for i, news in enumerate(top_news) if reused[i]}
+        pending = len({news.get('cluster_id') if news.get('cluster_id') is not None else ('news', i)
+                       for i, news in enumerate(top_news) if not reused[i]} - reused_clusters)
+        
+        for i, news in enumerate(top_news):
+            news['rank'] = i + 1
+            cluster_id = news.get('cluster_id')
+            if reuse_summaries and news.get('summary'):
+                if cluster_id is not None:
+                    story_summaries.setdefault(cluster_id, news)
+                continue
+            
+            if cluster_id is not None and cluster_id in story_summaries:
+                summarized = story_summaries[cluster_id]
+                news['summary'] = summarized['summary']
+                if is_degraded(summarized, 'summary'):
+                    mark_degraded(news, 'summary')
+                continue
+            
+            if deadline is not None and not deadline.check('summary'):
+                # 시간 예산을 모두 쓰면 남은 뉴스는 기본 요약으로 대체
+                news['summary'] = self._fallback_summary(news)
+                mark_degraded(news, 'summary')
+            else:
+                try:
+                    with stage('summary_llm'):
+                        news['summary'] = self._generate_summary(news, deadline, pending)
+                except Exception as e:
+                    print(f"뉴스 요약 중 오류 발생: {e}")
+                    news['summary'] = news.get('description', '')[:200] + "..."
+                    mark_degraded(news, 'summary')
+            pending -= 1
+            
+            if cluster_id is not None:
+                story_summaries[cluster_id] = news
+        
+        return top_news + [news_list[i] for i in rest_indices]
     
-    def _generate_summary(self, news: Dict) -> str:
+    def _generate_summary(self, news: Dict, deadline: Optional[Deadline] = None, pending: int = 1) -> str:
         """
         개별 뉴스를 요약합니다.
         
         Args:
             news (Dict): 뉴스 정보
+            deadline (Optional[Deadline]): 남은 시간 예산 (LLM 호출 타임아웃으로 사용)
+            pending (int): 이 호출을 포함해 단계에 남은 LLM 호출 수 (남은 시간을 나누어 받음)
             
         Returns:
             str: 요약된 내용
@@ -72,24 +111,28 @@ class NewsSummarizer:
 """
         
         try:
-            # Rate limit 방지를 위한 지연
-            time.sleep(1)
-            
-            response = self.client.chat.completions.create(
+            summary = self.llm.complete(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 주식 투자 분석 전문가입니다. 뉴스를 투자자 관점에서 간결하고 명확하게 한국어로 요약합니다."},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=300
+                max_completion_tokens=300,
+                task='summary',
+                timeout=call_timeout(deadline, pending)
             )
             
-            summary = response.choices[0].message.content.strip()
             return summary
             
+        except DeadlineExceeded:
+            if deadline is not None:
+                deadline.mark('summary')
+            mark_degraded(news, 'summary')
+            return self._fallback_summary(news)
         except Exception as e:
             print(f"OpenAI API 호출 중 오류: {e}")
             # API 오류 시 간단한 요약 생성
+            mark_degraded(news, 'summary')
             return self._fallback_summary(news)
     
     def _fallback_summary(self, news: Dict) -> str:
@@ -104,18 +147,21 @@ class NewsSummarizer:
         
         return summary
     
-    def generate_overall_summary(self, news_list: List[Dict]) -> str:
+    def generate_overall_summary(self, news_list: List[Dict],
+                                 deadline: Optional[Deadline] = None) -> Tuple[str, bool]:
         """
         전체 뉴스에 대한 종합 요약을 생성합니다.
         
         Args:
             news_list (List[Dict]): 요약된 뉴스 리스트
+            deadline (Optional[Deadline]): 남은 시간 예산 (넘으면 상위 뉴스 목록으로 대체)
             
         Returns:
-            str: 종합 요약
+            Tuple[str, bool]: 종합 요약과, LLM 대신 폴백이나 오류 문구로 채웠는지 여부
+                (True면 호출자는 캐시하거나 증분 상태에 저장하지 않음)
         """
         if not news_list:
-            return "해당 회사에 대한 최근 뉴스가 없습니다."
+            return "해당 회사에 대한 최근 뉴스가 없습니다.", False
         
         # 상위 5개 뉴스의 요약을 종합
         top_news = news_list[:5]
@@ -131,10 +177,13 @@ class NewsSummarizer:
                     summaries.append(f"제목: {title}\n내용: {description}")
         
         if not summaries:
-            return "분석할 수 있는 뉴스 내용이 없습니다."
+            return "분석할 수 있는 뉴스 내용이 없습니다.", False
         
         # print(f"DEBUG: 종합 요약을 위한 {len(summaries)}개의 요약/뉴스 발견")
         
+        if deadline is not None and not deadline.check('overall_summary'):
+            return self._fallback_overall_summary(news_list), True
+        
         combined_text = "\n\n".join([f"{i+1}. {summary}" for i, summary in enumerate(summaries)])
         
         prompt = f"""
@@ -152,33 +201,37 @@ class NewsSummarizer:
 """
         
         try:
-            # Rate limit 방지를 위한 지연
-            time.sleep(1)
-            
             # print("DEBUG: 종합 요약 API 호출 시작")
-            response = self.client.chat.completions.create(
+            result = self.llm.complete(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 주식 투자 분석 전문가입니다. 여러 뉴스를 종합하여 투자자에게 유용한 인사이트를 한국어로 제공합니다."},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=500
+                max_completion_tokens=500,
+                task='overall',
+                timeout=call_timeout(deadline)
             )
-            
-            result = response.choices[0].message.content.strip()
             # print(f"DEBUG: 종합 요약 생성 완료: '{result}'")
             # print(f"DEBUG: 종합 요약 길이: {len(result)}")
             
             # 빈 응답인 경우 폴백 사용
             if not result or len(result.strip()) == 0:
                 # print("DEBUG: 빈 응답으로 인해 폴백 요약 사용")
-                return self._fallback_overall_summary(news_list)
+                return self._fallback_overall_summary(news_list), True
             
-            return result
+            return result, False
             
+        except DeadlineExceeded:
+            if deadline is not None:
+                deadline.mark('overall_summary')
+            return self._fallback_overall_summary(news_list), True
+        except LLMCircuitOpenError:
+            # LLM 장애 중에는 상위 뉴스 목록으로 대체
+            return self._fallback_overall_summary(news_list), True
         except Exception as e:
             print(f"종합 요약 생성 중 오류: {e}")
-            return "종합 요약을 생성할 수 없습니다."
+            return "종합 요약을 생성할 수 없습니다.", True
     
     def _fallback_overall_summary(self, news_list: List[Dict]) -> str:
         """API 오류 시 사용할 간단한 종합 요약"""
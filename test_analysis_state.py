@@ -0,0 +1,150 @@
+"""
+증분 분석 상태 저장과 재사용 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from analysis_state import AnalysisStateStore
+from stock_news_chatbot import StockNewsChatbot
+from summarizer import NewsSummarizer
+
+
+def _news(count: int):
+    return [{'title': f"뉴스 {i}", 'description': f"설명 {i}", 'url': f"https://example.com/{i}",
+             'source': 'Reuters', 'company': '테스트'} for i in range(count)]
+
+
+def test_store_creates_directory_on_first_save(tmp_path):
+    state_dir = str(tmp_path / 'state')
+    store = AnalysisStateStore(state_dir)
+    assert not os.path.exists(state_dir)
+    assert store.load('테스트') == {'articles': {}, 'top_urls': [], 'overall_summary': ""}
+
+    news_list = _news(2)
+    news_list[0].update(impact_score=0.8, summary="요약 0")
+    news_list[1].update(impact_score=0.3, summary="기본 요약", degraded=['summary'])
+    store.save('테스트', news_list, ['https://example.com/0'], "종합")
+
+    state = store.load('테스트')
+    assert state['overall_summary'] == "종합"
+    assert state['top_urls'] == ['https://example.com/0']
+    assert state['articles']['https://example.com/0']['summary'] == "요약 0"
+    # 폴백으로 채운 요약은 저장하지 않음
+    assert state['articles']['https://example.com/1']['impact_score'] == 0.3
+    assert state['articles']['https://example.com/1']['summary'] is None
+
+
+def test_corrupt_state_file_loads_empty(tmp_path):
+    store = AnalysisStateStore(str(tmp_path))
+    with open(store._path('테스트'), 'w', encoding='utf-8') as f:
+        f.write("{broken")
+
+    assert store.load('테스트')['articles'] == {}
+
+
+class _FakeSearcher:
+    def __init__(self, news_list):
+        self.news_list = news_list
+
+    def search_news(self, company, deadline=None):
+        return [dict(news) for news in self.news_list]
+
+
+class _FakeEvaluator:
+    def evaluate_news_importance(self, news_list, reuse_scores=False, deadline=None):
+        for i, news in enumerate(news_list):
+            news['final_score'] = 1.0 - i * 0.01
+        return news_list
+
+
+class _FakeLLM:
+    """작업별로 응답하거나 실패하는 LLM 대역"""
+
+    def __init__(self, overall_error=None):
+        self.overall_error = overall_error
+        self.overall_calls = 0
+
+    def complete(self, model, messages, max_completion_tokens, task='default', timeout=None):
+        if task == 'overall':
+            self.overall_calls += 1
+            if self.overall_error is not None:
+                raise self.overall_error
+            return "LLM 종합 요약"
+        return "LLM 요약"
+
+
+def _chatbot(tmp_path, llm):
+    chatbot = StockNewsChatbot.__new__(StockNewsChatbot)
+    chatbot.news_searcher = _FakeSearcher(_news(6))
+    chatbot.importance_evaluator = _FakeEvaluator()
+    chatbot.summarizer = NewsSummarizer()
+    chatbot.summarizer.llm = llm
+    chatbot.result_cache = None
+    chatbot.state_store = AnalysisStateStore(str(tmp_path))
+    chatbot.stream_top_k = 10
+    chatbot.story_clusterer = None
+    return chatbot
+
+
+def test_overall_summary_reused_when_top_news_unchanged(tmp_path):
+    llm = _FakeLLM()
+    chatbot = _chatbot(tmp_path, llm)
+
+    first = chatbot._run_pipeline('테스트', incremental=True)
+    second = chatbot._run_pipeline('테스트', incremental=True)
+
+    assert first['overall_summary'] == second['overall_summary'] == "LLM 종합 요약"
+    assert not second['incremental']['overall_regenerated']
+    assert second['incremental']['new_news'] == 0
+    assert llm.overall_calls == 1
+
+
+def test_failed_overall_summary_is_not_persisted(tmp_path):
+    llm = _FakeLLM(overall_error=ValueError("boom"))
+    chatbot = _chatbot(tmp_path, llm)
+
+    first = chatbot._run_pipeline('테스트', incremental=True)
+    assert first['degraded'] == {'overall_summary': True}
+    assert chatbot.state_store.load('테스트')['overall_summary'] == ""
+
+    # 상위 뉴스가 같아도 오류 문구를 재사용하지 않고 다시 생성
+    llm.overall_error = None
+    second = chatbot._run_pipeline('테스트', incremental=True)
+    assert second['incremental']['overall_regenerated']
+    assert second['overall_summary'] == "LLM 종합 요약"
+    assert 'overall_summary' not in second['degraded']
+    assert llm.overall_calls == 2
+
+
+def test_circuit_open_fallback_is_marked_degraded(tmp_path):
+    from llm_client import LLMCircuitOpenError
+
+    llm = _FakeLLM(overall_error=LLMCircuitOpenError("open"))
+    chatbot = _chatbot(tmp_path, llm)
+
+    result = chatbot._run_pipeline('테스트', incremental=True)
+    assert result['overall_summary'].startswith("주요 뉴스 요약")
+    assert result['degraded'] == {'overall_summary': True}
+    assert chatbot.state_store.load('테스트')['overall_summary'] == ""
+
+
+def test_refresh_replaces_cached_result(tmp_path):
+    from result_cache import MemoryLRUBackend, ResultCache
+
+    llm = _FakeLLM()
+    chatbot = _chatbot(tmp_path, llm)
+    chatbot.result_cache = ResultCache(backend=MemoryLRUBackend())
+
+    assert chatbot.search_and_summarize('테스트', deadline=None)['cache']['status'] == 'miss'
+    assert chatbot.search_and_summarize('테스트', deadline=None)['cache']['status'] == 'hit'
+
+    # refresh는 캐시를 건너뛰는 대신 항목을 지우고 다시 계산한 결과를 저장
+    chatbot.news_searcher.news_list = _news(7)
+    refreshed = chatbot.search_and_summarize('테스트', deadline=None, refresh=True)
+    assert (refreshed['cache']['status'], refreshed['total_news']) == ('miss', 7)
+
+    cached = chatbot.search_and_summarize('테스트', deadline=None)
+    assert (cached['cache']['status'], cached['total_news']) == ('hit', 7)
@@ -0,0 +1,103 @@
+"""
+기사 본문 디스크 캐시 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import random
+import string
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import body_cache
+from body_cache import BodyCache, canonical_url
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        # 호출마다 시간을 조금씩 진행하여 사용 순서가 같은 시각으로 겹치지 않게 함
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(body_cache.time, 'time', fake.time)
+    return fake
+
+
+def _text(seed: int, length: int = 4000) -> str:
+    """압축이 잘 되지 않는 본문"""
+    rng = random.Random(seed)
+    return ''.join(rng.choice(string.ascii_letters + ' ') for _ in range(length))
+
+
+def _blob_files(cache: BodyCache):
+    root = os.path.join(cache.cache_dir, 'blobs')
+    return [name for _, _, names in os.walk(root) for name in names]
+
+
+def _blob_path(cache: BodyCache, url: str) -> str:
+    digest = cache._conn.execute("SELECT digest FROM urls WHERE url = ?", (canonical_url(url),)).fetchone()[0]
+    return cache._blob_path(digest)
+
+
+def test_canonical_url():
+    assert canonical_url(" HTTPS://News.Example.COM:443/a/b/?utm_source=x&b=2&a=1&fbclid=y#top ") == \
+        "https://news.example.com/a/b?a=1&b=2"
+    assert canonical_url("http://example.com:8080/") == "http://example.com:8080/"
+    assert canonical_url("https://example.com") == canonical_url("https://example.com/")
+    # 추적용이 아닌 빈 값 쿼리는 유지
+    assert canonical_url("https://example.com/a?id=&ref=rss") == "https://example.com/a?id="
+
+
+def test_same_body_is_stored_once_across_urls(tmp_path, clock):
+    cache = BodyCache(str(tmp_path))
+    body = _text(1)
+
+    cache.put("https://wire.example.com/story?utm_medium=rss", body)
+    cache.put("https://partner.example.com/reprint/story", body)
+
+    assert len(_blob_files(cache)) == 1
+    assert cache.get("https://wire.example.com/story") == body
+    assert cache.get("https://partner.example.com/reprint/story/") == body
+    assert cache.get("https://wire.example.com/other") is None
+
+
+def test_least_recently_used_bodies_are_evicted(tmp_path, clock):
+    cache = BodyCache(str(tmp_path), max_bytes=7000)
+
+    cache.put("https://example.com/1", _text(1))
+    cache.put("https://example.com/2", _text(2))
+    assert cache.get("https://example.com/1") == _text(1)  # 1을 최근 사용으로 갱신
+
+    cache.put("https://example.com/3", _text(3))
+
+    assert cache.get("https://example.com/2") is None
+    assert cache.get("https://example.com/1") == _text(1)
+    assert cache.get("https://example.com/3") == _text(3)
+    assert len(_blob_files(cache)) == 2
+
+
+def test_corrupt_or_missing_blob_is_dropped(tmp_path, clock):
+    cache = BodyCache(str(tmp_path))
+    cache.put("https://example.com/corrupt", _text(1))
+    cache.put("https://example.com/missing", _text(2))
+
+    with open(_blob_path(cache, "https://example.com/corrupt"), 'wb') as f:
+        f.write(b"not zlib data")
+    os.remove(_blob_path(cache, "https://example.com/missing"))
+
+    assert cache.get("https://example.com/corrupt") is None
+    assert cache.get("https://example.com/missing") is None
+    assert cache._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0] == 0
+
+    # 색인에서 지운 뒤에는 다시 저장하여 읽을 수 있음
+    cache.put("https://example.com/corrupt", _text(1))
+    assert cache.get("https://example.com/corrupt") == _text(1)
@@ -0,0 +1,53 @@
+"""
+기업 별칭 매칭 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from company_aliases import CompanyAliasIndex, alias_matcher, company_names, newsapi_query
+
+
+def test_korean_alias_rejects_longer_words():
+    """짧은 한글 별칭이 다른 단어의 앞부분일 때는 일치하지 않습니다."""
+    assert not alias_matcher('Intel').matches("인텔리전스 기반 분석 서비스 출시")
+    assert not alias_matcher('Apple').matches("모바일 애플리케이션 시장 전망")
+    assert not alias_matcher('Meta').matches("메타버스 플랫폼 투자 확대")
+    assert not alias_matcher('Nvidia').matches("슈퍼엔비디아")
+
+
+def test_korean_alias_accepts_particles_and_punctuation():
+    """한글 별칭 뒤에 조사나 한글이 아닌 글자가 오면 일치합니다."""
+    assert alias_matcher('Intel').matches("인텔의 신규 파운드리 전략")
+    assert alias_matcher('Apple').matches("애플, 아이폰 신제품 공개")
+    assert alias_matcher('Meta').matches("메타가 새 AI 모델 발표")
+    assert alias_matcher('Nvidia').matches("엔비디아에서도 공급 부족 우려")
+    assert alias_matcher('Nvidia').matches("美엔비디아 주가 급등")
+    assert alias_matcher('Nvidia').matches("4분기 실적 발표", "엔비디아")
+
+
+def test_ascii_alias_requires_word_boundary():
+    """영문/숫자 별칭은 단어 경계에서만 일치합니다."""
+    assert not alias_matcher('AMD').matches("Amdahl's law revisited")
+    assert alias_matcher('AMD').matches("AMD 실적 발표")
+    assert alias_matcher('Nvidia').matches("NVDA jumps 5%")
+    assert alias_matcher('Nvidia').matches("NVIDIA Corporation reports earnings")
+    assert not alias_matcher('Nvidia').matches("xnvidia corp")
+
+
+def test_alias_group_lookup_and_query():
+    """어떤 별칭으로 찾아도 같은 묶음을 쓰며, 입력한 이름이 맨 앞에 옵니다."""
+    assert company_names('엔비디아')[0] == '엔비디아'
+    assert set(company_names('엔비디아')) == set(company_names('NVDA'))
+    assert company_names('Unknown Co') == ['Unknown Co']
+    assert newsapi_query('Unknown Co') == '"Unknown Co"'
+    assert newsapi_query('Nvidia').startswith('"Nvidia" OR "엔비디아"')
+
+
+def test_newsapi_query_respects_max_length():
+    index = CompanyAliasIndex({'Acme': ['Acme Corporation', 'ACME Holdings', 'Acme Intl']})
+    query = index.newsapi_query('Acme', max_length=30)
+    assert len(query) <= 30
+    assert query.startswith('"Acme"')
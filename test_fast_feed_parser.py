@@ -0,0 +1,90 @@
+"""
+lxml 스트리밍 피드 파서와 feedparser 경로의 결과 일치 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import fast_feed_parser
+from fast_feed_parser import parse_feed, parse_feeds
+from news_search import NewsSearcher
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'fixtures')
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Tech Wire</title>
+  <link href="https://example.com/"/>
+  <updated>2024-05-23T07:00:00Z</updated>
+  <entry>
+    <title>Nvidia unveils new inference chip</title>
+    <link rel="related" href="https://example.com/related"/>
+    <link rel="alternate" href="https://example.com/nvidia-chip"/>
+    <id>urn:1</id>
+    <published>2024-05-23T06:00:00Z</published>
+    <updated>2024-05-23T06:30:00Z</updated>
+    <summary>Nvidia said the chip doubles throughput.</summary>
+    <content type="html">&lt;p&gt;Full story about Nvidia.&lt;/p&gt;</content>
+  </entry>
+  <entry>
+    <title>Weather update</title>
+    <link href="https://example.com/weather"/>
+    <id>urn:2</id>
+    <updated>2024-05-23T05:00:00Z</updated>
+    <summary>Sunny skies.</summary>
+  </entry>
+  <entry>
+    <title>엔비디아, 신규 칩 공개</title>
+    <link href="https://example.com/kr"/>
+    <id>urn:3</id>
+    <updated>2024-05-23T04:00:00Z</updated>
+    <summary>엔비디아가 새 칩을 공개했다.</summary>
+  </entry>
+</feed>
+""".encode('utf-8')
+
+
+def _rss_fixture() -> bytes:
+    with open(os.path.join(FIXTURE_DIR, 'rss_business.xml'), 'rb') as f:
+        return f.read()
+
+
+def _feedparser_result(data: bytes, company: str):
+    """feedparser 경로의 결과를 parse_feed와 같은 형식으로 변환"""
+    articles = [article.to_dict() for article in NewsSearcher()._parse_with_feedparser(data, company)]
+    title = articles[0]['source'] if articles else 'RSS Feed'
+    entries = [{field: article[field] for field in ('title', 'description', 'content', 'url', 'published_at')}
+               for article in articles]
+    return {'title': title, 'entries': entries}
+
+
+def test_rss_fixture_matches_feedparser():
+    data = _rss_fixture()
+    result = parse_feed(data, 'Nvidia')
+
+    assert result == _feedparser_result(data, 'Nvidia')
+    assert result['title'] == 'Reuters Business News'
+    assert len(result['entries']) == 3
+
+
+def test_atom_feed_matches_feedparser():
+    result = parse_feed(ATOM_FEED, 'Nvidia')
+
+    assert result == _feedparser_result(ATOM_FEED, 'Nvidia')
+    assert [entry['url'] for entry in result['entries']] == ['https://example.com/nvidia-chip',
+                                                             'https://example.com/kr']
+    # 게시 시각이 없는 항목은 수정 시각 사용
+    assert result['entries'][1]['published_at'] == '2024-05-23T04:00:00Z'
+
+
+def test_process_pool_matches_in_process_parsing():
+    payloads = [_rss_fixture(), ATOM_FEED] * (fast_feed_parser.FEED_PARSER_POOL_MIN_FEEDS // 2)
+    assert fast_feed_parser.should_use_pool(payloads, max_workers=2)
+
+    pooled = parse_feeds(payloads, 'Nvidia', max_workers=2)
+
+    assert pooled == [(parse_feed(data, 'Nvidia'), None) for data in payloads]
+    # 현재 프로세스로 대체하지 않고 작업자 프로세스에서 파싱
+    assert fast_feed_parser._pool.submit(os.getpid).result(timeout=30) != os.getpid()
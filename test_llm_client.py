@@ -0,0 +1,350 @@
+"""
+LLM 서킷 브레이커 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import llm_client
+from deadline import DeadlineExceeded
+from llm_client import CircuitBreaker, LLMClient
+
+
+class _FakeClock:
+    """time.monotonic 대역 (테스트에서 직접 시간을 진행)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(llm_client.time, 'monotonic', fake.monotonic)
+    return fake
+
+
+def _open_breaker(breaker: CircuitBreaker):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, half_open_calls=1)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()  # 성공하면 연속 실패 수 초기화
+    assert breaker.snapshot()['state'] == 'closed'
+
+    _open_breaker(breaker)
+    snapshot = breaker.snapshot()
+    assert snapshot['state'] == 'open'
+    assert snapshot['trips'] == 1
+    assert not breaker.allow()
+    assert breaker.snapshot()['rejected_calls'] == 1
+
+
+def test_breaker_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, half_open_calls=1)
+    _open_breaker(breaker)
+
+    clock.advance(29)
+    assert not breaker.allow()
+
+    clock.advance(1)
+    assert breaker.allow()  # 확인 호출 하나만 허용
+    assert breaker.snapshot()['state'] == 'half_open'
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.snapshot()['state'] == 'closed'
+    assert breaker.allow()
+
+
+def test_breaker_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, half_open_calls=1)
+    _open_breaker(breaker)
+
+    clock.advance(30)
+    assert breaker.allow()
+    breaker.record_failure()
+
+    snapshot = breaker.snapshot()
+    assert snapshot['state'] == 'open'
+    assert snapshot['trips'] == 2
+    assert snapshot['retry_in'] == 30.0
+    assert not breaker.allow()
+
+
+def test_breaker_release_returns_probe_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, half_open_calls=1)
+    _open_breaker(breaker)
+
+    clock.advance(30)
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.release()
+    assert breaker.snapshot()['state'] == 'half_open'
+    assert breaker.allow()
+
+
+class _TimeoutCompletions:
+    """요청 타임아웃만큼 기다린 뒤 실패하는 채팅 완성 API 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, timeout=None, **kwargs):
+        import time
+
+        self.calls += 1
+        time.sleep(timeout or 0)
+        raise TimeoutError("stub timeout")
+
+
+class _StubOpenAI:
+    def __init__(self):
+        self.completions = _TimeoutCompletions()
+        self.chat = self
+
+
+def test_complete_releases_probe_on_deadline(monkeypatch):
+    """half-open 확인 호출이 시간 예산 부족으로 끝나면 실패로 세지 않고 자리를 반납합니다."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, half_open_calls=1)
+    breaker.record_failure()
+    assert breaker.snapshot()['state'] == 'open'
+    monkeypatch.setattr(llm_client, '_llm_breakers', {'stub-model': breaker})
+
+    client = LLMClient()
+    client._client = _StubOpenAI()
+
+    with pytest.raises(DeadlineExceeded):
+        client.complete('stub-model', [{'role': 'user', 'content': 'hi'}], 10, task='test', timeout=0.05)
+
+    snapshot = breaker.snapshot()
+    assert snapshot['state'] == 'half_open'
+    assert snapshot['trips'] == 1
+    assert breaker.allow()
+
+
+def test_complete_skips_call_when_circuit_open(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, half_open_calls=1)
+    breaker.record_failure()
+    monkeypatch.setattr(llm_client, '_llm_breakers', {'stub-model': breaker})
+
+    client = LLMClient()
+    client._client = _StubOpenAI()
+
+    with pytest.raises(llm_client.LLMCircuitOpenError):
+        client.complete('stub-model', [{'role': 'user', 'content': 'hi'}], 10, task='test')
+    assert client._client.completions.calls == 0
+
+
+def _status_error(cls, status: int):
+    """openai 상태 코드 오류 대역 (HTTP 응답 객체 없이 생성)"""
+    error = cls.__new__(cls)
+    Exception.__init__(error, f"stub error {status}")
+    error.status_code = status
+    return error
+
+
+class _FailingCompletions:
+    def __init__(self, error: Exception):
+        self.error = error
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+def _client_raising(error: Exception) -> LLMClient:
+    client = LLMClient()
+    stub = _StubOpenAI()
+    stub.completions = _FailingCompletions(error)
+    client._client = stub
+    return client
+
+
+def test_bad_requests_do_not_open_circuit(monkeypatch):
+    """잘못된 요청(400)은 서킷 실패로 세지 않습니다."""
+    import openai
+
+    monkeypatch.setattr(llm_client, 'LLM_REQUEST_DELAY', 0)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60, half_open_calls=1)
+    monkeypatch.setattr(llm_client, '_llm_breakers', {'stub-model': breaker})
+    client = _client_raising(_status_error(openai.BadRequestError, 400))
+
+    for _ in range(5):
+        with pytest.raises(openai.BadRequestError):
+            client.complete('stub-model', [{'role': 'user', 'content': 'hi'}], 10, task='test')
+
+    assert breaker.snapshot()['state'] == 'closed'
+    assert breaker.snapshot()['consecutive_failures'] == 0
+
+
+def test_server_errors_open_circuit(monkeypatch):
+    import openai
+
+    monkeypatch.setattr(llm_client, 'LLM_REQUEST_DELAY', 0)
+    monkeypatch.setattr(llm_client, 'LLM_MAX_RETRIES', 0)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60, half_open_calls=1)
+    monkeypatch.setattr(llm_client, '_llm_breakers', {'stub-model': breaker})
+    client = _client_raising(_status_error(openai.InternalServerError, 500))
+
+    for _ in range(2):
+        with pytest.raises(openai.InternalServerError):
+            client.complete('stub-model', [{'role': 'user', 'content': 'hi'}], 10, task='test')
+
+    assert breaker.snapshot()['state'] == 'open'
+
+
+class _RoutedCompletions:
+    """지정한 모델만 서버 오류(500)로 실패하는 채팅 완성 API 대역"""
+
+    def __init__(self, failing_models):
+        import threading
+        from collections import Counter
+
+        self.failing_models = set(failing_models)
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def create(self, model=None, **kwargs):
+        import openai
+        from types import SimpleNamespace
+
+        with self._lock:
+            self.calls[model] += 1
+        if model in self.failing_models:
+            raise _status_error(openai.InternalServerError, 500)
+        message = SimpleNamespace(content=f"{model} ok")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def test_failing_model_trips_only_its_own_circuit(monkeypatch):
+    """한 모델의 장애는 그 모델의 서킷만 열고, 라우터는 다음 후보로, 다른 작업은 그대로 호출합니다."""
+    import openai
+    from concurrent.futures import ThreadPoolExecutor
+    from model_router import ModelRouter
+
+    monkeypatch.setattr(llm_client, 'LLM_REQUEST_DELAY', 0)
+    monkeypatch.setattr(llm_client, 'LLM_MAX_RETRIES', 0)
+    # 라우터의 오류율 제외는 끄고 서킷 브레이커만으로 장애 모델을 건너뛰는지 확인
+    router = ModelRouter(routes={'impact': ['gpt-5-nano', 'gpt-5-mini'], 'summary': ['gpt-5']},
+                         latency_targets={}, max_error_rate=1.0)
+    monkeypatch.setattr(llm_client, 'MODEL_ROUTER', router)
+    breakers = {model: CircuitBreaker(failure_threshold=2, reset_timeout=60, half_open_calls=1)
+                for model in ('gpt-5-nano', 'gpt-5-mini', 'gpt-5')}
+    monkeypatch.setattr(llm_client, '_llm_breakers', breakers)
+
+    client = LLMClient()
+    stub = _StubOpenAI()
+    stub.completions = _RoutedCompletions(failing_models={'gpt-5-nano'})
+    client._client = stub
+
+    def call(task):
+        try:
+            return client.complete(None, [{'role': 'user', 'content': 'hi'}], 10, task=task)
+        except openai.InternalServerError:
+            return 'failed'
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(call, ['impact', 'summary'] * 20))
+
+    impact_results, summary_results = results[0::2], results[1::2]
+    assert summary_results == ['gpt-5 ok'] * 20
+    # 장애 모델로 간 호출만 실패하고, 서킷이 열린 뒤에는 다음 후보 모델이 응답
+    assert impact_results.count('failed') == stub.completions.calls['gpt-5-nano']
+    assert impact_results[-1] == 'gpt-5-mini ok'
+
+    state = llm_client.llm_circuit_state()
+    assert state['state'] == 'open'
+    assert state['models']['gpt-5-nano']['state'] == 'open'
+    assert state['models']['gpt-5-mini']['state'] == 'closed'
+    assert state['models']['gpt-5']['state'] == 'closed'
+
+    # 열린 서킷의 모델은 더 호출하지 않음
+    nano_calls = stub.completions.calls['gpt-5-nano']
+    assert call('impact') == 'gpt-5-mini ok'
+    assert stub.completions.calls['gpt-5-nano'] == nano_calls
+
+
+def test_all_candidates_open_raises_circuit_open(monkeypatch):
+    from model_router import ModelRouter
+
+    router = ModelRouter(routes={'impact': ['gpt-5-nano', 'gpt-5-mini']}, latency_targets={})
+    monkeypatch.setattr(llm_client, 'MODEL_ROUTER', router)
+    breakers = {}
+    for model in ('gpt-5-nano', 'gpt-5-mini'):
+        breakers[model] = CircuitBreaker(failure_threshold=1, reset_timeout=60, half_open_calls=1)
+        breakers[model].record_failure()
+    monkeypatch.setattr(llm_client, '_llm_breakers', breakers)
+
+    client = LLMClient()
+    client._client = _StubOpenAI()
+
+    with pytest.raises(llm_client.LLMCircuitOpenError):
+        client.complete(None, [{'role': 'user', 'content': 'hi'}], 10, task='impact')
+    assert client._client.completions.calls == 0
+
+
+class _SlowStartClient(LLMClient):
+    """openai 로드가 오래 걸리는 첫 호출 대역"""
+
+    def __init__(self, load_seconds: float):
+        super().__init__()
+        self.load_seconds = load_seconds
+        self.timeouts = []
+
+    @property
+    def client(self):
+        import time
+        from types import SimpleNamespace
+
+        if self._client is None:
+            time.sleep(self.load_seconds)
+            stub = _StubOpenAI()
+            stub.completions = SimpleNamespace(create=self._create)
+            self._client = stub
+        return self._client
+
+    def _create(self, timeout=None, **kwargs):
+        from types import SimpleNamespace
+
+        self.timeouts.append(timeout)
+        message = SimpleNamespace(content='ok')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def test_request_timeout_excludes_client_load_time(monkeypatch):
+    """요청 타임아웃은 클라이언트 준비가 끝난 뒤의 남은 시간으로 계산합니다."""
+    monkeypatch.setattr(llm_client, 'LLM_REQUEST_DELAY', 0)
+    monkeypatch.setattr(llm_client, '_llm_breakers', {'stub-model': CircuitBreaker()})
+    client = _SlowStartClient(load_seconds=0.2)
+
+    assert client.complete('stub-model', [{'role': 'user', 'content': 'hi'}], 10, task='test', timeout=1.0) == 'ok'
+    assert client.timeouts[0] <= 0.8
+
+
+def test_call_timeout_splits_budget_across_pending_calls():
+    from deadline import Deadline, call_timeout
+
+    deadline = Deadline(budget=10)
+    assert call_timeout(None) is None
+    assert call_timeout(Deadline()) is None
+    assert 4.9 < call_timeout(deadline, pending=2) <= 5.0
+    assert call_timeout(deadline, pending=0) == pytest.approx(deadline.remaining(), abs=0.01)
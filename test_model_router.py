@@ -0,0 +1,105 @@
+"""
+작업별 모델 라우팅 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import model_router
+from model_router import ModelRouter
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(model_router.time, 'monotonic', fake.monotonic)
+    return fake
+
+
+def _router(**options):
+    settings = {
+        'routes': {'impact': ['fast', 'backup'], 'single': ['only']},
+        'latency_targets': {'impact': 1.0, 'single': 1.0},
+        'alpha': 0.5,
+        'max_error_rate': 0.5,
+        'cooldown': 60,
+        'default_model': 'default'
+    }
+    settings.update(options)
+    return ModelRouter(**settings)
+
+
+def test_select_prefers_first_candidate(clock):
+    router = _router()
+    assert router.select('impact') == 'fast'
+    assert router.select('unknown') == 'default'
+
+
+def test_slow_model_is_demoted_then_restored_after_cooldown(clock):
+    router = _router()
+
+    router.record('impact', 'fast', 0.5, ok=True)
+    assert router.select('impact') == 'fast'
+
+    # EWMA: 0.5 * 3.0 + 0.5 * 0.5 = 1.75 > 목표 1.0
+    router.record('impact', 'fast', 3.0, ok=True)
+    assert router.select('impact') == 'backup'
+    assert router.snapshot()['impact']['models']['fast']['demoted']
+
+    clock.now += 59
+    assert router.select('impact') == 'backup'
+
+    clock.now += 1
+    assert router.select('impact') == 'fast'
+    # 제외가 풀리면 이전 통계는 초기화
+    stats = router.snapshot()['impact']['models']['fast']
+    assert stats == {'latency': None, 'error_rate': 0.0, 'samples': 0, 'demoted': False}
+
+
+def test_error_rate_demotes_model(clock):
+    router = _router()
+
+    router.record('impact', 'fast', 0.1, ok=False)  # 오류율 0.5 (한도와 같으면 유지)
+    assert router.select('impact') == 'fast'
+
+    router.record('impact', 'fast', 0.1, ok=False)  # 오류율 0.75
+    assert router.select('impact') == 'backup'
+
+
+def test_single_candidate_is_never_demoted(clock):
+    router = _router()
+
+    for _ in range(5):
+        router.record('single', 'only', 10.0, ok=False)
+    assert router.select('single') == 'only'
+    assert not router.snapshot()['single']['models']['only']['demoted']
+
+
+def test_all_demoted_picks_earliest_release(clock):
+    router = _router()
+
+    router.record('impact', 'fast', 5.0, ok=True)
+    clock.now += 10
+    router.record('impact', 'backup', 5.0, ok=True)
+
+    assert router.select('impact') == 'fast'
+
+
+def test_ranked_puts_selected_model_first(clock):
+    router = _router()
+    assert router.ranked('impact') == ['fast', 'backup']
+
+    router.record('impact', 'fast', 5.0, ok=True)
+    assert router.ranked('impact') == ['backup', 'fast']
@@ -0,0 +1,173 @@
+"""
+분석 결과 캐시 테스트 (메모리 백엔드, 네트워크 없이 실행)
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import result_cache
+from result_cache import MemoryLRUBackend, ResultCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(result_cache.time, 'time', fake.time)
+    return fake
+
+
+class _Counter:
+    """호출 횟수를 결과에 담아 반환하는 계산 함수 대역"""
+
+    def __init__(self, total_news: int = 3):
+        self.calls = 0
+        self.total_news = total_news
+
+    def __call__(self):
+        self.calls += 1
+        return {'total_news': self.total_news, 'run': self.calls}
+
+
+def _cache(**options):
+    return ResultCache(backend=MemoryLRUBackend(max_entries=8), ttl=60, stale_ttl=60, **options)
+
+
+def test_miss_then_hit(clock):
+    cache = _cache()
+    compute = _Counter()
+
+    assert cache.get_or_compute('key', compute) == ({'total_news': 3, 'run': 1}, 'miss', 0.0)
+
+    clock.now += 30
+    value, status, age = cache.get_or_compute('key', compute)
+    assert (value['run'], status, age) == (1, 'hit', 30)
+    assert compute.calls == 1
+
+    # 반환값을 고쳐도 캐시된 결과는 바뀌지 않음
+    value['run'] = 99
+    assert cache.get_or_compute('key', compute)[0]['run'] == 1
+
+
+def test_stale_returns_old_value_and_refreshes(clock):
+    cache = _cache()
+    compute = _Counter()
+    cache.get_or_compute('key', compute)
+
+    clock.now += 90
+    value, status, _ = cache.get_or_compute('key', compute)
+    assert (value['run'], status) == (1, 'stale')
+    assert cache.wait_for_refreshes(timeout=5)
+    assert compute.calls == 2
+
+    value, status, _ = cache.get_or_compute('key', compute)
+    assert (value['run'], status) == (2, 'hit')
+
+
+def test_expired_entry_is_recomputed(clock):
+    cache = _cache()
+    compute = _Counter()
+    cache.get_or_compute('key', compute)
+
+    clock.now += 121
+    value, status, _ = cache.get_or_compute('key', compute)
+    assert (value['run'], status) == (2, 'miss')
+
+
+def test_non_cacheable_result_is_not_stored(clock):
+    cache = _cache()
+    compute = _Counter(total_news=0)
+    cacheable = lambda value: value['total_news'] > 0
+
+    assert cache.get_or_compute('key', compute, cacheable)[1] == 'miss'
+    assert cache.get_or_compute('key', compute, cacheable)[1] == 'miss'
+    assert compute.calls == 2
+
+
+def test_invalidate_forces_recompute(clock):
+    cache = _cache()
+    compute = _Counter()
+    cache.get_or_compute('key', compute)
+
+    cache.invalidate('key')
+    assert cache.get_or_compute('key', compute)[0]['run'] == 2
+
+
+def test_concurrent_misses_compute_once():
+    cache = _cache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'total_news': 3}
+
+    results = []
+
+    def request():
+        results.append(cache.get_or_compute('key', compute))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(value == {'total_news': 3} for value, _, _ in results)
+    # 기다린 요청도 각자 사본을 받음
+    assert len({id(value) for value, _, _ in results}) == 4
+
+
+def test_concurrent_waiters_receive_compute_error():
+    cache = _cache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    errors = []
+
+    def request():
+        try:
+            cache.get_or_compute('key', compute)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ['boom'] * 3
+    # 실패한 계산은 남지 않아 다음 요청에서 다시 계산
+    assert cache.get_or_compute('key', lambda: {'total_news': 1})[1] == 'miss'
@@ -0,0 +1,42 @@
+"""
+벡터화 배치 점수 계산 테스트
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scoring_engine import BatchScorer
+
+
+def _stable_top_k(scores, k):
+    return sorted(range(len(scores)), key=lambda index: -scores[index])[:k]
+
+
+def test_top_k_indices_breaks_ties_by_original_order():
+    scores = [0.5, 0.9, 0.5, 0.5, 0.1, 0.9]
+    assert list(BatchScorer.top_k_indices(scores, 3)) == [1, 5, 0]
+    assert list(BatchScorer.top_k_indices(scores, 4)) == [1, 5, 0, 2]
+
+
+def test_top_k_indices_edge_cases():
+    assert list(BatchScorer.top_k_indices([], 3)) == []
+    assert list(BatchScorer.top_k_indices([0.3, 0.7], 0)) == []
+    assert list(BatchScorer.top_k_indices([0.3, 0.7, 0.3], 10)) == [1, 0, 2]
+
+
+def test_top_k_indices_matches_stable_sort():
+    rng = random.Random(5)
+    for _ in range(50):
+        scores = [round(rng.random(), 1) for _ in range(rng.randrange(1, 80))]
+        k = rng.randrange(1, len(scores) + 1)
+        assert list(BatchScorer.top_k_indices(scores, k)) == _stable_top_k(scores, k)
+
+
+def test_rank_order_covers_all_indices():
+    scores = [0.2, 0.8, 0.2, 0.6, 0.8]
+    top, rest = BatchScorer.rank_order(scores, 2)
+    assert list(top) == [1, 4]
+    assert list(rest) == [3, 0, 2]
@@ -0,0 +1,75 @@
+"""
+스토리 클러스터링 테스트 (네트워크 없이 실행)
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from story_clustering import StoryClusterer
+
+EVENTS = [
+    "reports record quarterly revenue driven by data center demand",
+    "announces new partnership with automaker for self driving chips",
+    "faces export restrictions on advanced processors to china",
+    "unveils next generation gpu architecture at developer conference",
+    "shares fall after antitrust investigation opened by regulators",
+]
+
+
+def _make_news(company: str, copies: int):
+    news_list = []
+    for index, event in enumerate(EVENTS):
+        for copy in range(copies):
+            news_list.append({
+                'title': f"{company} {event}",
+                'description': f"{event} according to source {copy}",
+                'expected_story': index
+            })
+    return news_list
+
+
+def _assignments(news_list):
+    return [(news['cluster_id'], news['cluster_size']) for news in news_list]
+
+
+def test_cluster_groups_same_story():
+    """같은 사건의 기사는 같은 클러스터로 묶입니다."""
+    clusterer = StoryClusterer()
+    news_list = _make_news('Nvidia', copies=3)
+
+    assert clusterer.cluster(news_list, 'Nvidia') == len(EVENTS)
+    for news in news_list:
+        assert news['cluster_size'] == 3
+    story_of_cluster = {}
+    for news in news_list:
+        assert story_of_cluster.setdefault(news['cluster_id'], news['expected_story']) == news['expected_story']
+
+
+def test_cluster_concurrent_calls_share_instance():
+    """여러 스레드가 하나의 클러스터러를 함께 써도 결과가 순차 실행과 같습니다."""
+    clusterer = StoryClusterer()
+    companies = [f"Company{index}" for index in range(8)]
+    copies = {company: 1 + index % 4 for index, company in enumerate(companies)}
+
+    expected = {}
+    for company in companies:
+        news_list = _make_news(company, copies[company])
+        clusterer.cluster(news_list, company)
+        expected[company] = _assignments(news_list)
+
+    def run(company):
+        results = []
+        for _ in range(25):
+            news_list = _make_news(company, copies[company])
+            count = clusterer.cluster(news_list, company)
+            results.append((count, _assignments(news_list)))
+        return company, results
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for company, results in pool.map(run, companies * 2):
+            for count, assignments in results:
+                assert count == len(EVENTS)
+                assert assignments == expected[company]
@@ -0,0 +1,49 @@
+"""
+스트리밍 상위 k개 선택 테스트
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from streaming_topk import StreamingTopK
+
+
+def test_results_are_sorted_with_ties_in_arrival_order():
+    top_k = StreamingTopK(3)
+    for name, score in [('a', 0.5), ('b', 0.9), ('c', 0.5), ('d', 0.1), ('e', 0.5)]:
+        top_k.push(score, name, key=name)
+
+    # 동점(0.5)은 먼저 들어온 a, c가 남고 e는 밀려남
+    assert top_k.results() == ['b', 'a', 'c']
+    assert top_k.stats() == {'candidates_scanned': 5, 'duplicates_skipped': 0, 'survivors': 3}
+
+
+def test_duplicate_keys_are_skipped():
+    top_k = StreamingTopK(2)
+    assert top_k.push(0.4, 'first', key='url-1')
+    assert not top_k.push(0.9, 'duplicate', key='url-1')
+    assert top_k.push(0.7, 'second', key='url-2')
+
+    assert top_k.results() == ['second', 'first']
+    assert top_k.duplicates == 1
+
+
+def test_evicted_key_can_return():
+    top_k = StreamingTopK(1)
+    top_k.push(0.2, 'old', key='url-1')
+    top_k.push(0.8, 'better', key='url-2')
+    # 밀려난 키는 중복 목록에서도 빠짐
+    assert top_k.push(0.9, 'returned', key='url-1')
+    assert top_k.results() == ['returned']
+
+
+def test_matches_full_stable_sort():
+    rng = random.Random(3)
+    items = [(round(rng.random(), 1), f"url-{index}") for index in range(500)]
+
+    top_k = StreamingTopK(20).consume(items, score_fn=lambda item: item[0], key_fn=lambda item: item[1])
+
+    assert top_k.results() == sorted(items, key=lambda item: -item[0])[:20]
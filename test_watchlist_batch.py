@@ -0,0 +1,42 @@
+"""
+관심 종목 일괄 분석 테스트 (네트워크 없이 실행)
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchlist_batch import is_failed_result, run_watchlist
+
+
+class _FakeChatbot:
+    """회사별로 미리 정한 결과를 반환하는 챗봇 대역"""
+
+    RESULTS = {
+        'ok': {'total_news': 3, 'message': "3개의 뉴스를 분석했습니다."},
+        'empty': {'total_news': 0, 'message': "뉴스를 찾을 수 없습니다."},
+        'outage': {'total_news': 0, 'message': "뉴스를 찾을 수 없습니다.", 'fetch_errors': 8},
+        'error': {'total_news': 0, 'message': "오류가 발생했습니다: boom", 'error': "boom"},
+    }
+
+    def search_and_summarize(self, company, **options):
+        return dict(self.RESULTS[company], company=company, news_list=[], overall_summary="")
+
+
+def test_is_failed_result():
+    assert not is_failed_result(_FakeChatbot.RESULTS['ok'])
+    assert not is_failed_result(_FakeChatbot.RESULTS['empty'])
+    assert is_failed_result(_FakeChatbot.RESULTS['outage'])
+    assert is_failed_result(_FakeChatbot.RESULTS['error'])
+
+
+def test_run_watchlist_counts_failures(tmp_path):
+    output_path = str(tmp_path / 'results.jsonl')
+    stats = run_watchlist(_FakeChatbot(), ['ok', 'empty', 'outage', 'error'], output_path, max_workers=2)
+
+    assert stats['succeeded'] == 2
+    assert stats['failed'] == 2
+    with open(output_path, encoding='utf-8') as f:
+        assert sorted(json.loads(line)['company'] for line in f) == ['empty', 'error', 'ok', 'outage']
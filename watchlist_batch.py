@@ -0,0 +1,112 @@
+"""
+관심 종목 일괄 분석
+
+회사 목록 파일을 읽어 하나의 챗봇 인스턴스로 모든 회사를 분석하고,
+결과를 하나의 JSON Lines 파일로 저장합니다.
+
+RSS 피드 다운로드와 결과 캐시는 모든 회사가 공유하며,
+회사별 중요도 평가와 요약은 스레드 풀에서 병렬로 실행됩니다.
+LLM 동시 호출 수는 LLM_MAX_CONCURRENCY로 전체 한도가 제한됩니다.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional
+from config import BATCH_MAX_WORKERS
+
+
+def load_watchlist(path: str) -> List[str]:
+    """
+    관심 종목 파일을 읽습니다.
+
+    한 줄에 회사명 하나를 적으며, 빈 줄과 '#'으로 시작하는 줄은 무시합니다.
+
+    Args:
+        path (str): 관심 종목 파일 경로
+
+    Returns:
+        List[str]: 중복이 제거된 회사명 리스트 (파일 순서 유지)
+    """
+    companies = []
+    seen = set()
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            company = line.strip()
+            if not company or company.startswith('#'):
+                continue
+            if company.lower() not in seen:
+                seen.add(company.lower())
+                companies.append(company)
+
+    return companies
+
+
+def is_failed_result(result: Dict) -> bool:
+    """
+    분석 결과가 실패인지 판단합니다.
+
+    분석 중 예외가 났거나('error'), 모든 뉴스 소스 수집이 실패하여 뉴스가 없는 경우를 실패로 봅니다.
+    수집 오류 없이 뉴스가 없는 경우는 성공입니다.
+    """
+    return bool(result.get('error')) or (result.get('total_news', 0) == 0 and bool(result.get('fetch_errors')))
+
+
+def run_watchlist(chatbot, companies: List[str], output_path: str,
+                  max_workers: int = BATCH_MAX_WORKERS, incremental: bool = False,
+                  streaming: bool = False, deadline: Optional[float] = None) -> Dict:
+    """
+    여러 회사를 병렬로 분석하여 JSON Lines 파일로 저장합니다.
+
+    Args:
+        chatbot (StockNewsChatbot): 모든 회사가 공유할 챗봇 인스턴스
+        companies (List[str]): 분석할 회사명 리스트
+        output_path (str): 결과를 저장할 JSON Lines 파일 경로
+        max_workers (int): 동시에 분석할 회사 수
+        incremental (bool): 회사별 이전 실행 결과를 재사용하여 새 뉴스만 평가/요약
+        streaming (bool): 후보를 스트리밍하며 저비용 점수 상위 k개만 정밀 평가
+        deadline (Optional[float]): 회사별 전체 분석 시간 예산 (초)
+
+    Returns:
+        Dict: 일괄 분석 통계
+    """
+    started = time.time()
+    succeeded = 0
+    failed = 0
+
+    print(f"{len(companies)}개 회사를 {max_workers}개 작업자로 분석합니다...")
+
+    with open(output_path, 'w', encoding='utf-8') as output, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(chatbot.search_and_summarize, company,
+                            incremental=incremental, streaming=streaming, deadline=deadline): company
+            for company in companies
+        }
+
+        # 결과 파일은 메인 스레드에서만 기록
+        for future in as_completed(futures):
+            company = futures[future]
+            # search_and_summarize는 예외를 오류 결과로 바꿔 반환하므로 결과 내용으로 실패를 판단
+            result = future.result()
+            if is_failed_result(result):
+                print(f"'{company}' 분석 실패: {result['message']}")
+                failed += 1
+            else:
+                succeeded += 1
+
+            output.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+            output.flush()
+
+    elapsed = time.time() - started
+    print(f"일괄 분석 완료: {succeeded}개 성공, {failed}개 실패 ({elapsed:.1f}초)")
+    print(f"결과 파일: {output_path}")
+
+    return {
+        'total': len(companies),
+        'succeeded': succeeded,
+        'failed': failed,
+        'elapsed_seconds': round(elapsed, 2),
+        'output_path': output_path
+    }